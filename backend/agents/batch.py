@@ -0,0 +1,175 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .orchestrator import StageError, run_full_pipeline
+from .rfp_header import parse_due_date, read_header_fields
+
+if TYPE_CHECKING:
+    from .technical_agent import TechnicalAgent
+
+
+# -------- process-pool worker side --------
+
+# (sku.csv, pricing.csv, catalogue.snap, volume_tiers.csv) of the parent's CatalogueStore
+CataloguePaths = Tuple[str, str, str, str]
+
+_worker_agent: Optional["TechnicalAgent"] = None
+_worker_version = ""
+
+
+def _init_worker(paths: Optional[CataloguePaths] = None) -> None:
+    # one catalogue load per worker process, not per RFP, from the same
+    # files as the parent
+    global _worker_agent, _worker_version
+    from .technical_agent import TechnicalAgent
+
+    if paths is None:
+        _worker_agent = TechnicalAgent()
+        return
+    from .catalogue import CatalogueStore
+
+    catalogue = CatalogueStore(*(Path(path) for path in paths)).reload()
+    _worker_agent = TechnicalAgent(catalogue)
+    _worker_version = catalogue.version
+
+
+def _match_in_worker(rfp_file: str, catalogue_version: str = "") -> Dict[str, Any]:
+    # workers stream the file themselves; only the path is pickled
+    assert _worker_agent is not None, "worker not initialised"
+    if catalogue_version and catalogue_version != _worker_version:
+        # the files changed between the parent's load and this worker's
+        raise RuntimeError(
+            f"batch worker has catalogue {_worker_version or '?'}, expected {catalogue_version}"
+        )
+    return _worker_agent.match_specs_file(rfp_file)
+
+
+# -------- parent side --------
+
+def _header_due_date(rfp_file: str) -> Optional[str]:
+    with open(rfp_file, "r", encoding="utf-8") as f:
+        return read_header_fields(f).get("due_date")
+
+
+class BatchRunner:
+    """
+    Runs the full pipeline over many RFPs at once:
+    - technical matching on a persistent process pool (CPU-bound); the
+      pool is rebuilt when the catalogue version changes, so workers
+      match against the same SKUs the parent prices
+    - Groq summaries bounded by an asyncio semaphore
+    - at most max_in_flight RFPs open at a time
+    Results are yielded as each RFP finishes, then one ranking event
+    ordered by due date (earliest first, unparseable dates last).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        llm_concurrency: int = 4,
+        max_in_flight: int = 16,
+    ) -> None:
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.llm_concurrency = llm_concurrency
+        self.max_in_flight = max_in_flight
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_version: Optional[str] = None
+
+    def _executor(
+        self, catalogue_version: str = "", catalogue_paths: Optional[CataloguePaths] = None
+    ) -> ProcessPoolExecutor:
+        if self._pool is not None and self._pool_version != catalogue_version:
+            # let a running batch finish on the old workers, then they exit
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker, initargs=(catalogue_paths,)
+            )
+            self._pool_version = catalogue_version
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _match(
+        self, rfp_file: str, catalogue_version: str = "", catalogue_paths: Optional[CataloguePaths] = None
+    ) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        executor = self._executor(catalogue_version, catalogue_paths)
+        return await loop.run_in_executor(executor, _match_in_worker, rfp_file, catalogue_version)
+
+    async def run(
+        self,
+        rfp_files: List[str],
+        sales_agent: Any,
+        pricing_agent: Any,
+        judge_agent: Any,
+        catalogue_version: str = "",
+        catalogue_paths: Optional[CataloguePaths] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        catalogue_version / catalogue_paths: the catalogue pricing_agent was
+        built from; workers load the same files and check the version.
+        """
+        llm_semaphore = asyncio.Semaphore(self.llm_concurrency)
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        async def one(rfp_file: str) -> Dict[str, Any]:
+            async with in_flight:
+                try:
+                    result = await run_full_pipeline(
+                        rfp_file,
+                        sales_agent=sales_agent,
+                        technical_agent=None,
+                        pricing_agent=pricing_agent,
+                        judge_agent=judge_agent,
+                        match_runner=lambda path: self._match(path, catalogue_version, catalogue_paths),
+                        llm_semaphore=llm_semaphore,
+                    )
+                    # header date first (no LLM), then whatever the LLM extracted
+                    raw_due = await asyncio.to_thread(_header_due_date, rfp_file)
+                    due = parse_due_date(raw_due) or parse_due_date(result["sales_summary"]["due_date"])
+                    result["due_date_parsed"] = due.isoformat() if due else None
+                except StageError as e:
+                    return {"event": "error", "rfp_file": rfp_file, "stage": e.stage, "detail": str(e)}
+                except Exception as e:
+                    # e.g. the file was removed mid-batch: fail this RFP, not the stream
+                    return {"event": "error", "rfp_file": rfp_file, "stage": "BatchRunner", "detail": repr(e)}
+                return {"event": "result", **result}
+
+        tasks = [asyncio.ensure_future(one(rfp_file)) for rfp_file in rfp_files]
+        finished: List[Dict[str, Any]] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                event = await next_done
+                finished.append(event)
+                yield event
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        ranked = sorted(
+            (e for e in finished if e["event"] == "result"),
+            key=lambda e: (e["due_date_parsed"] is None, e["due_date_parsed"] or ""),
+        )
+        yield {
+            "event": "ranking",
+            "rfps": [
+                {
+                    "rank": rank,
+                    "rfp_file": e["rfp_file"],
+                    "rfp_id": e["sales_summary"]["rfp_id"],
+                    "due_date": e["due_date_parsed"],
+                    "grand_total": e["pricing"]["grand_total"],
+                }
+                for rank, e in enumerate(ranked, start=1)
+            ],
+            "errors": sum(1 for e in finished if e["event"] == "error"),
+        }
@@ -0,0 +1,195 @@
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .tracing import traced
+
+if TYPE_CHECKING:
+    from .columnar import ColumnarCatalogue
+    from .pricing_agent import PriceTable, PricingRow
+    from .retrieval import SKURetriever
+    from .sku_index import SKUIndex
+    from .technical_agent import SKU
+
+
+def _project_root() -> Path:
+    # backend/agents/catalogue.py -> backend/agents -> backend -> project root
+    backend_dir = Path(__file__).resolve().parent.parent  # /backend
+    return backend_dir.parent  # /hackathon-rfp
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Cheap change detector: (mtime_ns, size), or None if the file is missing.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _file_hash(path: Path) -> str:
+    if not path.is_file():
+        return ""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class Catalogue:
+    """
+    Immutable snapshot of sku.csv + pricing.csv (+ volume_tiers.csv).
+    A request holds on to one Catalogue, so a reload never changes data under it.
+    """
+
+    skus: List["SKU"]
+    index: "SKUIndex"
+    pricing: Dict[str, "PricingRow"]
+    prices: "PriceTable"
+    columns: "ColumnarCatalogue"
+    retriever: "SKURetriever"
+    version: str
+    loaded_at: float
+    load_seconds: float
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "sku_rows": len(self.skus),
+            "pricing_rows": len(self.pricing),
+            "volume_tiers": len(self.prices.tier_min),
+            "columnar_bytes_per_sku": round(self.columns.bytes_per_sku(), 1),
+            "retrieval": self.retriever.stats(),
+            "loaded_at": self.loaded_at,
+            "load_seconds": self.load_seconds,
+        }
+
+
+class CatalogueStore:
+    """
+    Process-wide catalogue cache:
+    - Loads sku.csv and pricing.csv once (from the binary snapshot when
+      it is fresh, see agents.snapshot)
+    - On get(), stats both files and reloads when mtime/size changed
+      and the content hash differs
+    - Swaps in the new Catalogue in one assignment (atomic for readers)
+    - loaded: whether a first load has finished (main loads in the
+      background at startup)
+    """
+
+    def __init__(
+        self,
+        sku_path: Optional[Path] = None,
+        pricing_path: Optional[Path] = None,
+        snapshot_path: Optional[Path] = None,
+        tiers_path: Optional[Path] = None,
+    ) -> None:
+        root = _project_root()
+        self.sku_path = sku_path or root / "data" / "sku" / "sku.csv"
+        self.pricing_path = pricing_path or root / "data" / "pricing" / "pricing.csv"
+        self.snapshot_path = snapshot_path or root / "data" / "catalogue.snap"
+        self.tiers_path = tiers_path or root / "data" / "pricing" / "volume_tiers.csv"
+        self.source = ""
+
+        self._lock = threading.Lock()
+        self._catalogue: Optional[Catalogue] = None
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self.reloads = 0
+
+    def _current_signature(self) -> Tuple[Any, ...]:
+        return (
+            _file_signature(self.sku_path),
+            _file_signature(self.pricing_path),
+            _file_signature(self.tiers_path),
+        )
+
+    def _content_version(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(_file_hash(self.sku_path).encode())
+        digest.update(_file_hash(self.pricing_path).encode())
+        digest.update(_file_hash(self.tiers_path).encode())
+        return digest.hexdigest()[:16]
+
+    @traced("catalogue.load")
+    def _load(self, version: str) -> Catalogue:
+        # imported here, not at module level: importing main (and so
+        # answering /health) does not wait for NumPy and the agent modules
+        from .columnar import ColumnarCatalogue
+        from .pricing_agent import PriceTable, load_pricing, load_volume_tiers
+        from .retrieval import SKURetriever
+        from .sku_index import SKUIndex
+        from .snapshot import open_fresh_snapshot
+        from .technical_agent import load_skus
+
+        started = time.perf_counter()
+        snapshot = open_fresh_snapshot(self.sku_path, self.pricing_path, self.snapshot_path)
+        if snapshot is not None:
+            skus = snapshot.skus()
+            pricing = snapshot.pricing()
+            self.source = "snapshot"
+        else:
+            # no snapshot, or built from older CSVs
+            skus = load_skus(self.sku_path)
+            pricing = load_pricing(self.pricing_path)
+            self.source = "csv"
+        index = SKUIndex(skus)
+        return Catalogue(
+            skus=skus,
+            index=index,
+            pricing=pricing,
+            prices=PriceTable(pricing, load_volume_tiers(self.tiers_path)),
+            columns=ColumnarCatalogue(skus, pricing),
+            retriever=SKURetriever(skus),
+            version=version,
+            loaded_at=time.time(),
+            load_seconds=time.perf_counter() - started,
+        )
+
+    def reload(self, force: bool = False) -> Catalogue:
+        """
+        Reload if the files changed (or always, with force=True).
+        """
+        with self._lock:
+            signature = self._current_signature()
+            if not force and self._catalogue is not None and signature == self._signature:
+                return self._catalogue
+
+            version = self._content_version()
+            if not force and self._catalogue is not None and version == self._catalogue.version:
+                # touched but unchanged: keep the loaded data
+                self._signature = signature
+                return self._catalogue
+
+            catalogue = self._load(version)
+            self._catalogue = catalogue
+            self._signature = signature
+            self.reloads += 1
+            return catalogue
+
+    def paths(self) -> Tuple[str, str, str, str]:
+        # picklable description of this store, for worker processes
+        return (str(self.sku_path), str(self.pricing_path), str(self.snapshot_path), str(self.tiers_path))
+
+    @property
+    def loaded(self) -> bool:
+        return self._catalogue is not None
+
+    def get(self) -> Catalogue:
+        catalogue = self._catalogue
+        if catalogue is None or self._current_signature() != self._signature:
+            return self.reload()
+        return catalogue
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.get().stats()
+        stats["reloads"] = self.reloads
+        stats["source"] = self.source
+        return stats
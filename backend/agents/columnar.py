@@ -0,0 +1,199 @@
+import heapq
+import math
+import sys
+from array import array
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .sku_index import ATTRIBUTE_WEIGHTS
+from .spec_parser import SKU_FIELD_PARSERS, parse_spec, spec_value
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _code_typecode(n_values: int) -> str:
+    # smallest unsigned array type that can hold every dictionary code
+    if n_values <= 0xFF:
+        return "B"
+    if n_values <= 0xFFFF:
+        return "H"
+    return "I"
+
+
+def _to_float(value: str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class DictColumn:
+    """
+    Dictionary-encoded string column:
+    - values: each distinct string once
+    - codes: one small unsigned int per row (array buffer)
+    """
+
+    def __init__(self, raw: Sequence[str]) -> None:
+        lookup: Dict[str, int] = {}
+        values: List[str] = []
+        codes: List[int] = []
+        for value in raw:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(values)
+                values.append(value)
+            codes.append(code)
+
+        self.values = values
+        self.codes = array(_code_typecode(len(values)), codes)
+        # numeric view of each distinct value (NaN when not a number)
+        self.numeric = array("d", (_to_float(v) for v in values))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, position: int) -> str:
+        return self.values[self.codes[position]]
+
+    def nbytes(self) -> int:
+        return (
+            self.codes.itemsize * len(self.codes)
+            + self.numeric.itemsize * len(self.numeric)
+            + sum(sys.getsizeof(v) for v in self.values)
+        )
+
+
+class ColumnarCatalogue:
+    """
+    Compact, column-oriented copy of the SKU + pricing tables:
+    - cores / area_sqmm / insulation / material / voltage / currency are
+      dictionary-encoded DictColumns
+    - base_material_cost / testing_cost are float64 array buffers aligned
+      with SKU positions (NaN where the SKU has no pricing row)
+    - score_all() scores every SKU against a scope line in one pass
+      (NumPy gather when available, pure-Python column zip otherwise)
+    """
+
+    CATEGORICAL = ("cores", "area_sqmm", "insulation", "material", "voltage")
+
+    def __init__(self, skus: Sequence[Any], pricing: Optional[Mapping[str, Any]] = None) -> None:
+        pricing = pricing or {}
+        self.size = len(skus)
+        self.sku_ids: List[str] = [sku.sku_id for sku in skus]
+        self.columns: Dict[str, DictColumn] = {
+            name: DictColumn([getattr(sku, name) for sku in skus])
+            for name in self.CATEGORICAL
+        }
+
+        base_cost = array("d")
+        testing_cost = array("d")
+        currencies: List[str] = []
+        for sku_id in self.sku_ids:
+            row = pricing.get(sku_id)
+            base_cost.append(row.base_material_cost if row else math.nan)
+            testing_cost.append(row.testing_cost if row else math.nan)
+            currencies.append(row.currency if row else "")
+        self.base_material_cost = base_cost
+        self.testing_cost = testing_cost
+        self.currency = DictColumn(currencies)
+
+        # parsed (comparable) form of each distinct categorical value
+        self._parsed_values: Dict[str, List[Any]] = {
+            attr: [SKU_FIELD_PARSERS[attr](value) for value in self.columns[attr].values]
+            for attr in ATTRIBUTE_WEIGHTS
+        }
+
+        self._np_codes: Dict[str, Any] = {}
+        if NUMPY_AVAILABLE:
+            # zero-copy views over the array buffers
+            self._np_codes = {
+                name: np.frombuffer(col.codes, dtype=col.codes.typecode)
+                for name, col in self.columns.items()
+            }
+
+    # -------- row access --------
+
+    def row(self, position: int) -> Dict[str, Any]:
+        return {
+            "sku_id": self.sku_ids[position],
+            "cores": self.columns["cores"][position],
+            "area_sqmm": self.columns["area_sqmm"][position],
+            "insulation": self.columns["insulation"][position],
+            "material": self.columns["material"][position],
+            "voltage": self.columns["voltage"][position],
+        }
+
+    # -------- scoring --------
+
+    def _lookup_tables(self, spec_line: str) -> Dict[str, List[int]]:
+        """
+        Per attribute: points for each distinct value, same rule as
+        TechnicalAgent._score_match. Work is O(distinct values), not O(SKUs).
+        """
+        spec = parse_spec(spec_line)
+        tables: Dict[str, List[int]] = {}
+        for attr, weight in ATTRIBUTE_WEIGHTS.items():
+            wanted = spec_value(spec, attr)
+            tables[attr] = [
+                weight if wanted is not None and parsed == wanted else 0
+                for parsed in self._parsed_values[attr]
+            ]
+        return tables
+
+    def score_all(self, spec_line: str) -> Sequence[int]:
+        """
+        Score every SKU against one scope line; result[i] is SKU i's score.
+        """
+        tables = self._lookup_tables(spec_line)
+
+        if NUMPY_AVAILABLE:
+            total = np.zeros(self.size, dtype=np.int32)
+            for attr, table in tables.items():
+                total += np.asarray(table, dtype=np.int32)[self._np_codes[attr]]
+            return total
+
+        columns = [
+            map(table.__getitem__, self.columns[attr].codes)
+            for attr, table in tables.items()
+        ]
+        return [sum(points) for points in zip(*columns)]
+
+    def top_matches(self, spec_line: str, n: int = 3) -> List[Tuple[int, int]]:
+        """
+        Up to n (sku position, score) pairs with score > 0, best first.
+        Ties keep catalogue order.
+        """
+        scores = self.score_all(spec_line)
+
+        if NUMPY_AVAILABLE:
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > n:
+                # unique key: higher score first, then lower position
+                key = scores[candidates].astype(np.int64) * (self.size + 1) - candidates
+                keep = np.argpartition(-key, n - 1)[:n]
+                candidates = candidates[keep]
+            ordered = sorted(candidates.tolist(), key=lambda p: (-int(scores[p]), p))
+            return [(p, int(scores[p])) for p in ordered]
+
+        return heapq.nlargest(
+            n,
+            ((p, s) for p, s in enumerate(scores) if s > 0),
+            key=lambda kv: (kv[1], -kv[0]),
+        )
+
+    # -------- memory --------
+
+    def memory_bytes(self) -> int:
+        total = sum(col.nbytes() for col in self.columns.values())
+        total += self.currency.nbytes()
+        total += self.base_material_cost.itemsize * len(self.base_material_cost)
+        total += self.testing_cost.itemsize * len(self.testing_cost)
+        total += sys.getsizeof(self.sku_ids) + sum(sys.getsizeof(s) for s in self.sku_ids)
+        return total
+
+    def bytes_per_sku(self) -> float:
+        return self.memory_bytes() / self.size if self.size else 0.0
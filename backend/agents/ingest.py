@@ -0,0 +1,54 @@
+import hashlib
+from typing import Iterable, Iterator, List
+
+
+# Rough token estimate for English tender text (~4 characters per token).
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def iter_rfp_lines(file_path: str) -> Iterator[str]:
+    """
+    Yield an RFP file line by line; only one line is held in memory.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield line
+
+
+def file_sha256(file_path: str, block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_lines(lines: Iterable[str], max_tokens: int) -> Iterator[str]:
+    """
+    Group lines into text chunks of at most max_tokens (estimated).
+    Lines longer than the budget are split by characters.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    buffer: List[str] = []
+    size = 0
+
+    for line in lines:
+        while len(line) > max_chars:
+            if buffer:
+                yield "".join(buffer)
+                buffer, size = [], 0
+            yield line[:max_chars]
+            line = line[max_chars:]
+
+        if size + len(line) > max_chars and buffer:
+            yield "".join(buffer)
+            buffer, size = [], 0
+        buffer.append(line)
+        size += len(line)
+
+    if buffer:
+        yield "".join(buffer)
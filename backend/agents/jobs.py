@@ -0,0 +1,206 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+# Job lifecycle: queued -> running -> succeeded | failed | cancelled
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobQueueFull(Exception):
+    """
+    Raised by JobQueue.submit when max_queued jobs are already waiting
+    (the API answers 429 so callers back off and retry).
+    """
+
+
+@dataclass
+class Job:
+    id: str
+    rfp_file: str
+    params: Dict[str, Any]
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "status": self.status,
+            "rfp_file": self.rfp_file,
+            "params": self.params,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobQueue:
+    """
+    In-process background queue for long pipeline runs:
+    - submit() returns a Job immediately; `workers` coroutines run the
+      jobs on the event loop (CPU stages still go to threads)
+    - backpressure: at most max_queued live jobs wait, then JobQueueFull
+      (cancelled jobs left in the queue do not count)
+    - cancel() drops a queued job or cancels a running one
+    - finished jobs (with results) are kept for polling, oldest evicted
+      beyond max_finished
+    start()/stop() belong in the app lifespan.
+    """
+
+    def __init__(self, workers: int = 2, max_queued: int = 64, max_finished: int = 256) -> None:
+        self.workers = workers
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self._jobs: Dict[str, Job] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._runs: Dict[str, Callable[[], Awaitable[Dict[str, Any]]]] = {}
+        self._running: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._queue: Optional["asyncio.Queue[str]"] = None
+        # live queued jobs; the asyncio.Queue also holds cancelled ids
+        # until a worker skips them, so it is not bounded itself
+        self._waiting = 0
+        self._workers: List["asyncio.Task[None]"] = []
+        self.counters = {"submitted": 0, "rejected": 0, "succeeded": 0, "failed": 0, "cancelled": 0}
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        self._waiting = 0
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._running.values():
+            task.cancel()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def submit(
+        self,
+        run: Callable[[], Awaitable[Dict[str, Any]]],
+        rfp_file: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Job:
+        """
+        Enqueue `run` (a zero-argument coroutine factory, called only when
+        a worker picks the job up).
+        """
+        if self._queue is None:
+            raise RuntimeError("JobQueue is not started")
+        if self._waiting >= self.max_queued:
+            self.counters["rejected"] += 1
+            raise JobQueueFull(f"{self.max_queued} jobs already queued")
+        job = Job(id=uuid.uuid4().hex, rfp_file=rfp_file, params=params or {})
+        self._queue.put_nowait(job.id)
+        self._waiting += 1
+        self._jobs[job.id] = job
+        self._runs[job.id] = run
+        self.counters["submitted"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def wait(self, job: Job, timeout_s: float) -> Job:
+        """
+        Long-poll: return once the job has finished or timeout_s elapsed.
+        """
+        if timeout_s > 0 and job.status not in FINISHED:
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout_s)
+            except asyncio.TimeoutError:
+                pass
+        return job
+
+    def jobs(self) -> List[Job]:
+        return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self._jobs.get(job_id)
+        if job is None or job.status in FINISHED:
+            return job
+        if job.status == QUEUED:
+            # the worker skips it when it reaches the front of the queue
+            self._waiting -= 1
+            self._finish(job, CANCELLED)
+        else:
+            self._running[job_id].cancel()
+        return job
+
+    def _finish(self, job: Job, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        job.done.set()
+        self._runs.pop(job.id, None)
+        self.counters[status] += 1
+        self._finished[job.id] = None
+        while len(self._finished) > self.max_finished:
+            old_id, _ = self._finished.popitem(last=False)
+            self._jobs.pop(old_id, None)
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            job_id = await self._queue.get()
+            try:
+                job = self._jobs.get(job_id)
+                if job is None or job.status != QUEUED:
+                    continue
+                self._waiting -= 1
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = RUNNING
+        job.started_at = time.time()
+        task = asyncio.ensure_future(self._runs[job.id]())
+        self._running[job.id] = task
+        try:
+            # wait() (not `await task`) so cancel() of the job and
+            # cancellation of the worker itself stay distinguishable
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            self._finish(job, CANCELLED)
+            raise
+        finally:
+            self._running.pop(job.id, None)
+
+        if task.cancelled():
+            self._finish(job, CANCELLED)
+        elif task.exception() is not None:
+            self._finish(job, FAILED, error=str(task.exception()))
+        else:
+            self._finish(job, SUCCEEDED, result=task.result())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "queued": self._waiting,
+            "running": len(self._running),
+            "workers": len(self._workers),
+            "max_queued": self.max_queued,
+        }
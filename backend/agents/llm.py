@@ -0,0 +1,418 @@
+import asyncio
+import functools
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .summary_cache import cache_key
+from .tracing import record_llm_usage, span
+
+Messages = List[Dict[str, str]]
+
+
+def _project_root() -> Path:
+    # backend/agents/llm.py -> backend/agents -> backend -> project root
+    backend_dir = Path(__file__).resolve().parent.parent  # /backend
+    return backend_dir.parent  # /hackathon-rfp
+
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """
+    Load .env (backend/ or project root) once; python-dotenv is only
+    imported when there is a file to read.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    for directory in (Path(__file__).resolve().parent.parent, _project_root()):
+        if (directory / ".env").is_file():
+            from dotenv import load_dotenv
+
+            load_dotenv(directory / ".env")
+
+
+class LLMError(RuntimeError):
+    """
+    Raised when a provider cannot produce a completion (after retries).
+    """
+
+
+@dataclass
+class LLMResponse:
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+def request_key(model: str, messages: Messages, max_tokens: Optional[int]) -> str:
+    """
+    Identity of one completion request (for coalescing and replay).
+    """
+    return cache_key(model, messages + [{"role": "max_tokens", "content": str(max_tokens or "")}])
+
+
+class LLMProvider:
+    """
+    Base class for chat-completion backends:
+    - acomplete(): async, identical in-flight requests are coalesced
+      into one call (per event loop)
+    - complete(): blocking variant for sync callers
+    Subclasses implement _acall / _call.
+    """
+
+    name = "base"
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, "asyncio.Task[LLMResponse]"] = {}
+        self._waiters: Dict["asyncio.Task[LLMResponse]", int] = {}
+        self.counters = {"calls": 0, "coalesced": 0, "retries": 0, "errors": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    async def _acall(self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float) -> LLMResponse:
+        raise NotImplementedError
+
+    def _call(self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float) -> LLMResponse:
+        raise NotImplementedError
+
+    async def acomplete(
+        self,
+        model: str,
+        messages: Messages,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.1,
+    ) -> LLMResponse:
+        key = request_key(model, messages, max_tokens)
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is loop and not task.done():
+            # identical prompt already on the wire: share its answer
+            self._count("coalesced")
+        else:
+            # the call is owned by the provider, not by the first caller:
+            # one caller going away does not cancel it for the others
+            self._count("calls")
+            task = loop.create_task(self._shared_call(model, messages, max_tokens, temperature))
+            self._inflight[key] = task
+            self._waiters[task] = 0
+            task.add_done_callback(functools.partial(self._call_done, key))
+
+        self._waiters[task] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # the last caller to give up cancels the call itself
+            if self._waiters.get(task) == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            if task in self._waiters:
+                self._waiters[task] -= 1
+
+    async def _shared_call(
+        self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float
+    ) -> LLMResponse:
+        try:
+            with span("llm.completion"):
+                response = await self._acall(model, messages, max_tokens, temperature)
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            self._count("errors")
+            raise
+        record_llm_usage(response.prompt_tokens, response.completion_tokens)
+        return response
+
+    def _call_done(self, key: str, task: "asyncio.Task[LLMResponse]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        self._waiters.pop(task, None)
+        if not task.cancelled():
+            # waiters (if any) get the exception; don't warn when there are none
+            task.exception()
+
+    def complete(
+        self,
+        model: str,
+        messages: Messages,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.1,
+    ) -> LLMResponse:
+        self._count("calls")
+        try:
+            with span("llm.completion"):
+                response = self._call(model, messages, max_tokens, temperature)
+        except Exception:
+            self._count("errors")
+            raise
+        record_llm_usage(response.prompt_tokens, response.completion_tokens)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"provider": self.name, **self.counters, "in_flight": len(self._inflight)}
+
+
+class GroqProvider(LLMProvider):
+    """
+    Groq SDK backend with one long-lived client pair per process
+    (HTTP connections are pooled and reused across requests):
+    - the SDK is imported and the clients built on the first call, so
+      constructing the provider is cheap and works without a key
+    - per-request timeout
+    - retry with exponential backoff + jitter on rate limits, timeouts,
+      connection errors and 5xx; Retry-After is honoured when sent
+    """
+
+    name = "groq"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout_s: float = 30.0,
+        max_retries: int = 4,
+        backoff_base_s: float = 0.5,
+        backoff_max_s: float = 20.0,
+    ) -> None:
+        super().__init__()
+        self.api_key = api_key or os.getenv("GROQ_API_KEY")
+        self.timeout_s = timeout_s
+        self.max_retries = max_retries
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self._client: Any = None
+        self._async_client: Any = None
+
+    def _build(self, cls_name: str) -> Any:
+        if not self.api_key:
+            raise LLMError("GROQ_API_KEY is missing in .env")
+        import groq
+
+        # retries are ours (with coalescing/metrics), not the SDK's
+        return getattr(groq, cls_name)(api_key=self.api_key, timeout=self.timeout_s, max_retries=0)
+
+    @property
+    def client(self) -> Any:
+        with self._lock:
+            if self._client is None:
+                self._client = self._build("Groq")
+            return self._client
+
+    @client.setter
+    def client(self, value: Any) -> None:
+        self._client = value
+
+    @property
+    def async_client(self) -> Any:
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = self._build("AsyncGroq")
+            return self._async_client
+
+    @async_client.setter
+    def async_client(self, value: Any) -> None:
+        self._async_client = value
+
+    def _retry_delay(self, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None if error is final.
+        """
+        import groq
+
+        retryable = isinstance(error, (groq.RateLimitError, groq.APITimeoutError, groq.APIConnectionError))
+        if isinstance(error, groq.APIStatusError) and error.status_code >= 500:
+            retryable = True
+        if not retryable or attempt >= self.max_retries:
+            return None
+
+        delay = min(self.backoff_max_s, self.backoff_base_s * (2 ** attempt))
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return delay * (0.5 + random.random() / 2)
+
+    @staticmethod
+    def _to_response(raw: Any) -> LLMResponse:
+        usage = getattr(raw, "usage", None)
+        return LLMResponse(
+            content=raw.choices[0].message.content,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+        )
+
+    async def _acall(self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float) -> LLMResponse:
+        extra: Dict[str, Any] = {"max_tokens": max_tokens} if max_tokens else {}
+        client = self.async_client
+        attempt = 0
+        while True:
+            try:
+                raw = await client.chat.completions.create(
+                    model=model, messages=messages, temperature=temperature, **extra
+                )
+                return self._to_response(raw)
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                self._count("retries")
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    def _call(self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float) -> LLMResponse:
+        extra: Dict[str, Any] = {"max_tokens": max_tokens} if max_tokens else {}
+        client = self.client
+        attempt = 0
+        while True:
+            try:
+                raw = client.chat.completions.create(
+                    model=model, messages=messages, temperature=temperature, **extra
+                )
+                return self._to_response(raw)
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                self._count("retries")
+                attempt += 1
+                time.sleep(delay)
+
+
+class ReplayProvider(LLMProvider):
+    """
+    Offline provider: answers from recorded responses (JSONL of
+    {"key", "content", "prompt_tokens", "completion_tokens"}, see
+    RecordingProvider). Unrecorded requests go to `fallback` if given,
+    else raise LLMError. latency_s simulates the network round trip.
+    """
+
+    name = "replay"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        fallback: Optional[Callable[[str, Messages], str]] = None,
+        latency_s: float = 0.0,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.fallback = fallback
+        self.latency_s = latency_s
+        self.recorded: Dict[str, LLMResponse] = {}
+        if path is not None and path.is_file():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.recorded[entry["key"]] = LLMResponse(
+                            entry["content"], entry.get("prompt_tokens", 0), entry.get("completion_tokens", 0)
+                        )
+
+    def _answer(self, model: str, messages: Messages, max_tokens: Optional[int]) -> LLMResponse:
+        recorded = self.recorded.get(request_key(model, messages, max_tokens))
+        if recorded is not None:
+            return recorded
+        if self.fallback is None:
+            raise LLMError("No recorded LLM response for this request")
+        content = self.fallback(model, messages)
+        prompt_chars = sum(len(m.get("content", "")) for m in messages)
+        return LLMResponse(content, prompt_chars // 4 + 1, len(content) // 4 + 1)
+
+    async def _acall(self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float) -> LLMResponse:
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return self._answer(model, messages, max_tokens)
+
+    def _call(self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float) -> LLMResponse:
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return self._answer(model, messages, max_tokens)
+
+
+class RecordingProvider(LLMProvider):
+    """
+    Wraps a live provider and appends every response to a JSONL file
+    that ReplayProvider can serve later.
+    """
+
+    name = "recording"
+
+    def __init__(self, inner: LLMProvider, path: Path) -> None:
+        super().__init__()
+        self.inner = inner
+        self.path = path
+        self._file_lock = threading.Lock()
+
+    def _record(self, model: str, messages: Messages, max_tokens: Optional[int], response: LLMResponse) -> None:
+        entry = {"key": request_key(model, messages, max_tokens), **response.__dict__}
+        with self._file_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    async def _acall(self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float) -> LLMResponse:
+        response = await self.inner._acall(model, messages, max_tokens, temperature)
+        self._record(model, messages, max_tokens, response)
+        return response
+
+    def _call(self, model: str, messages: Messages, max_tokens: Optional[int], temperature: float) -> LLMResponse:
+        response = self.inner._call(model, messages, max_tokens, temperature)
+        self._record(model, messages, max_tokens, response)
+        return response
+
+
+_default_provider: Optional[LLMProvider] = None
+_default_provider_lock = threading.Lock()
+
+
+def _provider_from_env() -> LLMProvider:
+    """
+    LLM_PROVIDER=groq (default) or replay; LLM_REPLAY_PATH picks the
+    recording to replay, LLM_RECORD_PATH records live Groq responses.
+    """
+    kind = os.getenv("LLM_PROVIDER", "groq").lower()
+    if kind == "replay":
+        path = os.getenv("LLM_REPLAY_PATH")
+        return ReplayProvider(Path(path) if path else _project_root() / "data" / "llm_replay.jsonl")
+
+    provider: LLMProvider = GroqProvider(timeout_s=float(os.getenv("LLM_TIMEOUT_S", "30")))
+    record_path = os.getenv("LLM_RECORD_PATH")
+    if record_path:
+        provider = RecordingProvider(provider, Path(record_path))
+    return provider
+
+
+def default_provider() -> LLMProvider:
+    """
+    Process-wide provider shared by every SalesAgent (one pooled client).
+    """
+    global _default_provider
+    with _default_provider_lock:
+        if _default_provider is None:
+            load_env()
+            _default_provider = _provider_from_env()
+        return _default_provider
+
+
+def set_default_provider(provider: Optional[LLMProvider]) -> None:
+    """
+    Install (or with None, reset) the process-wide provider.
+    """
+    global _default_provider
+    with _default_provider_lock:
+        _default_provider = provider
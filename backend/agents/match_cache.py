@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .retrieval import text_features
+from .sku_index import ATTRIBUTE_WEIGHTS
+from .spec_parser import parse_spec
+
+
+# top-N (sku position, score) pairs of one scope line
+Matches = List[Tuple[int, int]]
+
+
+def _project_root() -> Path:
+    # backend/agents/match_cache.py -> backend/agents -> backend -> project root
+    backend_dir = Path(__file__).resolve().parent.parent  # /backend
+    return backend_dir.parent  # /hackathon-rfp
+
+
+# bump when parse_spec, text_features or the rankers change their output
+MATCH_FORMAT_VERSION = 1
+
+
+def cache_version(catalogue_version: str, top_n: int = 3) -> str:
+    """
+    Catalogue content hash + scorer identity (weights, parser/ranker
+    format, top_n): rankings stored by an older build are never served.
+    """
+    scorer = json.dumps([MATCH_FORMAT_VERSION, top_n, sorted(ATTRIBUTE_WEIGHTS.items())])
+    return f"{catalogue_version}|{hashlib.sha1(scorer.encode('utf-8')).hexdigest()[:12]}"
+
+
+def match_key(line: str, catalogue_version: str, retrieval: bool = False) -> str:
+    """
+    Normalized identity of a scope line's top matches:
+    - exact/batched matching only sees the parsed attributes, so
+      "3 core 1.5 sqmm copper XLPE 1kV" and "Three-core 1.5 mm² Cu XLPE
+      cable, 1 kV - 200 m" share one key (quantity does not matter)
+    - retrieval also sees the words, so its key is the feature bag
+    The version (see cache_version) is part of the key: a catalogue
+    reload or a scorer change invalidates.
+    """
+    spec = parse_spec(line)
+    if retrieval:
+        body = "r|" + json.dumps(sorted(text_features(line, spec).items()))
+    else:
+        body = f"e|{spec.cores}|{spec.area_sqmm}|{spec.voltage_kv}|{spec.insulation}|{spec.material}"
+    return f"{catalogue_version}|{body}"
+
+
+class MatchCache:
+    """
+    Cross-RFP cache of top matches per normalized scope line:
+    - memory: LRU of max_entries results, shared by every request
+    - disk (optional): SQLite table so results survive restarts; rows of
+      older catalogue versions are dropped when a new version is written
+    Values are SKU positions and scores (small); the agent rebuilds the
+    match dicts from its catalogue.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        path: Optional[Path] = None,
+        persist: bool = False,
+    ) -> None:
+        self.max_entries = max_entries
+        self.path = path or _project_root() / "data" / "cache" / "match_cache.sqlite"
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Matches]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_pid = 0
+        self._written_version: Optional[str] = None
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        # opened lazily and per process: serve.py forks after the parent
+        # may have created this object
+        if self._db is None or self._db_pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5.0)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                " key TEXT PRIMARY KEY,"
+                " version TEXT NOT NULL,"
+                " value TEXT NOT NULL)"
+            )
+            self._db.commit()
+            self._db_pid = os.getpid()
+        return self._db
+
+    def _remember(self, key: str, value: Matches) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Matches]:
+        found: Dict[str, Matches] = {}
+        with self._lock:
+            missing = []
+            for key in dict.fromkeys(keys):
+                value = self._memory.get(key)
+                if value is not None:
+                    self._memory.move_to_end(key)
+                    self.counters["memory_hits"] += 1
+                    found[key] = value
+                else:
+                    missing.append(key)
+
+            if missing and self.persist:
+                db = self._connection()
+                # stay under SQLite's bound-parameter limit
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    rows = db.execute(
+                        f"SELECT key, value FROM matches WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for key, value in rows:
+                        matches = [tuple(pair) for pair in json.loads(value)]
+                        self._remember(key, matches)
+                        found[key] = matches
+                        self.counters["disk_hits"] += 1
+
+            self.counters["misses"] += sum(1 for key in missing if key not in found)
+        return found
+
+    def put_many(self, entries: Dict[str, Matches], catalogue_version: str) -> None:
+        with self._lock:
+            for key, value in entries.items():
+                self._remember(key, value)
+            if not entries or not self.persist:
+                return
+            db = self._connection()
+            try:
+                if self._written_version != catalogue_version:
+                    # a reloaded catalogue makes every older row unreachable
+                    db.execute("DELETE FROM matches WHERE version != ?", (catalogue_version,))
+                    self._written_version = catalogue_version
+                db.executemany(
+                    "INSERT OR REPLACE INTO matches (key, version, value) VALUES (?, ?, ?)",
+                    [(key, catalogue_version, json.dumps(value)) for key, value in entries.items()],
+                )
+                db.commit()
+            except sqlite3.OperationalError:
+                # another worker holds the write lock: memory tier still has it
+                db.rollback()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self.persist:
+                db = self._connection()
+                db.execute("DELETE FROM matches")
+                db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.counters["memory_hits"] + self.counters["disk_hits"]
+            lookups = hits + self.counters["misses"]
+            return {
+                **self.counters,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "persist": self.persist,
+            }
+
+
+_default_cache: Optional[MatchCache] = None
+_default_lock = threading.Lock()
+
+
+def default_match_cache() -> MatchCache:
+    """
+    Process-wide cache shared by every TechnicalAgent; memory only unless
+    MATCH_CACHE_PERSIST=1 (then persisted under data/cache).
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = MatchCache(persist=os.getenv("MATCH_CACHE_PERSIST", "0") == "1")
+        return _default_cache
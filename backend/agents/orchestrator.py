@@ -0,0 +1,343 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .ingest import file_sha256
+from .stage_store import StageStore, line_key
+
+
+T = TypeVar("T")
+
+
+class StageError(Exception):
+    """
+    Raised when one pipeline stage fails; `stage` names the agent
+    so the API can report where the run broke.
+    """
+
+    def __init__(self, stage: str, cause: BaseException) -> None:
+        super().__init__(f"Error in {stage}: {cause}")
+        self.stage = stage
+        self.cause = cause
+
+
+async def _stage(name: str, awaitable: Awaitable[T]) -> T:
+    try:
+        return await awaitable
+    except Exception as e:
+        raise StageError(name, e) from e
+
+
+async def run_full_pipeline(
+    rfp_file: str,
+    sales_agent: Any,
+    technical_agent: Any,
+    pricing_agent: Any,
+    judge_agent: Any,
+    match_runner: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None,
+    llm_semaphore: Optional[asyncio.Semaphore] = None,
+    stage_store: Optional[StageStore] = None,
+    catalogue_version: str = "",
+) -> Dict[str, Any]:
+    """
+    Async orchestrator for /rfp/full-run. Stage graph:
+
+        ─┬─ sales summary (async Groq) ───────────────┐
+         └─ technical match ─┬─ oumi judge ───────────┼─ response
+                             └─ pricing ──────────────┘
+
+    CPU-bound agents run in worker threads; the LLM call is awaited on
+    the event loop. Latency is the critical path, not the sum of stages.
+    Neither branch loads the whole RFP: matching streams the file and
+    long documents are summarized map-reduce.
+
+    match_runner replaces the threaded technical_agent.match_specs_file
+    call (e.g. a process pool); llm_semaphore bounds concurrent Groq calls.
+
+    With a stage_store, results are reused by content hash (see
+    agents.stage_store): the summary when the file is unchanged, and
+    match / judge / price per scope line. Only new or amended lines are
+    recomputed, and the response gets a "reuse" report per stage.
+    """
+    if stage_store is not None and match_runner is None:
+        return await _run_incremental(
+            rfp_file, sales_agent, technical_agent, pricing_agent, judge_agent,
+            llm_semaphore, stage_store, catalogue_version,
+        )
+
+    async def summarize():
+        if llm_semaphore is None:
+            return await sales_agent.asummarize_rfp(rfp_file)
+        async with llm_semaphore:
+            return await sales_agent.asummarize_rfp(rfp_file)
+
+    async def technical_then_downstream():
+        if match_runner is not None:
+            matching = match_runner(rfp_file)
+        else:
+            matching = asyncio.to_thread(technical_agent.match_specs_file, rfp_file)
+        technical_result = await _stage("TechnicalAgent", matching)
+        oumi_judgement, pricing_result = await asyncio.gather(
+            _stage(
+                "OumiJudgeAgent",
+                asyncio.to_thread(judge_agent.evaluate_technical_output, technical_result),
+            ),
+            _stage(
+                "PricingAgent",
+                asyncio.to_thread(pricing_agent.price_from_technical_result, technical_result),
+            ),
+        )
+        return technical_result, oumi_judgement, pricing_result
+
+    sales_task = asyncio.ensure_future(_stage("SalesAgent", summarize()))
+    try:
+        technical_result, oumi_judgement, pricing_result = await technical_then_downstream()
+        sales_info = await sales_task
+    finally:
+        _cancel_or_retrieve(sales_task)
+
+    return _response(rfp_file, sales_info, technical_result, oumi_judgement, pricing_result)
+
+
+def _response(
+    rfp_file: str,
+    sales_info: Any,
+    technical_result: Dict[str, Any],
+    oumi_judgement: Dict[str, Any],
+    pricing_result: Dict[str, Any],
+) -> Dict[str, Any]:
+    return {
+        "rfp_file": rfp_file,
+        "sales_summary": {
+            "rfp_id": sales_info.rfp_id,
+            "title": sales_info.title,
+            "due_date": sales_info.due_date,
+            "scope_summary": sales_info.scope_summary,
+        },
+        "technical": technical_result,
+        "oumi_judgement": oumi_judgement,
+        "pricing": pricing_result,
+    }
+
+
+def _split_cached(
+    store: StageStore, stage: str, keys: List[str]
+) -> Tuple[Dict[str, Any], List[str]]:
+    # -> (key -> stored result, keys still to compute; first occurrence order)
+    found: Dict[str, Any] = {}
+    missing: List[str] = []
+    for key in keys:
+        if key in found or key in missing:
+            continue
+        value = store.get_line(stage, key)
+        if value is None:
+            missing.append(key)
+        else:
+            found[key] = value
+    return found, missing
+
+
+async def _run_incremental(
+    rfp_file: str,
+    sales_agent: Any,
+    technical_agent: Any,
+    pricing_agent: Any,
+    judge_agent: Any,
+    llm_semaphore: Optional[asyncio.Semaphore],
+    store: StageStore,
+    catalogue_version: str,
+) -> Dict[str, Any]:
+    """
+    Same stage graph as run_full_pipeline, but each stage only computes
+    what the stage store does not already hold.
+    """
+    doc_hash = await asyncio.to_thread(file_sha256, rfp_file)
+    reuse: Dict[str, Any] = {"document_sha256": doc_hash}
+
+    async def summarize():
+        sales_info = store.get_document(doc_hash)
+        if sales_info is not None:
+            reuse["sales"] = "reused"
+            return sales_info
+        if llm_semaphore is None:
+            sales_info = await sales_agent.asummarize_rfp(rfp_file)
+        else:
+            async with llm_semaphore:
+                sales_info = await sales_agent.asummarize_rfp(rfp_file)
+        store.put_document(doc_hash, sales_info)
+        reuse["sales"] = "computed"
+        return sales_info
+
+    def line_stage(stage: str, keys: List[str], compute: Callable[[List[str]], List[Any]]) -> List[Any]:
+        found, missing = _split_cached(store, stage, keys)
+        reuse[stage] = {"reused": len(found), "computed": len(missing)}
+        if missing:
+            for key, value in zip(missing, compute(missing)):
+                store.put_line(stage, key, value)
+                found[key] = value
+        return [found[key] for key in keys]
+
+    def technical_stage() -> Tuple[Dict[str, Any], List[str]]:
+        lines = technical_agent.scope_items_file(rfp_file)
+        keys = [line_key(line, catalogue_version) for line in lines]
+        by_key = dict(zip(keys, lines))
+        items = line_stage(
+            "technical", keys,
+            lambda missing: technical_agent.match_items([by_key[k] for k in missing])["items"],
+        )
+        return {"items": items}, keys
+
+    def judge_stage(technical_result: Dict[str, Any], keys: List[str]) -> Dict[str, Any]:
+        by_key = dict(zip(keys, technical_result["items"]))
+        judged = line_stage(
+            "oumi_judge", keys,
+            lambda missing: judge_agent.evaluate_technical_output(
+                {"items": [by_key[k] for k in missing]}
+            )["judged_items"],
+        )
+        return {"judged_items": judged}
+
+    def pricing_stage(technical_result: Dict[str, Any], keys: List[str]) -> Dict[str, Any]:
+        by_key = dict(zip(keys, technical_result["items"]))
+        priced = line_stage(
+            "pricing", keys,
+            lambda missing: pricing_agent.price_from_technical_result(
+                {"items": [by_key[k] for k in missing]}
+            )["priced_items"],
+        )
+        grand_total = sum(
+            p["pricing"]["total_cost"] for p in priced if p["pricing"] and p["pricing"].get("found")
+        )
+        return {"priced_items": priced, "grand_total": grand_total, "currency": "INR"}
+
+    async def technical_then_downstream():
+        technical_result, keys = await _stage("TechnicalAgent", asyncio.to_thread(technical_stage))
+        oumi_judgement, pricing_result = await asyncio.gather(
+            _stage("OumiJudgeAgent", asyncio.to_thread(judge_stage, technical_result, keys)),
+            _stage("PricingAgent", asyncio.to_thread(pricing_stage, technical_result, keys)),
+        )
+        return technical_result, oumi_judgement, pricing_result
+
+    sales_task = asyncio.ensure_future(_stage("SalesAgent", summarize()))
+    try:
+        technical_result, oumi_judgement, pricing_result = await technical_then_downstream()
+        sales_info = await sales_task
+    finally:
+        _cancel_or_retrieve(sales_task)
+
+    result = _response(rfp_file, sales_info, technical_result, oumi_judgement, pricing_result)
+    result["reuse"] = reuse
+    return result
+
+
+async def stream_full_pipeline(
+    rfp_file: str,
+    sales_agent: Any,
+    technical_agent: Any,
+    pricing_agent: Any,
+    judge_agent: Any,
+    chunk_size: int = 16,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming variant of run_full_pipeline: yields one event per finished
+    piece of work instead of one response at the end.
+
+        {"event": "start", "rfp_file", "scope_lines"}
+        {"event": "sales_summary", rfp_id, title, due_date, scope_summary}
+        {"event": "technical", "offset", "items"}          per chunk of lines
+        {"event": "oumi_judge", "offset", "judged_items"}  per chunk
+        {"event": "pricing", "offset", "priced_items", "running_total"}
+        {"event": "done", "grand_total", "currency"}
+        {"event": "error", "stage", "detail"}              (then stops)
+
+    The summary runs alongside matching; scope lines are matched in
+    chunks of chunk_size and each chunk is judged and priced as soon as
+    it is matched, so the first result arrives after the fastest stage.
+    "offset" is the index of the chunk's first line in the RFP.
+    """
+    events: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+    grand_total = 0.0
+
+    async def summarize() -> None:
+        info = await _stage("SalesAgent", sales_agent.asummarize_rfp(rfp_file))
+        await events.put({
+            "event": "sales_summary",
+            "rfp_id": info.rfp_id,
+            "title": info.title,
+            "due_date": info.due_date,
+            "scope_summary": info.scope_summary,
+        })
+
+    async def judge(offset: int, technical_result: Dict[str, Any]) -> None:
+        judged = await _stage(
+            "OumiJudgeAgent",
+            asyncio.to_thread(judge_agent.evaluate_technical_output, technical_result),
+        )
+        await events.put({"event": "oumi_judge", "offset": offset, **judged})
+
+    async def price(offset: int, technical_result: Dict[str, Any]) -> None:
+        nonlocal grand_total
+        priced = await _stage(
+            "PricingAgent",
+            asyncio.to_thread(pricing_agent.price_from_technical_result, technical_result),
+        )
+        grand_total += priced["grand_total"]
+        await events.put({
+            "event": "pricing",
+            "offset": offset,
+            "priced_items": priced["priced_items"],
+            "running_total": grand_total,
+        })
+
+    async def technical() -> None:
+        lines = await _stage("TechnicalAgent", asyncio.to_thread(technical_agent.scope_items_file, rfp_file))
+        await events.put({"event": "start", "rfp_file": rfp_file, "scope_lines": len(lines)})
+        downstream = []
+        for offset in range(0, len(lines), chunk_size):
+            technical_result = await _stage(
+                "TechnicalAgent",
+                asyncio.to_thread(technical_agent.match_items, lines[offset:offset + chunk_size]),
+            )
+            await events.put({"event": "technical", "offset": offset, **technical_result})
+            downstream.append(asyncio.ensure_future(judge(offset, technical_result)))
+            downstream.append(asyncio.ensure_future(price(offset, technical_result)))
+        await _gather_or_cancel(downstream)
+
+    async def run() -> None:
+        try:
+            await _gather_or_cancel([asyncio.ensure_future(summarize()), asyncio.ensure_future(technical())])
+            await events.put({"event": "done", "grand_total": grand_total, "currency": "INR"})
+        except StageError as e:
+            await events.put({"event": "error", "stage": e.stage, "detail": str(e)})
+        finally:
+            await events.put(None)
+
+    producer = asyncio.ensure_future(run())
+    try:
+        while True:
+            event = await events.get()
+            if event is None:
+                break
+            yield event
+    finally:
+        # client went away: stop the remaining stages
+        if not producer.done():
+            producer.cancel()
+
+
+def _cancel_or_retrieve(task: "asyncio.Future[Any]") -> None:
+    # a sibling stage failed: stop the task, or retrieve its own failure
+    # (else asyncio logs "Task exception was never retrieved")
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+async def _gather_or_cancel(tasks: List["asyncio.Future[Any]"]) -> None:
+    # first failure cancels the siblings (plain gather would leave them running)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -1,22 +1,252 @@
-from typing import Dict, Any
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-try:
-    from oumi import judge
-    OUMI_AVAILABLE = True
-except ImportError:
-    OUMI_AVAILABLE = False
+from .tracing import traced
+
+
+# (rfp_item, best sku_id, best match as the judge sees it) -> judge score
+JudgeKey = Tuple[str, str, str]
+
+_SCORE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+class JudgeMemo:
+    """
+    Process-wide LRU of judge scores keyed on (rfp_item, best SKU, best
+    match). The same spec line / SKU pair recurs across RFPs, so it is
+    judged once; a catalogue reload that changes the SKU's attributes or
+    match score gives a new key.
+    """
+
+    def __init__(self, max_entries: int = 50_000) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._scores: "OrderedDict[JudgeKey, Any]" = OrderedDict()
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: JudgeKey) -> Optional[Any]:
+        with self._lock:
+            if key in self._scores:
+                self._scores.move_to_end(key)
+                self.counters["hits"] += 1
+                return self._scores[key]
+            self.counters["misses"] += 1
+            return None
+
+    def put(self, key: JudgeKey, score: Any) -> None:
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.max_entries:
+                self._scores.popitem(last=False)
+                self.counters["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.counters["hits"] + self.counters["misses"]
+            return {
+                **self.counters,
+                "hit_rate": self.counters["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._scores),
+            }
+
+
+# Oumi pulls in torch/transformers: imported on first use, not at startup
+judge: Any = None
+_oumi_checked = False
+_oumi_lock = threading.Lock()
+
+
+def oumi_available() -> bool:
+    global judge, _oumi_checked
+    with _oumi_lock:
+        if not _oumi_checked:
+            try:
+                from oumi import judge as oumi_judge
+                judge = oumi_judge
+            except ImportError:
+                judge = None
+            _oumi_checked = True
+        return judge is not None
+
+
+_default_memos: Dict[bool, JudgeMemo] = {}
+_default_memo_lock = threading.Lock()
+
+
+def default_judge_memo(oumi: Optional[bool] = None) -> JudgeMemo:
+    # separate memos so fallback scores never answer for Oumi (and vice versa)
+    if oumi is None:
+        oumi = oumi_available()
+    with _default_memo_lock:
+        if oumi not in _default_memos:
+            _default_memos[oumi] = JudgeMemo()
+        return _default_memos[oumi]
+
+
+def judge_memo_stats() -> Dict[str, Any]:
+    """
+    Combined stats of the default memos created so far (never imports Oumi).
+    """
+    with _default_memo_lock:
+        memos = list(_default_memos.values())
+    totals = {"hits": 0, "misses": 0, "evictions": 0, "entries": 0}
+    for memo in memos:
+        for name, value in memo.stats().items():
+            if name in totals:
+                totals[name] += value
+    lookups = totals["hits"] + totals["misses"]
+    return {**totals, "hit_rate": totals["hits"] / lookups if lookups else 0.0}
+
+
+def _judge_key(rfp_item: str, best: Dict[str, Any]) -> JudgeKey:
+    # the whole match goes into the prompt (and its score is the fallback)
+    return rfp_item, str(best.get("sku_id")), repr(sorted(best.items()))
+
+
+def _item_prompt(rfp_item: str, best: Dict[str, Any]) -> str:
+    return f"""
+Evaluate the OEM recommendation quality for the RFP item.
+Return a score from 0 to 100.
+
+RFP ITEM:
+{rfp_item}
+
+OEM RECOMMENDATION:
+{best}
+"""
+
+
+def _packed_prompt(pairs: Sequence[Tuple[str, Dict[str, Any]]]) -> str:
+    blocks = "\n".join(
+        f"{n}. RFP ITEM: {rfp_item}\n   OEM RECOMMENDATION: {best}"
+        for n, (rfp_item, best) in enumerate(pairs, start=1)
+    )
+    return f"""
+Evaluate the OEM recommendation quality for each numbered RFP item.
+Return one score from 0 to 100 per item, one per line, in the same order.
+
+{blocks}
+"""
+
+
+def _unpack_scores(result: Any, expected: int) -> Optional[List[Any]]:
+    # judge output for a packed prompt: a list of scores, or text with one per line
+    if isinstance(result, (list, tuple)):
+        scores = list(result)
+    else:
+        scores = []
+        for line in str(result).splitlines():
+            numbers = _SCORE.findall(line.split(":", 1)[-1] if ":" in line else line)
+            if numbers:
+                scores.append(float(numbers[-1]))
+    return scores if len(scores) == expected else None
 
 
 class OumiJudgeAgent:
     """
     Oumi LLM-as-a-Judge.
     Falls back gracefully if Oumi cannot be installed locally.
+    - Items are judged in batches: batch_size items packed per judge
+      request, up to max_concurrency requests in flight
+    - Scores are memoized on (rfp_item, best match) across RFPs
+    - The deterministic fallback goes through the same batched path
     """
 
+    def __init__(
+        self,
+        batch_size: int = 8,
+        max_concurrency: int = 4,
+        memo: Optional[JudgeMemo] = None,
+        use_oumi: Optional[bool] = None,
+    ) -> None:
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.use_oumi = oumi_available() if use_oumi is None else use_oumi
+        self.memo = memo or default_judge_memo(self.use_oumi)
+        self.judge_calls = 0
+        self._calls_lock = threading.Lock()
+
+    def _judge(self, prompt: str) -> Any:
+        with self._calls_lock:
+            self.judge_calls += 1
+        return judge.score(prompt)
+
+    def _score_one(self, rfp_item: str, best: Dict[str, Any]) -> Any:
+        if not self.use_oumi:
+            # Fallback deterministic reward score
+            return best.get("score", 50)
+        return self._judge(_item_prompt(rfp_item, best))
+
+    def _score_batch(self, pairs: Sequence[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Score one batch of (rfp_item, best match) pairs with one judge request.
+        If the packed answer cannot be split per item, score items one by one.
+        """
+        if not self.use_oumi or len(pairs) == 1:
+            return [self._score_one(rfp_item, best) for rfp_item, best in pairs]
+
+        scores = _unpack_scores(self._judge(_packed_prompt(pairs)), len(pairs))
+        if scores is None:
+            return [self._score_one(rfp_item, best) for rfp_item, best in pairs]
+        return scores
+
+    def score_pairs(self, pairs: Sequence[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Scores for (rfp_item, best match) pairs, in order.
+        Memo hits and duplicates within the request are not re-judged.
+        """
+        scores: Dict[JudgeKey, Any] = {}
+        pending: Dict[JudgeKey, Tuple[str, Dict[str, Any]]] = {}
+
+        for rfp_item, best in pairs:
+            key = _judge_key(rfp_item, best)
+            if key in scores or key in pending:
+                continue
+            cached = self.memo.get(key)
+            if cached is not None:
+                scores[key] = cached
+            else:
+                pending[key] = (rfp_item, best)
+
+        keys = list(pending)
+        batches = [keys[i:i + self.batch_size] for i in range(0, len(keys), self.batch_size)]
+
+        def run(batch: List[JudgeKey]) -> List[Any]:
+            return self._score_batch([pending[key] for key in batch])
+
+        if len(batches) > 1 and self.max_concurrency > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as pool:
+                results = list(pool.map(run, batches))
+        else:
+            results = [run(batch) for batch in batches]
+
+        for batch, batch_scores in zip(batches, results):
+            for key, score in zip(batch, batch_scores):
+                scores[key] = score
+                self.memo.put(key, score)
+
+        return [scores[_judge_key(rfp_item, best)] for rfp_item, best in pairs]
+
+    @traced("judge.evaluate_technical_output")
     def evaluate_technical_output(self, technical_result: Dict[str, Any]) -> Dict[str, Any]:
         items = technical_result.get("items", [])
-        judged_items = []
 
+        pairs = [
+            (item.get("rfp_item", ""), item["top_matches"][0])
+            for item in items
+            if item.get("top_matches")
+        ]
+        scores = iter(self.score_pairs(pairs))
+
+        judged_items = []
         for item in items:
             rfp_item = item.get("rfp_item", "")
             matches = item.get("top_matches", [])
@@ -31,28 +261,11 @@ class OumiJudgeAgent:
                 continue
 
             best = matches[0]
-
-            if OUMI_AVAILABLE:
-                prompt = f"""
-Evaluate the OEM recommendation quality for the RFP item.
-Return a score from 0 to 100.
-
-RFP ITEM:
-{rfp_item}
-
-OEM RECOMMENDATION:
-{best}
-"""
-                score = judge.score(prompt)
-            else:
-                # Fallback deterministic reward score
-                score = best.get("score", 50)
-
             judged_items.append({
                 "rfp_item": rfp_item,
                 "best_sku": best.get("sku_id"),
-                "judge_score": score,
-                "oumi_used": OUMI_AVAILABLE
+                "judge_score": next(scores),
+                "oumi_used": self.use_oumi
             })
 
         return {"judged_items": judged_items}
@@ -0,0 +1,128 @@
+import gzip
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+# Smaller bodies are sent as-is: compressing them costs more than it saves
+MIN_COMPRESS_BYTES = 1024
+
+# SKU attributes moved into the shared "skus" table by compact_result
+SKU_FIELDS = ("cores", "area_sqmm", "insulation", "material", "voltage")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    JSON bytes: orjson when installed (several times faster on large
+    results), else the stdlib without whitespace.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def compact_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Refer to SKUs by id: every technical match keeps only sku_id and
+    score, and each SKU's attributes appear once in result["skus"].
+    Works on /technical/run results and on results that contain them
+    under "technical" (/pricing/run, /rfp/full-run).
+    """
+    technical = result.get("technical", result)
+    if "items" not in technical:
+        return result
+
+    skus: Dict[str, Dict[str, Any]] = {}
+    items = []
+    for item in technical["items"]:
+        matches = []
+        for match in item.get("top_matches", []):
+            sku_id = match["sku_id"]
+            if sku_id not in skus:
+                skus[sku_id] = {field: match.get(field) for field in SKU_FIELDS}
+            matches.append({"sku_id": sku_id, "score": match.get("score")})
+        items.append({**item, "top_matches": matches})
+
+    compact_technical = {**technical, "items": items}
+    compact = {**result, "technical": compact_technical} if technical is not result else compact_technical
+    compact["skus"] = skus
+    return compact
+
+
+def _field_tree(fields: str) -> Dict[str, Any]:
+    # "pricing.grand_total,sales_summary" -> {"pricing": {"grand_total": {}}, "sales_summary": {}}
+    tree: Dict[str, Any] = {}
+    for path in fields.split(","):
+        node = tree
+        parts = [part for part in path.strip().split(".") if part]
+        for i, part in enumerate(parts):
+            if i == len(parts) - 1:
+                node[part] = {}
+            elif part in node and not node[part]:
+                break  # a parent path already keeps the whole subtree
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _project(value: Any, tree: Dict[str, Any]) -> Any:
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_project(element, tree) for element in value]
+    if isinstance(value, dict):
+        return {key: _project(value[key], sub) for key, sub in tree.items() if key in value}
+    return value
+
+
+def project_fields(result: Dict[str, Any], fields: Optional[str]) -> Dict[str, Any]:
+    """
+    Keep only the comma-separated dotted paths in `fields`; paths go
+    through lists ("pricing.priced_items.total_cost" keeps that key in
+    every priced item). Unknown keys are ignored. The "skus" table of a
+    compact result is always kept.
+    """
+    if not fields:
+        return result
+    tree = _field_tree(fields)
+    if "skus" in result:
+        tree.setdefault("skus", {})
+    return _project(result, tree)
+
+
+def _accepted(accept_encoding: str) -> List[str]:
+    accepted = []
+    for entry in accept_encoding.lower().split(","):
+        name, _, params = entry.partition(";")
+        name = name.strip()
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if name:
+            accepted.append(name)
+    return accepted
+
+
+def encode_body(body: bytes, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress for the client: brotli if available and accepted, else gzip.
+    Returns (body, content-encoding or None).
+    """
+    if len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    accepted = _accepted(accept_encoding)
+    if BROTLI_AVAILABLE and "br" in accepted:
+        return brotli.compress(body, quality=5), "br"
+    if "gzip" in accepted or "*" in accepted:
+        return gzip.compress(body, compresslevel=5), "gzip"
+    return body, None
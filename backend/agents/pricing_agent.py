@@ -1,8 +1,23 @@
 import csv
+import math
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple, TYPE_CHECKING
 from pathlib import Path
 
+from .spec_parser import parse_quantity
+from .tracing import traced
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from .catalogue import Catalogue
+
 
 @dataclass
 class PricingRow:
@@ -12,44 +27,198 @@ class PricingRow:
     currency: str
 
 
+def load_pricing(csv_path: Path) -> Dict[str, PricingRow]:
+    """
+    Parse pricing.csv into {sku_id: PricingRow}. Bad rows are skipped.
+    """
+    if not csv_path.is_file():
+        return {}
+
+    pricing: Dict[str, PricingRow] = {}
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                pricing[row["sku_id"]] = PricingRow(
+                    sku_id=row["sku_id"],
+                    base_material_cost=float(row["base_material_cost"]),
+                    testing_cost=float(row["testing_cost"]),
+                    currency=row.get("currency", "INR"),
+                )
+            except Exception:
+                # skip bad rows
+                continue
+    return pricing
+
+
+def load_volume_tiers(csv_path: Path) -> List[Tuple[float, float]]:
+    """
+    Parse volume_tiers.csv (min_quantity_m, discount_pct) into tiers sorted
+    by threshold. A missing file means no volume discount.
+    """
+    if not csv_path.is_file():
+        return []
+
+    tiers: List[Tuple[float, float]] = []
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                tiers.append((float(row["min_quantity_m"]), float(row["discount_pct"])))
+            except Exception:
+                # skip bad rows
+                continue
+    return sorted(tiers)
+
+
+# Standard drum length used when an RFP line asks for N drums
+DRUM_LENGTH_M = 500.0
+
+
+# normalized unit -> (metres per unit, priced unit)
+_UNIT_FACTORS: Dict[str, Tuple[float, str]] = {
+    "m": (1.0, "m"),
+    "km": (1000.0, "m"),
+    "drum": (DRUM_LENGTH_M, "m"),
+    "nos": (1.0, "unit"),
+}
+
+
+def quantity_from_line(line: str) -> Tuple[float, str]:
+    """
+    Quantity to price for one scope line: metres for cable lengths,
+    plain units otherwise. Lines without a quantity are priced for 1.
+    """
+    quantity, unit = parse_quantity(line)
+    if quantity is None:
+        return 1.0, "unit"
+    factor, priced_unit = _UNIT_FACTORS[unit]
+    return quantity * factor, priced_unit
+
+
+class PriceTable:
+    """
+    Array-backed pricing for batch computation:
+    - sku_id -> position, unit costs as float64 arrays
+    - volume tiers as sorted thresholds + discount percentages; tiers are
+      in metres (min_quantity_m), so other units get no discount
+    price_batch() prices many (SKU, quantity) pairs in one pass.
+    """
+
+    def __init__(self, pricing: Dict[str, PricingRow], tiers: Optional[List[Tuple[float, float]]] = None) -> None:
+        tiers = tiers or []
+        self.position: Dict[str, int] = {}
+        self.base = array("d")
+        self.testing = array("d")
+        self.currency: List[str] = []
+        for sku_id, row in pricing.items():
+            self.position[sku_id] = len(self.currency)
+            self.base.append(row.base_material_cost)
+            self.testing.append(row.testing_cost)
+            self.currency.append(row.currency)
+
+        self.tier_min = array("d", (t[0] for t in tiers))
+        self.tier_discount = array("d", (t[1] for t in tiers))
+
+    def discount_pct(self, quantity: float, unit: str = "m") -> float:
+        if unit != "m":
+            return 0.0
+        tier = bisect_right(self.tier_min, quantity) - 1
+        return self.tier_discount[tier] if tier >= 0 else 0.0
+
+    def price_batch(
+        self,
+        positions: Sequence[int],
+        quantities: Sequence[float],
+        units: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Sequence[float]]:
+        """
+        positions[i] is a PriceTable position (-1 = no pricing row).
+        units[i] is the priced unit of quantities[i] (default: all "m").
+        Returns parallel columns; rows without pricing have NaN costs.
+        Volume discount applies to material cost of metre quantities only.
+        """
+        if units is None:
+            units = ["m"] * len(quantities)
+        if NUMPY_AVAILABLE:
+            pos = np.asarray(positions, dtype=np.int64)
+            qty = np.asarray(quantities, dtype=np.float64)
+            found = pos >= 0
+            safe = np.where(found, pos, 0)
+            base_all = np.frombuffer(self.base, dtype=np.float64) if len(self.base) else np.zeros(1)
+            test_all = np.frombuffer(self.testing, dtype=np.float64) if len(self.testing) else np.zeros(1)
+            unit_base = np.where(found, base_all[safe], np.nan)
+            unit_testing = np.where(found, test_all[safe], np.nan)
+
+            if len(self.tier_min):
+                tier = np.searchsorted(np.frombuffer(self.tier_min), qty, side="right") - 1
+                discounts = np.frombuffer(self.tier_discount)
+                metres = np.asarray(units) == "m"
+                discount = np.where((tier >= 0) & metres, discounts[np.maximum(tier, 0)], 0.0)
+            else:
+                discount = np.zeros(len(qty))
+
+            total_material = unit_base * qty * (1.0 - discount / 100.0)
+            total_testing = unit_testing * qty
+            return {
+                "unit_base": unit_base.tolist(),
+                "unit_testing": unit_testing.tolist(),
+                "discount_pct": discount.tolist(),
+                "total_material": total_material.tolist(),
+                "total_testing": total_testing.tolist(),
+                "total": (total_material + total_testing).tolist(),
+            }
+
+        unit_base = [self.base[p] if p >= 0 else math.nan for p in positions]
+        unit_testing = [self.testing[p] if p >= 0 else math.nan for p in positions]
+        discount = [self.discount_pct(q, u) for q, u in zip(quantities, units)]
+        total_material = [b * q * (1.0 - d / 100.0) for b, q, d in zip(unit_base, quantities, discount)]
+        total_testing = [t * q for t, q in zip(unit_testing, quantities)]
+        return {
+            "unit_base": unit_base,
+            "unit_testing": unit_testing,
+            "discount_pct": discount,
+            "total_material": total_material,
+            "total_testing": total_testing,
+            "total": [m + t for m, t in zip(total_material, total_testing)],
+        }
+
+
 class PricingAgent:
     """
     Simple Pricing Agent:
-    - Loads pricing from data/pricing/pricing.csv
+    - Loads pricing from data/pricing/pricing.csv (+ optional volume_tiers.csv)
     - Given a list of SKUs or technical matches, computes total cost.
+    - Quantities come from the RFP line (metres / km / drums); every top-N
+      match is costed as an alternate in one batched PriceTable pass.
     """
 
-    def __init__(self) -> None:
-        self.pricing: Dict[str, PricingRow] = self._load_pricing()
+    def __init__(self, catalogue: Optional["Catalogue"] = None) -> None:
+        if catalogue is not None:
+            # Shared pricing table (see agents.catalogue)
+            self.pricing: Dict[str, PricingRow] = catalogue.pricing
+            self.prices: PriceTable = catalogue.prices
+        else:
+            self.pricing = self._load_pricing()
+            tiers = load_volume_tiers(self._project_root() / "data" / "pricing" / "volume_tiers.csv")
+            self.prices = PriceTable(self.pricing, tiers)
 
     def _project_root(self) -> Path:
         backend_dir = Path(__file__).resolve().parent.parent  # /backend
         return backend_dir.parent  # /hackathon-rfp
 
     def _load_pricing(self) -> Dict[str, PricingRow]:
-        csv_path = self._project_root() / "data" / "pricing" / "pricing.csv"
-        if not csv_path.is_file():
-            return {}
-
-        pricing: Dict[str, PricingRow] = {}
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    pricing[row["sku_id"]] = PricingRow(
-                        sku_id=row["sku_id"],
-                        base_material_cost=float(row["base_material_cost"]),
-                        testing_cost=float(row["testing_cost"]),
-                        currency=row.get("currency", "INR"),
-                    )
-                except Exception:
-                    # skip bad rows
-                    continue
-        return pricing
-
-    def price_item(self, sku_id: str, quantity: float = 1.0) -> Dict[str, Any]:
+        # Prefer the binary snapshot (faster decode); fall back to parsing the CSV
+        from .snapshot import open_fresh_snapshot
+
+        snapshot = open_fresh_snapshot()
+        if snapshot is not None:
+            return snapshot.pricing()
+        return load_pricing(self._project_root() / "data" / "pricing" / "pricing.csv")
+
+    def price_item(self, sku_id: str, quantity: float = 1.0, unit: str = "m") -> Dict[str, Any]:
         """
-        Compute price for a single SKU and quantity.
+        Compute price for a single SKU and quantity (in metres by default).
         """
         if sku_id not in self.pricing:
             return {
@@ -59,7 +228,8 @@ class PricingAgent:
             }
 
         row = self.pricing[sku_id]
-        total_material = row.base_material_cost * quantity
+        discount = self.prices.discount_pct(quantity, unit)
+        total_material = row.base_material_cost * quantity * (1.0 - discount / 100.0)
         total_testing = row.testing_cost * quantity
         total = total_material + total_testing
 
@@ -69,20 +239,46 @@ class PricingAgent:
             "quantity": quantity,
             "base_material_cost": row.base_material_cost,
             "testing_cost": row.testing_cost,
+            "volume_discount_pct": discount,
             "total_material_cost": total_material,
             "total_testing_cost": total_testing,
             "total_cost": total,
             "found": True,
         }
 
+    @traced("pricing.price_from_technical_result")
     def price_from_technical_result(self, technical_result: Dict[str, Any]) -> Dict[str, Any]:
         items = technical_result.get("items", [])
+
+        # 1) Flatten every (item, match) pair into parallel arrays
+        item_of: List[int] = []
+        positions: List[int] = []
+        quantities: List[float] = []
+        units: List[str] = []
+        item_quantity: List[Tuple[float, str]] = []
+        lookup = self.prices.position
+
+        for item_no, item in enumerate(items):
+            qty, unit = quantity_from_line(item.get("rfp_item", ""))
+            item_quantity.append((qty, unit))
+            for match in item.get("top_matches", []):
+                item_of.append(item_no)
+                positions.append(lookup.get(match.get("sku_id", ""), -1))
+                quantities.append(qty)
+                units.append(unit)
+
+        # 2) One batched pricing pass over all pairs
+        priced = self.prices.price_batch(positions, quantities, units)
+
+        # 3) Shape the response: best match + costed alternates per item
         priced_items: List[Dict[str, Any]] = []
         grand_total = 0.0
+        row = 0
 
-        for item in items:
+        for item_no, item in enumerate(items):
             rfp_item = item.get("rfp_item", "")
             top_matches = item.get("top_matches", [])
+            qty, unit = item_quantity[item_no]
 
             if not top_matches:
                 priced_items.append({
@@ -90,21 +286,49 @@ class PricingAgent:
                     "best_match_sku": "-",
                     "match_score": "-",
                     "pricing": None,
+                    "alternates": [],
                 })
                 continue
 
-            best = top_matches[0]
-            sku_id = best.get("sku_id", "")
-            pricing_info = self.price_item(sku_id, quantity=1.0)
+            costed: List[Dict[str, Any]] = []
+            for match in top_matches:
+                sku_id = match.get("sku_id", "")
+                if positions[row] < 0:
+                    costed.append({
+                        "sku_id": sku_id,
+                        "found": False,
+                        "message": "No pricing available",
+                    })
+                else:
+                    costed.append({
+                        "sku_id": sku_id,
+                        "currency": self.prices.currency[positions[row]],
+                        "quantity": qty,
+                        "quantity_unit": unit,
+                        "base_material_cost": priced["unit_base"][row],
+                        "testing_cost": priced["unit_testing"][row],
+                        "volume_discount_pct": priced["discount_pct"][row],
+                        "total_material_cost": priced["total_material"][row],
+                        "total_testing_cost": priced["total_testing"][row],
+                        "total_cost": priced["total"][row],
+                        "found": True,
+                    })
+                row += 1
 
+            best = top_matches[0]
+            pricing_info = costed[0]
             if pricing_info.get("found"):
                 grand_total += pricing_info["total_cost"]
 
             priced_items.append({
                 "rfp_item": rfp_item,
-                "best_match_sku": sku_id,
+                "best_match_sku": best.get("sku_id", ""),
                 "match_score": best.get("score", 0),
                 "pricing": pricing_info,
+                "alternates": [
+                    {**alt, "match_score": m.get("score", 0)}
+                    for alt, m in zip(costed[1:], top_matches[1:])
+                ],
             })
 
         return {
@@ -112,4 +336,3 @@ class PricingAgent:
             "grand_total": grand_total,
             "currency": "INR"
         }
-
@@ -0,0 +1,214 @@
+import heapq
+import math
+import re
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .sku_index import ATTRIBUTE_WEIGHTS
+from .spec_parser import SKU_FIELD_PARSERS, ParsedSpec, parse_spec, spec_value
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+# filler in tender lines that says nothing about which SKU fits
+_STOPWORDS = frozenset(
+    "a an and as at be by for from in is of on or per rated supply the to with cable cables".split()
+)
+
+# attribute tokens come out of parse_spec already normalized
+# (three-core -> 3, mm² -> sqmm, Cu -> copper), so they count extra
+ATTRIBUTE_TOKEN_BOOST = 3.0
+
+# a candidate no attribute matched must be at least this similar to be
+# returned (keeps test/terms lines from matching arbitrary SKUs)
+MIN_SIMILARITY = 0.3
+
+
+def text_features(text: str, spec: ParsedSpec) -> Dict[str, float]:
+    """
+    Bag of features for one line of text:
+    - normalized attribute tokens ("cores=3") from the parsed spec
+    - words, and character 3-grams of each word (robust to typos and
+      spelling variants like "xple", "alumin", "armored")
+    """
+    features: Dict[str, float] = {}
+    for attr in ATTRIBUTE_WEIGHTS:
+        value = spec_value(spec, attr)
+        if value is not None:
+            key = f"{attr}={value}"
+            features[key] = features.get(key, 0.0) + ATTRIBUTE_TOKEN_BOOST
+
+    for word in _TOKEN.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        key = "w:" + word
+        features[key] = features.get(key, 0.0) + 1.0
+        if len(word) > 3 and not word[0].isdigit():
+            padded = f"<{word}>"
+            for i in range(len(padded) - 2):
+                key = "c:" + padded[i:i + 3]
+                features[key] = features.get(key, 0.0) + 1.0
+    return features
+
+
+def _sku_text(sku: Any) -> str:
+    return f"{sku.cores} core {sku.area_sqmm} sqmm {sku.material} {sku.insulation} {sku.voltage}"
+
+
+class SKURetriever:
+    """
+    Approximate nearest-neighbour retrieval over SKU descriptions:
+    - SKUs with identical attributes share one description ("group");
+      only distinct groups are embedded (a large catalogue has far fewer
+      groups than rows)
+    - TF-IDF over word, char 3-gram and parsed-attribute features,
+      L2-normalized sparse vectors
+    - impact-ordered inverted index: each feature's postings are sorted
+      by weight and a query reads only its strongest terms and the first
+      max_postings entries per term (sublinear in catalogue size)
+    - candidates are re-ranked by the attribute score (ATTRIBUTE_WEIGHTS);
+      similarity breaks ties and ranks lines no attribute matched
+      (those need MIN_SIMILARITY)
+    Built once per catalogue (see agents.catalogue).
+    """
+
+    def __init__(
+        self,
+        skus: Sequence[Any],
+        candidates: int = 32,
+        max_query_terms: int = 32,
+        max_postings: int = 2048,
+    ) -> None:
+        self.candidates = candidates
+        self.max_query_terms = max_query_terms
+        self.max_postings = max_postings
+
+        # 1) group SKUs by their raw attribute tuple
+        group_of: Dict[Tuple[str, ...], int] = {}
+        self.group_positions: List[List[int]] = []
+        self.group_values: List[Dict[str, Any]] = []
+        texts: List[str] = []
+        for position, sku in enumerate(skus):
+            key = tuple(getattr(sku, attr, "") for attr in ATTRIBUTE_WEIGHTS)
+            group = group_of.get(key)
+            if group is None:
+                group = group_of[key] = len(self.group_positions)
+                self.group_positions.append([])
+                self.group_values.append(
+                    {attr: SKU_FIELD_PARSERS[attr](getattr(sku, attr, "")) for attr in ATTRIBUTE_WEIGHTS}
+                )
+                texts.append(_sku_text(sku))
+            self.group_positions[group].append(position)
+
+        # 2) TF-IDF vectors for the groups
+        raw = [
+            text_features(text, self._group_spec(group)) for group, text in enumerate(texts)
+        ]
+        document_frequency: Dict[str, int] = {}
+        for features in raw:
+            for key in features:
+                document_frequency[key] = document_frequency.get(key, 0) + 1
+        n_groups = max(1, len(raw))
+        self.idf = {
+            key: math.log((1 + n_groups) / (1 + df)) + 1.0 for key, df in document_frequency.items()
+        }
+
+        # 3) inverted index, postings sorted by weight (strongest first)
+        postings: Dict[str, List[Tuple[float, int]]] = {}
+        for group, features in enumerate(raw):
+            for key, weight in self._weigh(features).items():
+                postings.setdefault(key, []).append((weight, group))
+        self.postings: Dict[str, List[Tuple[float, int]]] = {
+            key: sorted(entries, key=lambda e: (-e[0], e[1]))[:max_postings] for key, entries in postings.items()
+        }
+        # NumPy copy of the postings: one scatter-add per query term
+        self._np_postings: Dict[str, Tuple[Any, Any]] = {}
+        if NUMPY_AVAILABLE:
+            for key, entries in self.postings.items():
+                self._np_postings[key] = (
+                    np.fromiter((g for _, g in entries), dtype=np.int64, count=len(entries)),
+                    np.fromiter((w for w, _ in entries), dtype=np.float64, count=len(entries)),
+                )
+
+    def _group_spec(self, group: int) -> ParsedSpec:
+        values = self.group_values[group]
+        return ParsedSpec(
+            cores=values["cores"],
+            area_sqmm=values["area_sqmm"],
+            voltage_kv=values["voltage"],
+            insulation=values["insulation"],
+            material=values["material"],
+        )
+
+    def _weigh(self, features: Dict[str, float]) -> Dict[str, float]:
+        weighted = {
+            key: (1.0 + math.log(count)) * self.idf[key]
+            for key, count in features.items()
+            if key in self.idf
+        }
+        norm = math.sqrt(sum(w * w for w in weighted.values())) or 1.0
+        return {key: w / norm for key, w in weighted.items()}
+
+    def nearest_groups(self, spec_line: str, k: int) -> List[Tuple[int, float]]:
+        """
+        Approximate top-k (group, cosine similarity), best first.
+        """
+        query = self._weigh(text_features(spec_line, parse_spec(spec_line)))
+        terms = heapq.nlargest(self.max_query_terms, query.items(), key=lambda kv: kv[1])
+
+        if NUMPY_AVAILABLE and self._np_postings:
+            dense = np.zeros(len(self.group_positions))
+            for key, q_weight in terms:
+                groups, weights = self._np_postings[key]
+                dense[groups] += q_weight * weights
+            hit = np.flatnonzero(dense)
+            if len(hit) > k:
+                hit = hit[np.argpartition(-dense[hit], k - 1)[:k]]
+            scores = dict(zip(hit.tolist(), dense[hit].tolist()))
+        else:
+            scores = {}
+            for key, q_weight in terms:
+                for weight, group in self.postings[key]:
+                    scores[group] = scores.get(group, 0.0) + q_weight * weight
+
+        return heapq.nlargest(k, scores.items(), key=lambda kv: (kv[1], -kv[0]))
+
+    def _attribute_score(self, spec: ParsedSpec, group: int) -> int:
+        values = self.group_values[group]
+        score = 0
+        for attr, weight in ATTRIBUTE_WEIGHTS.items():
+            wanted = spec_value(spec, attr)
+            if wanted is not None and values[attr] == wanted:
+                score += weight
+        return score
+
+    def top_matches(self, spec_line: str, n: int = 3) -> List[Tuple[int, int]]:
+        """
+        Return up to n (sku position, attribute score) pairs, best first:
+        retrieval picks candidate groups, the attribute score re-ranks them.
+        """
+        spec = parse_spec(spec_line)
+        ranked = []
+        for group, similarity in self.nearest_groups(spec_line, self.candidates):
+            score = self._attribute_score(spec, group)
+            if score > 0 or similarity >= MIN_SIMILARITY:
+                ranked.append((-score, -similarity, group))
+        ranked.sort()
+
+        results: List[Tuple[int, int]] = []
+        for neg_score, _, group in ranked:
+            for position in self.group_positions[group]:
+                results.append((position, -neg_score))
+                if len(results) == n:
+                    return results
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "groups": len(self.group_positions),
+            "features": len(self.postings),
+        }
@@ -0,0 +1,58 @@
+import re
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional
+
+
+# "RFP ID: 2025-001", "Due Date: 31-Dec-2025", "Bid Submission Due Date - 15/01/2026"
+_HEADER_FIELDS = {
+    "rfp_id": re.compile(r"^\s*rfp\s*(?:id|no\.?|number)\s*[:\-]\s*(.+?)\s*$", re.IGNORECASE),
+    "title": re.compile(r"^\s*title\s*[:\-]\s*(.+?)\s*$", re.IGNORECASE),
+    "due_date": re.compile(r"^\s*(?:bid\s+submission\s+)?due\s*date\s*[:\-]\s*(.+?)\s*$", re.IGNORECASE),
+}
+
+_DATE_FORMATS = (
+    "%d-%b-%Y",
+    "%d-%B-%Y",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%d.%m.%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+)
+
+
+def parse_due_date(value: Optional[str]) -> Optional[date]:
+    """
+    Parse a due date as written in an RFP ("31-Dec-2025", "2025-12-31",
+    "31/12/2025", "December 31, 2025"). Returns None if unrecognised.
+    """
+    if not value:
+        return None
+    cleaned = value.strip().rstrip(".")
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(cleaned, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def read_header_fields(lines: Iterable[str], max_lines: int = 40) -> Dict[str, str]:
+    """
+    Cheap, LLM-free header scan: looks for RFP ID / Title / Due Date in
+    the first max_lines lines and stops as soon as all three are found.
+    """
+    found: Dict[str, str] = {}
+    for line_no, line in enumerate(lines):
+        if line_no >= max_lines or len(found) == len(_HEADER_FIELDS):
+            break
+        for key, pattern in _HEADER_FIELDS.items():
+            if key in found:
+                continue
+            match = pattern.match(line)
+            if match:
+                found[key] = match.group(1)
+                break
+    return found
@@ -0,0 +1,181 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .ingest import file_sha256
+from .rfp_header import parse_due_date, read_header_fields
+
+
+@dataclass
+class RFPEntry:
+    path: str
+    name: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    rfp_id: Optional[str]
+    title: Optional[str]
+    due_date: Optional[str]  # ISO date, None when missing/unparseable
+
+
+_COLUMNS = "path, name, mtime_ns, size, sha256, rfp_id, title, due_date"
+
+
+class RFPIndex:
+    """
+    Persistent index of the RFP directory (SQLite, next to the LLM cache):
+    - one row per *.txt file: path, mtime, size, content hash and the
+      RFP ID / title / due date read from the header (no LLM)
+    - refresh() is an incremental mtime scan: only stat() for unchanged
+      files, header + hash re-read only for new or modified ones, rows
+      of deleted files dropped; scans closer than min_scan_interval_s
+      apart are skipped
+    - ordering is three range scans of the (due_date, name) index:
+      upcoming due dates, past ones, then undated (no temp sort)
+    """
+
+    def __init__(
+        self,
+        rfp_dir: Path,
+        path: Optional[Path] = None,
+        min_scan_interval_s: float = 1.0,
+    ) -> None:
+        self.rfp_dir = Path(rfp_dir)
+        self.path = path or self.rfp_dir.parent / "cache" / "rfp_index.sqlite"
+        self.min_scan_interval_s = min_scan_interval_s
+        self._lock = threading.Lock()
+        self._last_scan = 0.0
+        self.counters = {"scans": 0, "added": 0, "updated": 0, "removed": 0}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS rfps ("
+            " path TEXT PRIMARY KEY,"
+            " name TEXT NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " sha256 TEXT NOT NULL,"
+            " rfp_id TEXT,"
+            " title TEXT,"
+            " due_date TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS rfps_due ON rfps (due_date, name)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS rfps_rfp_id ON rfps (rfp_id)")
+        self._db.commit()
+
+    def _read_entry(self, path: str, name: str, mtime_ns: int, size: int) -> RFPEntry:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            header = read_header_fields(f)
+        due = parse_due_date(header.get("due_date"))
+        return RFPEntry(
+            path=path,
+            name=name,
+            mtime_ns=mtime_ns,
+            size=size,
+            sha256=file_sha256(path),
+            rfp_id=header.get("rfp_id"),
+            title=header.get("title"),
+            due_date=due.isoformat() if due else None,
+        )
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Bring the index in line with the directory; returns what changed.
+        """
+        changes = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_scan < self.min_scan_interval_s:
+                return changes
+            self._last_scan = now
+            self.counters["scans"] += 1
+
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._db.execute("SELECT path, mtime_ns, size FROM rfps")
+            }
+            seen = set()
+            if self.rfp_dir.is_dir():
+                with os.scandir(self.rfp_dir) as entries:
+                    for dirent in entries:
+                        if not dirent.name.endswith(".txt") or not dirent.is_file():
+                            continue
+                        try:
+                            stat = dirent.stat()
+                            if known.get(dirent.path) == (stat.st_mtime_ns, stat.st_size):
+                                seen.add(dirent.path)
+                                continue
+                            entry = self._read_entry(dirent.path, dirent.name, stat.st_mtime_ns, stat.st_size)
+                        except OSError:
+                            # removed (or unreadable) since the scan: its row is dropped below
+                            continue
+                        seen.add(dirent.path)
+                        self._db.execute(
+                            f"INSERT OR REPLACE INTO rfps ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            tuple(entry.__dict__.values()),
+                        )
+                        changes["updated" if dirent.path in known else "added"] += 1
+
+            removed = [path for path in known if path not in seen]
+            self._db.executemany("DELETE FROM rfps WHERE path = ?", [(path,) for path in removed])
+            changes["removed"] = len(removed)
+            self._db.commit()
+            for key, count in changes.items():
+                self.counters[key] += count
+        return changes
+
+    def ordered(self, today: Optional[date] = None, limit: Optional[int] = None) -> List[RFPEntry]:
+        """
+        Entries by urgency: upcoming due dates (earliest first), then past
+        due dates (earliest first), then RFPs without a readable due date.
+        """
+        self.refresh()
+        today_iso = (today or date.today()).isoformat()
+        # one index range scan per group, each already in (due_date, name) order
+        groups = (
+            ("due_date >= ?", [today_iso]),
+            ("due_date < ?", [today_iso]),
+            ("due_date IS NULL", []),
+        )
+        rows: List[Any] = []
+        with self._lock:
+            for where, params in groups:
+                query = f"SELECT {_COLUMNS} FROM rfps WHERE {where} ORDER BY due_date, name"
+                if limit is not None:
+                    query += " LIMIT ?"
+                    params = params + [limit - len(rows)]
+                rows.extend(self._db.execute(query, params).fetchall())
+                if limit is not None and len(rows) >= limit:
+                    break
+        return [RFPEntry(*row) for row in rows]
+
+    def most_urgent(self, today: Optional[date] = None) -> Optional[RFPEntry]:
+        entries = self.ordered(today, limit=1)
+        return entries[0] if entries else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM rfps").fetchone()
+            return {**self.counters, "entries": count}
+
+
+_default_indexes: Dict[Path, RFPIndex] = {}
+_default_lock = threading.Lock()
+
+
+def default_rfp_index(rfp_dir: Path) -> RFPIndex:
+    """
+    Process-wide index per RFP directory, shared by every SalesAgent.
+    """
+    rfp_dir = Path(rfp_dir).resolve()
+    with _default_lock:
+        index = _default_indexes.get(rfp_dir)
+        if index is None:
+            index = _default_indexes[rfp_dir] = RFPIndex(rfp_dir)
+        return index
@@ -0,0 +1,346 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .payload import dumps
+from .rfp_header import parse_due_date
+
+
+# Kestra's GO / NO-GO rule: GO when the grand total is below this
+DEFAULT_GO_THRESHOLD = float(os.getenv("GO_NO_GO_THRESHOLD", "1500000"))
+
+_SUMMARY_COLUMNS = (
+    "run_id, created_at, rfp_file, rfp_id, title, due_date, grand_total, currency,"
+    " items, priced_items, avg_judge_score, catalogue_version"
+)
+
+# NULL totals (nothing priced) are NO-GO
+_DECISION = "CASE WHEN grand_total < ? THEN 'GO' ELSE 'NO-GO' END"
+
+
+def _project_root() -> Path:
+    # backend/agents/run_history.py -> backend/agents -> backend -> project root
+    backend_dir = Path(__file__).resolve().parent.parent  # /backend
+    return backend_dir.parent  # /hackathon-rfp
+
+
+def _row(run_id: str, created_at: float, result: Dict[str, Any], catalogue_version: str) -> Tuple[Tuple, List[Tuple]]:
+    # one full-run result -> (runs row, run_skus rows)
+    summary = result.get("sales_summary") or {}
+    pricing = result.get("pricing") or {}
+    judged = (result.get("oumi_judgement") or {}).get("judged_items") or []
+
+    due = result.get("due_date_parsed")
+    if due is None:
+        parsed = parse_due_date(summary.get("due_date"))
+        due = parsed.isoformat() if parsed else None
+
+    skus = []
+    for item in pricing.get("priced_items", []):
+        info = item.get("pricing") or {}
+        if info.get("found"):
+            skus.append((run_id, info["sku_id"], item.get("rfp_item", ""), info.get("quantity"), info.get("total_cost")))
+
+    scores = [j["judge_score"] for j in judged if isinstance(j.get("judge_score"), (int, float))]
+    run = (
+        run_id,
+        created_at,
+        result.get("rfp_file"),
+        summary.get("rfp_id"),
+        summary.get("title"),
+        due,
+        pricing.get("grand_total"),
+        pricing.get("currency"),
+        len(pricing.get("priced_items", [])),
+        len(skus),
+        sum(scores) / len(scores) if scores else None,
+        catalogue_version,
+        dumps(result),
+    )
+    return run, skus
+
+
+class RunHistory:
+    """
+    Every full-run result, kept in SQLite for bid analytics:
+    - runs: one row per run (RFP ID, due date, grand total, judge score,
+      full result JSON), indexed on rfp_id, due_date and grand_total
+    - run_skus: the costed best-match SKU of every scope line, indexed
+      on sku_id
+    - record() only queues the result and returns its run id; a writer
+      thread (the only user of the write connection) serializes and
+      inserts queued runs in batched transactions, off the request path
+    - reads flush this process's queue first, so a run is visible once
+      its request has returned
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        batch_size: int = 64,
+        flush_interval_s: float = 0.5,
+        max_pending: int = 10_000,
+    ) -> None:
+        self.path = path or _project_root() / "data" / "history" / "run_history.sqlite"
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        # _start_lock only guards starting the writer; the writer thread
+        # owns the write connection, queries use their own connection
+        self._start_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_pid = 0
+        self._writer: Optional[threading.Thread] = None
+        self._pid = 0
+        self.counters = {"queued": 0, "written": 0, "dropped": 0, "batches": 0, "errors": 0}
+
+    # -------- writing --------
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5.0)
+        # WAL: queries read while the writer commits
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " run_id TEXT PRIMARY KEY,"
+            " created_at REAL NOT NULL,"
+            " rfp_file TEXT,"
+            " rfp_id TEXT,"
+            " title TEXT,"
+            " due_date TEXT,"
+            " grand_total REAL,"
+            " currency TEXT,"
+            " items INTEGER,"
+            " priced_items INTEGER,"
+            " avg_judge_score REAL,"
+            " catalogue_version TEXT,"
+            " result BLOB);"
+            "CREATE INDEX IF NOT EXISTS runs_rfp_id ON runs (rfp_id, created_at);"
+            "CREATE INDEX IF NOT EXISTS runs_due ON runs (due_date);"
+            "CREATE INDEX IF NOT EXISTS runs_total ON runs (grand_total);"
+            "CREATE INDEX IF NOT EXISTS runs_created ON runs (created_at);"
+            "CREATE TABLE IF NOT EXISTS run_skus ("
+            " run_id TEXT NOT NULL,"
+            " sku_id TEXT NOT NULL,"
+            " rfp_item TEXT,"
+            " quantity REAL,"
+            " total_cost REAL);"
+            "CREATE INDEX IF NOT EXISTS run_skus_sku ON run_skus (sku_id, run_id);"
+            "CREATE INDEX IF NOT EXISTS run_skus_run ON run_skus (run_id);"
+        )
+        db.commit()
+        return db
+
+    def _ensure_writer(self) -> None:
+        writer = self._writer
+        if writer is not None and writer.is_alive() and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid != os.getpid():
+                # serve.py forks after import: a worker starts with its
+                # own queue, writer and connections
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                self._writer = None
+                self._pid = os.getpid()
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="run-history-writer", daemon=True)
+                self._writer.start()
+
+    def record(self, result: Dict[str, Any], catalogue_version: str = "") -> Optional[str]:
+        """
+        Queue a full-run result; returns its run id (None when the queue
+        is full and the run was dropped rather than slowing the request).
+        """
+        self._ensure_writer()
+        run_id = uuid.uuid4().hex
+        try:
+            # shallow copy: the caller may still add keys (run_id, timings)
+            self._queue.put_nowait((run_id, time.time(), dict(result), catalogue_version))
+        except queue.Full:
+            self.counters["dropped"] += 1
+            return None
+        self.counters["queued"] += 1
+        return run_id
+
+    def _next_batch(self) -> Tuple[List[Any], bool]:
+        # up to batch_size runs or flush_interval_s, or up to a flush()
+        # marker; True once the None sentinel (close()) is reached
+        first = self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval_s
+        while len(batch) < self.batch_size and not isinstance(batch[-1], threading.Event):
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _write_loop(self) -> None:
+        db = self._connect()
+        try:
+            while True:
+                batch, stop = self._next_batch()
+                try:
+                    self._write(db, [b for b in batch if not isinstance(b, threading.Event)])
+                finally:
+                    # flush() markers: everything queued before them is now handled
+                    for item in batch:
+                        if isinstance(item, threading.Event):
+                            item.set()
+                if stop:
+                    return
+        finally:
+            db.close()
+
+    def _write(self, db: sqlite3.Connection, batch: List[Tuple[str, float, Dict[str, Any], str]]) -> None:
+        if not batch:
+            return
+        try:
+            runs, skus = [], []
+            for run_id, created_at, result, catalogue_version in batch:
+                run, run_skus = _row(run_id, created_at, result, catalogue_version)
+                runs.append(run)
+                skus.extend(run_skus)
+            db.executemany(f"INSERT INTO runs ({_SUMMARY_COLUMNS}, result) VALUES ({','.join('?' * 13)})", runs)
+            db.executemany("INSERT INTO run_skus VALUES (?, ?, ?, ?, ?)", skus)
+            db.commit()
+            self.counters["written"] += len(runs)
+            self.counters["batches"] += 1
+        except Exception:
+            # an unexpected result shape or unserializable value loses this
+            # batch, never the writer thread
+            db.rollback()
+            self.counters["errors"] += 1
+
+    def flush(self, timeout_s: float = 5.0) -> bool:
+        """
+        Wait until every run queued so far is written.
+        """
+        if self._writer is None or self._pid != os.getpid():
+            return True
+        self._ensure_writer()  # a writer that died would never set the marker
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout_s)
+
+    def close(self) -> None:
+        if self._writer is not None and self._pid == os.getpid():
+            self._queue.put(None)
+            self._writer.join(timeout=5.0)
+            self._writer = None
+
+    # -------- queries --------
+
+    def _query(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        self.flush()
+        with self._read_lock:
+            if self._reader is None or self._reader_pid != os.getpid():
+                self._reader = self._connect()
+                self._reader_pid = os.getpid()
+            cursor = self._reader.execute(sql, params)
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def runs(
+        self,
+        rfp_id: Optional[str] = None,
+        sku_id: Optional[str] = None,
+        min_total: Optional[float] = None,
+        max_total: Optional[float] = None,
+        due_from: Optional[str] = None,
+        due_to: Optional[str] = None,
+        threshold: float = DEFAULT_GO_THRESHOLD,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run summaries (newest first, no result JSON) with their GO / NO-GO
+        decision; every filter is an indexed column.
+        """
+        where, params = [], [threshold]
+        if rfp_id is not None:
+            where.append("rfp_id = ?")
+            params.append(rfp_id)
+        if sku_id is not None:
+            where.append("run_id IN (SELECT run_id FROM run_skus WHERE sku_id = ?)")
+            params.append(sku_id)
+        for clause, value in (
+            ("grand_total >= ?", min_total),
+            ("grand_total <= ?", max_total),
+            ("due_date >= ?", due_from),
+            ("due_date <= ?", due_to),
+        ):
+            if value is not None:
+                where.append(clause)
+                params.append(value)
+        params.append(limit)
+        return self._query(
+            f"SELECT {_SUMMARY_COLUMNS}, {_DECISION} AS decision FROM runs"
+            + (" WHERE " + " AND ".join(where) if where else "")
+            + " ORDER BY created_at DESC LIMIT ?",
+            params,
+        )
+
+    def get(self, run_id: str, threshold: float = DEFAULT_GO_THRESHOLD) -> Optional[Dict[str, Any]]:
+        """
+        One run's summary plus "result" (the stored response JSON bytes).
+        """
+        rows = self._query(
+            f"SELECT {_SUMMARY_COLUMNS}, {_DECISION} AS decision, result FROM runs WHERE run_id = ?",
+            [threshold, run_id],
+        )
+        return rows[0] if rows else None
+
+    def decisions(self, threshold: float = DEFAULT_GO_THRESHOLD, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Latest run per RFP with its decision, most urgent due date first.
+        """
+        return self._query(
+            f"SELECT {_SUMMARY_COLUMNS}, {_DECISION} AS decision FROM ("
+            f" SELECT *, ROW_NUMBER() OVER ("
+            "  PARTITION BY COALESCE(rfp_id, rfp_file) ORDER BY created_at DESC) AS latest"
+            " FROM runs)"
+            " WHERE latest = 1"
+            " ORDER BY due_date IS NULL, due_date, rfp_id LIMIT ?",
+            [threshold, limit],
+        )
+
+    def top_skus(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        SKUs by total quoted value across all runs.
+        """
+        return self._query(
+            "SELECT sku_id, COUNT(DISTINCT run_id) AS runs, SUM(quantity) AS quantity,"
+            " SUM(total_cost) AS total_cost"
+            " FROM run_skus GROUP BY sku_id ORDER BY total_cost DESC LIMIT ?",
+            [limit],
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "pending": self._queue.qsize()}
+
+
+_default_history: Optional[RunHistory] = None
+_default_lock = threading.Lock()
+
+
+def default_run_history() -> RunHistory:
+    """
+    Process-wide run history under data/history.
+    """
+    global _default_history
+    with _default_lock:
+        if _default_history is None:
+            _default_history = RunHistory()
+        return _default_history
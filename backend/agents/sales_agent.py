@@ -1,14 +1,34 @@
 import os
 import json
+import asyncio
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional
 from pathlib import Path
 
-from dotenv import load_dotenv
-from groq import Groq
+from .llm import LLMProvider, default_provider
+from .ingest import CHARS_PER_TOKEN, chunk_lines, estimate_tokens, file_sha256, iter_rfp_lines
+from .rfp_header import read_header_fields
+from .rfp_index import RFPIndex, default_rfp_index
+from .summary_cache import SummaryCache, cache_key, default_summary_cache
+from .tracing import traced
 
-# Load .env from project root
-load_dotenv()
+# if this model name errors, check Groq docs and adjust it
+MODEL_NAME = "llama-3.3-70b-versatile"
+
+# Documents above this (estimated) size are summarized map-reduce:
+# chunks of CHUNK_TOKEN_BUDGET are summarized concurrently, then combined.
+SINGLE_PROMPT_TOKEN_BUDGET = 6000
+CHUNK_TOKEN_BUDGET = 3000
+MAP_CONCURRENCY = 4
+
+MAP_PROMPT = """
+Summarize this section of an RFP document in at most 6 short lines.
+Keep any RFP ID, title, due/submission dates, scope of supply items and
+quantities exactly as written. Reply with plain text only.
+
+SECTION:
+{chunk}
+""".strip()
 
 
 @dataclass
@@ -21,40 +41,50 @@ class RFPInfo:
 
 
 class SalesAgent:
-    def __init__(self) -> None:
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise RuntimeError("GROQ_API_KEY is missing in .env")
-        self.client = Groq(api_key=api_key)
+    def __init__(
+        self,
+        cache: Optional[SummaryCache] = None,
+        provider: Optional[LLMProvider] = None,
+        index: Optional[RFPIndex] = None,
+    ) -> None:
+        # Summaries are cached by content (RFP text + prompt + model)
+        self.cache = cache or default_summary_cache()
+        # RFP directory index (default: the shared one over data/rfps)
+        self._index = index
+        # One pooled Groq client per process (or LLM_PROVIDER=replay offline),
+        # resolved on the first summary: listing RFPs needs no GROQ_API_KEY
+        self._provider = provider
+
+    @property
+    def provider(self) -> LLMProvider:
+        if self._provider is None:
+            self._provider = default_provider()
+        return self._provider
 
     def _project_root(self) -> Path:
         # backend/agents/sales_agent.py → backend/agents → backend → project root
         backend_dir = Path(__file__).resolve().parent.parent  # /backend
         return backend_dir.parent  # /hackathon-rfp
 
+    def rfp_index(self) -> RFPIndex:
+        if self._index is not None:
+            return self._index
+        return default_rfp_index(self._project_root() / "data" / "rfps")
+
     def list_available_rfps(self) -> List[str]:
         """
-        Return a list of full paths to .txt RFP files under project-root/data/rfps.
+        Return full paths to .txt RFP files under project-root/data/rfps,
+        most urgent first (see RFPIndex.ordered: upcoming due dates, then
+        past ones, then undated).
         """
-        rfp_dir = self._project_root() / "data" / "rfps"
-        if not rfp_dir.is_dir():
-            return []
-
-        return [
-            str(p)
-            for p in rfp_dir.glob("*.txt")
-        ]
+        return [entry.path for entry in self.rfp_index().ordered()]
 
+    @traced("file_io.read_rfp")
     def _read_rfp_text(self, file_path: str) -> str:
         with open(file_path, "r", encoding="utf-8") as f:
             return f.read()
 
-    def summarize_rfp(self, file_path: str) -> RFPInfo:
-        """
-        Read an RFP file and ask Groq LLM to return structured JSON.
-        """
-        text = self._read_rfp_text(file_path)
-
+    def _build_messages(self, text: str) -> List[Dict[str, str]]:
         prompt = f"""
 You are an assistant that extracts key information from RFP documents.
 
@@ -71,19 +101,12 @@ RFP TEXT:
 {text}
         """.strip()
 
-        # Call Groq chat completions API
-        response = self.client.chat.completions.create(
-            # if this model name errors, check Groq docs and adjust it
-            model="llama-3.3-70b-versatile",
-            messages=[
-                {"role": "system", "content": "You extract structured data from RFPs and always respond in JSON."},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.1,
-        )
-
-        content = response.choices[0].message.content
+        return [
+            {"role": "system", "content": "You extract structured data from RFPs and always respond in JSON."},
+            {"role": "user", "content": prompt},
+        ]
 
+    def _parse_response(self, content: str) -> Dict[str, Any]:
         # Try to parse JSON
         try:
             data = json.loads(content)
@@ -95,7 +118,9 @@ RFP TEXT:
             if not match:
                 raise RuntimeError(f"Could not parse JSON from LLM response: {content}")
             data = json.loads(match.group(0))
+        return data
 
+    def _to_info(self, data: Dict[str, Any], file_path: str) -> RFPInfo:
         return RFPInfo(
             rfp_id=data.get("rfp_id", "UNKNOWN"),
             title=data.get("title", "UNKNOWN"),
@@ -103,3 +128,121 @@ RFP TEXT:
             scope_summary=data.get("scope_summary", ""),
             file_path=file_path,
         )
+
+    async def _acomplete(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> str:
+        response = await self.provider.acomplete(MODEL_NAME, messages, max_tokens=max_tokens)
+        return response.content
+
+    async def _amap_chunks(self, chunks: Iterator[str]) -> List[str]:
+        """
+        Summarize chunks concurrently, at most MAP_CONCURRENCY in flight,
+        pulling the next chunk from the (file-backed) iterator only when
+        there is room. Results keep document order.
+        """
+        partials: Dict[int, str] = {}
+
+        async def summarize_chunk(position: int, chunk: str) -> None:
+            partials[position] = await self._acomplete(
+                [{"role": "user", "content": MAP_PROMPT.format(chunk=chunk)}],
+                max_tokens=300,
+            )
+
+        pending: set = set()
+        count = 0
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                pending.add(asyncio.ensure_future(summarize_chunk(count, chunk)))
+                count += 1
+                if len(pending) >= MAP_CONCURRENCY:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    await asyncio.gather(*done)  # re-raise chunk failures
+
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            # a failed chunk fails the summary: stop the other LLM calls
+            # and retrieve their outcome
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return [partials[i] for i in range(count)]
+
+    async def _asummarize_map_reduce(self, file_path: str) -> Dict[str, Any]:
+        """
+        Map: stream the file in CHUNK_TOKEN_BUDGET chunks and summarize each.
+        Reduce: re-chunk the partial summaries until they fit one prompt,
+        then run the normal extraction prompt over header + summaries.
+        Prompt size and memory stay bounded regardless of document size.
+        """
+        header = await asyncio.to_thread(read_header_fields, iter_rfp_lines(file_path))
+        partials = await self._amap_chunks(chunk_lines(iter_rfp_lines(file_path), CHUNK_TOKEN_BUDGET))
+
+        while len(partials) > 1 and estimate_tokens("\n".join(partials)) > SINGLE_PROMPT_TOKEN_BUDGET:
+            partials = await self._amap_chunks(
+                chunk_lines((p + "\n" for p in partials), CHUNK_TOKEN_BUDGET)
+            )
+
+        header_text = "\n".join(f"{key}: {value}" for key, value in header.items())
+        condensed = f"{header_text}\n\nSECTION SUMMARIES:\n" + "\n---\n".join(partials)
+        return self._parse_response(await self._acomplete(self._build_messages(condensed)))
+
+    @traced("sales.summarize_rfp")
+    def summarize_rfp(self, file_path: str) -> RFPInfo:
+        """
+        Read an RFP file and ask Groq LLM to return structured JSON.
+        Unchanged RFPs are answered from the summary cache.
+        """
+        text = self._read_rfp_text(file_path)
+        messages = self._build_messages(text)
+        key = cache_key(MODEL_NAME, messages)
+
+        data = self.cache.get(key)
+        if data is None:
+            # Call the LLM provider (Groq chat completions by default)
+            response = self.provider.complete(MODEL_NAME, messages)
+            data = self._parse_response(response.content)
+            self.cache.put(key, data)
+
+        return self._to_info(data, file_path)
+
+    @traced("sales.summarize_rfp")
+    async def asummarize_rfp(self, file_path: str, mode: str = "auto") -> RFPInfo:
+        """
+        Async variant of summarize_rfp: the Groq call does not hold a worker
+        thread while waiting on the network.
+        mode: "single" (whole text in one prompt), "map_reduce", or "auto"
+        (map-reduce when the file exceeds SINGLE_PROMPT_TOKEN_BUDGET).
+        """
+        size = await asyncio.to_thread(os.path.getsize, file_path)
+        if mode == "map_reduce" or (
+            mode == "auto" and size // CHARS_PER_TOKEN > SINGLE_PROMPT_TOKEN_BUDGET
+        ):
+            # keyed on file content + the map prompt, without loading the file
+            digest = await asyncio.to_thread(file_sha256, file_path)
+            key = cache_key(MODEL_NAME, [
+                {"role": "map_reduce", "content": f"{digest}:{CHUNK_TOKEN_BUDGET}"},
+                {"role": "user", "content": MAP_PROMPT},
+                *self._build_messages(""),
+            ])
+            data = await asyncio.to_thread(self.cache.get, key)
+            if data is None:
+                data = await self._asummarize_map_reduce(file_path)
+                await asyncio.to_thread(self.cache.put, key, data)
+            return self._to_info(data, file_path)
+
+        text = await asyncio.to_thread(self._read_rfp_text, file_path)
+        messages = self._build_messages(text)
+        key = cache_key(MODEL_NAME, messages)
+
+        # the cache's disk tier is SQLite: keep its reads/commits off the loop
+        data = await asyncio.to_thread(self.cache.get, key)
+        if data is None:
+            data = self._parse_response(await self._acomplete(messages))
+            await asyncio.to_thread(self.cache.put, key, data)
+
+        return self._to_info(data, file_path)
@@ -0,0 +1,134 @@
+import heapq
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .columnar import ColumnarCatalogue
+
+
+Ranked = List[Tuple[int, int]]
+
+
+# -------- shard worker side --------
+
+_shard: Optional["ColumnarCatalogue"] = None
+_shard_offset = 0
+
+
+def _init_shard(snapshot_path: Optional[str], start: int, stop: int, rows: Optional[List[Any]]) -> None:
+    # once per worker: decode the shard's rows from the snapshot (nothing
+    # pickled through the pool) or take the rows handed over at pool start,
+    # and build the shard's columns
+    global _shard, _shard_offset
+    from .columnar import ColumnarCatalogue
+
+    if snapshot_path is not None:
+        from .snapshot import CatalogueSnapshot
+
+        rows = CatalogueSnapshot(Path(snapshot_path)).skus(start, stop)
+    _shard = ColumnarCatalogue(rows or [])
+    _shard_offset = start
+
+
+def _rank_in_shard(lines: List[str], n: int) -> List[Ranked]:
+    # only the lines go in and (global position, score) pairs come out
+    assert _shard is not None, "shard not initialised"
+    return [
+        [(_shard_offset + position, score) for position, score in _shard.top_matches(line, n=n)]
+        for line in lines
+    ]
+
+
+# -------- parent side --------
+
+def _shutdown_pools(pools: List[ProcessPoolExecutor], cancel_futures: bool) -> None:
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=cancel_futures)
+
+
+class ShardedMatcher:
+    """
+    Parallel top-n matching over a catalogue split into contiguous shards:
+    - one persistent single-process pool per shard, initialised once with
+      its rows (decoded from the snapshot when given, so the rows are not
+      pickled to each worker; every worker still holds its own columns)
+    - per call only the scope lines are sent; every shard returns its
+      local top-n and the parent merges them by (score desc, position)
+    Same result as the serial SKUIndex / ColumnarCatalogue rankers (ties
+    keep catalogue order), so it can stand in for them.
+    """
+
+    def __init__(
+        self,
+        skus: Sequence[Any],
+        shards: Optional[int] = None,
+        snapshot_path: Optional[Path] = None,
+    ) -> None:
+        self.size = len(skus)
+        self.shards = max(1, min(shards or os.cpu_count() or 1, max(1, self.size)))
+        bounds = [self.size * i // self.shards for i in range(self.shards + 1)]
+        self.ranges = list(zip(bounds[:-1], bounds[1:]))
+        self._pools: List[ProcessPoolExecutor] = []
+        for start, stop in self.ranges:
+            if snapshot_path is not None:
+                initargs = (str(snapshot_path), start, stop, None)
+            else:
+                initargs = (None, start, stop, list(skus[start:stop]))
+            self._pools.append(
+                ProcessPoolExecutor(max_workers=1, initializer=_init_shard, initargs=initargs)
+            )
+        self._lock = threading.Lock()
+        # a replaced matcher may still be in use by requests holding the
+        # previous warm agent: its pools stop once the last reference goes,
+        # after the calls already submitted have finished
+        self._release = weakref.finalize(self, _shutdown_pools, self._pools, False)
+
+    def top_matches_many(self, lines: List[str], n: int = 3) -> List[Ranked]:
+        if not lines:
+            return []
+        with self._lock:
+            futures = [pool.submit(_rank_in_shard, lines, n) for pool in self._pools]
+        per_shard = [future.result() for future in futures]
+        return [
+            heapq.nsmallest(n, (pair for shard in per_line for pair in shard), key=lambda kv: (-kv[1], kv[0]))
+            for per_line in zip(*per_shard)
+        ]
+
+    def top_matches(self, spec_line: str, n: int = 3) -> Ranked:
+        return self.top_matches_many([spec_line], n)[0]
+
+    def shutdown(self) -> None:
+        self._release.detach()
+        _shutdown_pools(self._pools, cancel_futures=True)
+        self._pools = []
+
+
+_default_matcher: Optional[Tuple[str, ShardedMatcher]] = None
+_default_lock = threading.Lock()
+
+
+def default_sharded_matcher(
+    catalogue: Any, shards: int, snapshot_path: Optional[Path] = None
+) -> ShardedMatcher:
+    """
+    Process-wide matcher for the current catalogue version. On a reload
+    the older matcher is only dropped, not shut down: in-flight requests
+    finish on it and its pools stop when it is released.
+    """
+    global _default_matcher
+    with _default_lock:
+        if _default_matcher is None or _default_matcher[0] != catalogue.version:
+            _default_matcher = (catalogue.version, ShardedMatcher(catalogue.skus, shards, snapshot_path))
+        return _default_matcher[1]
+
+
+def shutdown_default_sharded_matcher() -> None:
+    global _default_matcher
+    with _default_lock:
+        if _default_matcher is not None:
+            _default_matcher[1].shutdown()
+            _default_matcher = None
@@ -0,0 +1,69 @@
+import heapq
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .spec_parser import SKU_FIELD_PARSERS, ParsedSpec, parse_spec, spec_value
+
+
+# Points awarded when a parsed scope-line field equals the SKU's value.
+# Sums to 100 so a score reads as a spec match percentage.
+# TechnicalAgent._score_match, SKUIndex and ColumnarCatalogue all use this table.
+ATTRIBUTE_WEIGHTS: Dict[str, int] = {
+    "cores": 25,
+    "area_sqmm": 25,
+    "voltage": 20,
+    "insulation": 15,
+    "material": 15,
+}
+
+
+class SKUIndex:
+    """
+    Inverted index over the SKU catalogue:
+    - One posting list per parsed attribute value (cores, area, voltage,
+      insulation, material)
+    - A scope line is parsed once (ParsedSpec) and each stated field is a
+      single dict lookup, so only SKUs sharing an attribute are touched
+    - Top-N comes from a bounded heap instead of sorting every candidate
+
+    Scores are identical to TechnicalAgent._score_match.
+    """
+
+    def __init__(self, skus: Sequence[Any]) -> None:
+        self.size = len(skus)
+        # attribute -> parsed value -> SKU positions (ascending)
+        self.postings: Dict[str, Dict[Any, List[int]]] = {
+            attr: {} for attr in ATTRIBUTE_WEIGHTS
+        }
+
+        for position, sku in enumerate(skus):
+            for attr, parse in SKU_FIELD_PARSERS.items():
+                value = parse(getattr(sku, attr, ""))
+                if value is None:
+                    continue
+                self.postings[attr].setdefault(value, []).append(position)
+
+    def score_parsed(self, spec: ParsedSpec) -> Dict[int, int]:
+        """
+        Return {sku position: score} for every SKU with a non-zero score.
+        """
+        scores: Dict[int, int] = {}
+
+        for attr, weight in ATTRIBUTE_WEIGHTS.items():
+            value = spec_value(spec, attr)
+            if value is None:
+                continue
+            for position in self.postings[attr].get(value, ()):
+                scores[position] = scores.get(position, 0) + weight
+
+        return scores
+
+    def score_candidates(self, spec_line: str) -> Dict[int, int]:
+        return self.score_parsed(parse_spec(spec_line))
+
+    def top_matches(self, spec_line: str, n: int = 3) -> List[Tuple[int, int]]:
+        """
+        Return up to n (sku position, score) pairs, best first.
+        Ties keep catalogue order, same as a stable sort over all SKUs.
+        """
+        scores = self.score_candidates(spec_line)
+        return heapq.nlargest(n, scores.items(), key=lambda kv: (kv[1], -kv[0]))
@@ -0,0 +1,320 @@
+"""
+Binary catalogue snapshot: sku.csv + pricing.csv compiled into one file
+that is mapped and decoded instead of parsed as CSV. Loading is faster
+(no CSV parsing, each distinct string decoded once), but skus() and
+pricing() still build per-process Python rows: the mapping itself is
+shared, the decoded catalogue is not.
+
+Layout (little-endian, all sections 8-byte aligned):
+
+    header            HEADER struct (magic, version, counts, source stamps, offsets)
+    sku records       sku_count x "<6I"   string ids: sku_id, cores, area_sqmm,
+                                          insulation, material, voltage
+    pricing records   pricing_count x "<IIdd"   sku_id, currency, base, testing
+    string offsets    (string_count + 1) x "<I" byte offsets into the blob
+    string blob       UTF-8 bytes, each distinct string stored once
+
+Build (from backend/):
+    python -m agents.snapshot build
+"""
+import gc
+import mmap
+import os
+import struct
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .ingest import file_sha256
+from .pricing_agent import PricingRow, load_pricing
+from .technical_agent import SKU, load_skus
+
+
+MAGIC = b"RFPSNAP\x00"
+FORMAT_VERSION = 1
+
+# magic, version, reserved, sku_count, pricing_count, string_count,
+# sku csv (size, mtime_ns, sha256), pricing csv (size, mtime_ns, sha256),
+# offsets of sku records, pricing records, string offsets, string blob
+HEADER = struct.Struct("<8sHHIII qq32s qq32s QQQQ")
+SKU_RECORD = struct.Struct("<6I")
+PRICING_RECORD = struct.Struct("<IIdd")
+
+
+def _project_root() -> Path:
+    # backend/agents/snapshot.py -> backend/agents -> backend -> project root
+    backend_dir = Path(__file__).resolve().parent.parent  # /backend
+    return backend_dir.parent  # /hackathon-rfp
+
+
+def default_paths() -> Tuple[Path, Path, Path]:
+    root = _project_root()
+    return (
+        root / "data" / "sku" / "sku.csv",
+        root / "data" / "pricing" / "pricing.csv",
+        root / "data" / "catalogue.snap",
+    )
+
+
+def _source_stamp(path: Path) -> Tuple[int, int, bytes]:
+    st = os.stat(path)
+    # hashed in blocks: a large CSV is never held in memory
+    return (st.st_size, st.st_mtime_ns, bytes.fromhex(file_sha256(str(path))))
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # bulk row construction only allocates, never creates cycles;
+    # skipping generational GC passes roughly halves decode time
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def build_snapshot(
+    sku_csv: Optional[Path] = None,
+    pricing_csv: Optional[Path] = None,
+    out_path: Optional[Path] = None,
+) -> Path:
+    """
+    Compile the two CSVs into a snapshot file. The file is written next to
+    the target and renamed into place, so running workers keep their old
+    mapping until they reopen. Raises FileNotFoundError naming any missing
+    input CSV.
+    """
+    default_sku, default_pricing, default_out = default_paths()
+    sku_csv = sku_csv or default_sku
+    pricing_csv = pricing_csv or default_pricing
+    out_path = out_path or default_out
+
+    missing = [str(path) for path in (sku_csv, pricing_csv) if not Path(path).is_file()]
+    if missing:
+        raise FileNotFoundError(f"snapshot input not found: {', '.join(missing)}")
+
+    skus = load_skus(sku_csv)
+    pricing = load_pricing(pricing_csv)
+
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        sid = string_ids.get(value)
+        if sid is None:
+            sid = string_ids[value] = len(strings)
+            strings.append(value)
+        return sid
+
+    sku_blob = bytearray()
+    for sku in skus:
+        sku_blob += SKU_RECORD.pack(
+            intern(sku.sku_id),
+            intern(sku.cores),
+            intern(sku.area_sqmm),
+            intern(sku.insulation),
+            intern(sku.material),
+            intern(sku.voltage),
+        )
+
+    pricing_blob = bytearray()
+    for row in pricing.values():
+        pricing_blob += PRICING_RECORD.pack(
+            intern(row.sku_id),
+            intern(row.currency),
+            row.base_material_cost,
+            row.testing_cost,
+        )
+
+    encoded = [s.encode("utf-8") for s in strings]
+    string_offsets = [0]
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    sku_off = _align(HEADER.size)
+    pricing_off = _align(sku_off + len(sku_blob))
+    offsets_off = _align(pricing_off + len(pricing_blob))
+    blob_off = _align(offsets_off + 4 * len(string_offsets))
+
+    sku_size, sku_mtime, sku_hash = _source_stamp(sku_csv)
+    pricing_size, pricing_mtime, pricing_hash = _source_stamp(pricing_csv)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0,
+        len(skus), len(pricing), len(strings),
+        sku_size, sku_mtime, sku_hash,
+        pricing_size, pricing_mtime, pricing_hash,
+        sku_off, pricing_off, offsets_off, blob_off,
+    )
+
+    out = bytearray(blob_off + string_offsets[-1])
+    out[0:HEADER.size] = header
+    out[sku_off:sku_off + len(sku_blob)] = sku_blob
+    out[pricing_off:pricing_off + len(pricing_blob)] = pricing_blob
+    struct.pack_into(f"<{len(string_offsets)}I", out, offsets_off, *string_offsets)
+    out[blob_off:] = b"".join(encoded)
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(out)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+class CatalogueSnapshot:
+    """
+    Read-only view over a mapped snapshot file.
+    Records are unpacked from the mapping into Python rows (a copy per
+    process); each distinct string is decoded once and reused by every
+    row that refers to it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < HEADER.size:
+            raise ValueError("snapshot truncated")
+        (
+            magic, version, _reserved,
+            self.sku_count, self.pricing_count, self.string_count,
+            sku_size, sku_mtime, sku_hash,
+            pricing_size, pricing_mtime, pricing_hash,
+            self._sku_off, self._pricing_off, self._offsets_off, self._blob_off,
+        ) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"unsupported snapshot {magic!r} v{version}")
+
+        self.sources = {
+            "sku": (sku_size, sku_mtime, sku_hash),
+            "pricing": (pricing_size, pricing_mtime, pricing_hash),
+        }
+        self._view = memoryview(self._mm)
+        self._string_offsets = self._view[
+            self._offsets_off:self._offsets_off + 4 * (self.string_count + 1)
+        ].cast("I")
+        self._strings: List[Optional[str]] = [None] * self.string_count
+        self._all_strings: Optional[List[str]] = None
+
+    def string(self, sid: int) -> str:
+        value = self._strings[sid]
+        if value is None:
+            start = self._blob_off + self._string_offsets[sid]
+            end = self._blob_off + self._string_offsets[sid + 1]
+            value = self._strings[sid] = str(self._view[start:end], "utf-8")
+        return value
+
+    def is_fresh(self, sku_csv: Path, pricing_csv: Path) -> bool:
+        """
+        Fresh if each CSV has the recorded size and either the same mtime
+        or (after a touch / checkout) the same content hash.
+        """
+        for key, path in (("sku", sku_csv), ("pricing", pricing_csv)):
+            size, mtime_ns, digest = self.sources[key]
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return False
+            if st.st_size != size:
+                return False
+            if st.st_mtime_ns != mtime_ns and _source_stamp(path)[2] != digest:
+                return False
+        return True
+
+    def strings(self) -> List[str]:
+        """
+        Decode the whole string table (once) for bulk row materialization.
+        """
+        if self._all_strings is None:
+            view, base, offsets = self._view, self._blob_off, self._string_offsets
+            with _gc_paused():
+                self._all_strings = [
+                    str(view[base + offsets[i]:base + offsets[i + 1]], "utf-8")
+                    for i in range(self.string_count)
+                ]
+        return self._all_strings
+
+    def skus(self, start: int = 0, stop: Optional[int] = None) -> List[SKU]:
+        """
+        SKU rows [start, stop) (default: all), decoded from the mapping.
+        """
+        string = self.strings().__getitem__
+        stop = self.sku_count if stop is None else min(stop, self.sku_count)
+        begin = self._sku_off + SKU_RECORD.size * start
+        end = self._sku_off + SKU_RECORD.size * max(start, stop)
+        records = self._view[begin:end]
+        # positional: sku_id, cores, area_sqmm, insulation, material, voltage
+        with _gc_paused():
+            return [SKU(*map(string, record)) for record in SKU_RECORD.iter_unpack(records)]
+
+    def pricing(self) -> Dict[str, PricingRow]:
+        strings = self.strings()
+        end = self._pricing_off + PRICING_RECORD.size * self.pricing_count
+        records = self._view[self._pricing_off:end]
+        with _gc_paused():
+            return {
+                strings[sid]: PricingRow(strings[sid], base, testing, strings[cid])
+                for sid, cid, base, testing in PRICING_RECORD.iter_unpack(records)
+            }
+
+
+_open_lock = threading.Lock()
+_open_snapshots: Dict[Path, Tuple[Tuple[int, int], CatalogueSnapshot]] = {}
+
+
+def open_fresh_snapshot(
+    sku_csv: Optional[Path] = None,
+    pricing_csv: Optional[Path] = None,
+    path: Optional[Path] = None,
+) -> Optional[CatalogueSnapshot]:
+    """
+    Return the mapped snapshot if it exists and matches both CSVs,
+    otherwise None (callers fall back to parsing the CSVs).
+    The mapping is kept per process and reopened when the file is replaced.
+    """
+    default_sku, default_pricing, default_path = default_paths()
+    sku_csv = sku_csv or default_sku
+    pricing_csv = pricing_csv or default_pricing
+    path = path or default_path
+
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_ino)
+
+    with _open_lock:
+        cached = _open_snapshots.get(path)
+        if cached is not None and cached[0] == stamp:
+            snapshot = cached[1]
+        else:
+            try:
+                snapshot = CatalogueSnapshot(path)
+            except (OSError, ValueError, struct.error):
+                return None
+            _open_snapshots[path] = (stamp, snapshot)
+
+    if not snapshot.is_fresh(sku_csv, pricing_csv):
+        return None
+    return snapshot
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        print("usage: python -m agents.snapshot build")
+        sys.exit(2)
+    try:
+        out = build_snapshot()
+    except FileNotFoundError as e:
+        print(f"error: {e}")
+        sys.exit(1)
+    print(f"snapshot written: {out} ({out.stat().st_size} bytes)")
@@ -0,0 +1,197 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ParsedSpec:
+    """
+    Structured attributes of one scope line. None means "not stated".
+    """
+
+    cores: Optional[int] = None
+    area_sqmm: Optional[float] = None
+    voltage_kv: Optional[float] = None
+    insulation: Optional[str] = None
+    material: Optional[str] = None
+    quantity: Optional[float] = None
+    quantity_unit: Optional[str] = None
+
+
+_WORD_NUMBERS = {
+    "single": 1, "one": 1, "two": 2, "twin": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "ten": 10, "twelve": 12,
+}
+
+_NUM = r"\d+(?:\.\d+)?"
+
+# "3 x 1.5 sqmm", "3C x 2.5", "4x10mm2"
+_CORES_X_AREA = re.compile(rf"\b(\d+)\s*c?\s*[x×]\s*({_NUM})\b", re.IGNORECASE)
+# "3 core", "3-core", "3 cores", "3C", "three core"
+_CORES = re.compile(
+    r"\b(\d+|" + "|".join(_WORD_NUMBERS) + r")\s*-?\s*(?:cores?\b|c\b)",
+    re.IGNORECASE,
+)
+# "1.5 sqmm", "1.5 sq mm", "1.5 sq.mm", "2.5mm2", "2.5 mm²"
+_AREA = re.compile(rf"\b({_NUM})\s*(?:sq\.?\s*mm|mm2|mm²|sqmm)", re.IGNORECASE)
+# "0.6/1kV" (take the phase-to-phase rating), "1.1kV", "1100 V"
+_VOLTAGE_PAIR = re.compile(rf"\b{_NUM}\s*/\s*({_NUM})\s*kv\b", re.IGNORECASE)
+_VOLTAGE = re.compile(rf"\b({_NUM})\s*(kv|v)\b", re.IGNORECASE)
+# "500 m", "2 km", "1,000 metres", "4 drums"
+_QUANTITY = re.compile(
+    r"\b(\d[\d,]*(?:\.\d+)?)\s*(km|kms|metres|meters|metre|meter|mtrs|mtr|rm|m|drums|drum|nos|no)\b",
+    re.IGNORECASE,
+)
+
+_INSULATION = {
+    "xlpe": "xlpe",
+    "pvc": "pvc",
+    "epr": "epr",
+    "lszh": "lszh",
+    "hffr": "lszh",
+    "frls": "frls",
+    "rubber": "rubber",
+}
+_MATERIAL = {
+    "copper": "copper",
+    "cu": "copper",
+    "aluminium": "aluminium",
+    "aluminum": "aluminium",
+    "al": "aluminium",
+}
+_WORD = re.compile(r"[a-z]+")
+
+_UNIT_ALIASES = {
+    "km": "km", "kms": "km",
+    "metres": "m", "meters": "m", "metre": "m", "meter": "m", "mtrs": "m", "mtr": "m", "rm": "m", "m": "m",
+    "drums": "drum", "drum": "drum",
+    "nos": "nos", "no": "nos",
+}
+
+
+def _to_number(text: str) -> Optional[float]:
+    try:
+        return float(text.replace(",", ""))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def parse_quantity(line: str) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Just the (quantity, normalized unit) of a scope line; pricing needs
+    nothing else, so it skips the full attribute parse.
+    """
+    match = _QUANTITY.search(line)
+    if not match:
+        return None, None
+    return _to_number(match.group(1)), _UNIT_ALIASES[match.group(2).lower()]
+
+
+@lru_cache(maxsize=65536)
+def parse_spec(line: str) -> ParsedSpec:
+    """
+    Parse a scope line once into a ParsedSpec. Memoized: the same line
+    (common across RFPs) is only tokenized once per process.
+    """
+    cores: Optional[int] = None
+    area: Optional[float] = None
+
+    match = _CORES_X_AREA.search(line)
+    if match:
+        cores = int(match.group(1))
+        area = float(match.group(2))
+
+    if cores is None:
+        match = _CORES.search(line)
+        if match:
+            token = match.group(1).lower()
+            cores = _WORD_NUMBERS.get(token) or int(token)
+
+    if area is None:
+        match = _AREA.search(line)
+        if match:
+            area = float(match.group(1))
+
+    voltage: Optional[float] = None
+    match = _VOLTAGE_PAIR.search(line)
+    if match:
+        voltage = float(match.group(1))
+    else:
+        match = _VOLTAGE.search(line)
+        if match:
+            value = float(match.group(1))
+            voltage = value if match.group(2).lower() == "kv" else round(value / 1000.0, 3)
+
+    insulation: Optional[str] = None
+    material: Optional[str] = None
+    for word in _WORD.findall(line.lower()):
+        if insulation is None and word in _INSULATION:
+            insulation = _INSULATION[word]
+        elif material is None and word in _MATERIAL:
+            material = _MATERIAL[word]
+
+    quantity, unit = parse_quantity(line)
+
+    return ParsedSpec(
+        cores=cores,
+        area_sqmm=area,
+        voltage_kv=voltage,
+        insulation=insulation,
+        material=material,
+        quantity=quantity,
+        quantity_unit=unit,
+    )
+
+
+# -------- SKU side: raw CSV strings -> comparable values --------
+# (few distinct values per column, so these are memoized too)
+
+@lru_cache(maxsize=4096)
+def _sku_cores(value: str) -> Optional[int]:
+    number = _to_number(value.strip()) if value else None
+    return int(number) if number is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _sku_area(value: str) -> Optional[float]:
+    return _to_number(value.strip()) if value else None
+
+
+@lru_cache(maxsize=4096)
+def _sku_voltage(value: str) -> Optional[float]:
+    return parse_spec(value).voltage_kv if value else None
+
+
+@lru_cache(maxsize=4096)
+def _sku_insulation(value: str) -> Optional[str]:
+    return _INSULATION.get(value.strip().lower()) or (value.strip().lower() or None)
+
+
+@lru_cache(maxsize=4096)
+def _sku_material(value: str) -> Optional[str]:
+    return _MATERIAL.get(value.strip().lower()) or (value.strip().lower() or None)
+
+
+# attribute -> parser for the SKU's CSV value; ParsedSpec uses the same
+# field names (voltage is stored as voltage_kv on the spec side)
+SKU_FIELD_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "cores": _sku_cores,
+    "area_sqmm": _sku_area,
+    "insulation": _sku_insulation,
+    "material": _sku_material,
+    "voltage": _sku_voltage,
+}
+
+SPEC_FIELDS: Dict[str, str] = {
+    "cores": "cores",
+    "area_sqmm": "area_sqmm",
+    "insulation": "insulation",
+    "material": "material",
+    "voltage": "voltage_kv",
+}
+
+
+def spec_value(spec: ParsedSpec, attr: str) -> Any:
+    return getattr(spec, SPEC_FIELDS[attr])
@@ -0,0 +1,91 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+# Per-line stages cached by StageStore (the sales summary is per document)
+LINE_STAGES = ("technical", "oumi_judge", "pricing")
+
+
+def line_key(line: str, catalogue_version: str) -> str:
+    """
+    Content address of one scope line's results: the line text plus the
+    catalogue version its matches and prices were computed against.
+    """
+    return hashlib.sha256(f"{catalogue_version}\x00{line}".encode("utf-8")).hexdigest()
+
+
+class StageStore:
+    """
+    Per-stage results of earlier pipeline runs, keyed by content hash:
+    - document stage (sales summary): sha256 of the RFP file
+    - line stages (technical / oumi_judge / pricing): line_key()
+    An amended RFP (corrigendum) only recomputes the summary and the
+    scope lines whose text changed; the rest is merged from here.
+    Bounded LRU per stage, shared by the whole process.
+    """
+
+    def __init__(self, max_documents: int = 1024, max_lines: int = 100_000) -> None:
+        self.max_documents = max_documents
+        self.max_lines = max_lines
+        self._lock = threading.Lock()
+        self._documents: "OrderedDict[str, Any]" = OrderedDict()
+        self._lines: Dict[str, "OrderedDict[str, Any]"] = {stage: OrderedDict() for stage in LINE_STAGES}
+        self.counters = {"hits": 0, "misses": 0}
+
+    def _get(self, table: "OrderedDict[str, Any]", key: str) -> Optional[Any]:
+        with self._lock:
+            if key in table:
+                table.move_to_end(key)
+                self.counters["hits"] += 1
+                return table[key]
+            self.counters["misses"] += 1
+            return None
+
+    def _put(self, table: "OrderedDict[str, Any]", key: str, value: Any, limit: int) -> None:
+        with self._lock:
+            table[key] = value
+            table.move_to_end(key)
+            while len(table) > limit:
+                table.popitem(last=False)
+
+    def get_document(self, doc_hash: str) -> Optional[Any]:
+        return self._get(self._documents, doc_hash)
+
+    def put_document(self, doc_hash: str, value: Any) -> None:
+        self._put(self._documents, doc_hash, value, self.max_documents)
+
+    def get_line(self, stage: str, key: str) -> Optional[Any]:
+        return self._get(self._lines[stage], key)
+
+    def put_line(self, stage: str, key: str, value: Any) -> None:
+        self._put(self._lines[stage], key, value, self.max_lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            for table in self._lines.values():
+                table.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.counters["hits"] + self.counters["misses"]
+            return {
+                **self.counters,
+                "hit_rate": self.counters["hits"] / lookups if lookups else 0.0,
+                "documents": len(self._documents),
+                **{f"{stage}_lines": len(table) for stage, table in self._lines.items()},
+            }
+
+
+_default_store: Optional[StageStore] = None
+_default_store_lock = threading.Lock()
+
+
+def default_stage_store() -> StageStore:
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = StageStore()
+        return _default_store
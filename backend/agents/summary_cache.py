@@ -0,0 +1,157 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _project_root() -> Path:
+    # backend/agents/summary_cache.py -> backend/agents -> backend -> project root
+    backend_dir = Path(__file__).resolve().parent.parent  # /backend
+    return backend_dir.parent  # /hackathon-rfp
+
+
+def cache_key(model: str, messages: List[Dict[str, str]]) -> str:
+    """
+    Content address of one LLM call: model name + full prompt (which
+    already embeds the RFP text and the prompt template).
+    """
+    payload = json.dumps({"model": model, "messages": messages}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """
+    Two-tier cache for LLM summarization results:
+    - memory: LRU of max_entries parsed results
+    - disk: SQLite table (survives restarts), capped at max_disk_entries
+      by least-recent access
+    Entries older than ttl_seconds are treated as misses and dropped.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: int = 256,
+        max_disk_entries: int = 10_000,
+        ttl_seconds: float = 7 * 24 * 3600,
+    ) -> None:
+        self.path = path or _project_root() / "data" / "cache" / "llm_cache.sqlite"
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS summaries_accessed ON summaries (accessed_at)"
+        )
+        self._db.commit()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, created_at: float, value: Dict[str, Any]) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0], now):
+                    self._memory.move_to_end(key)
+                    self.counters["memory_hits"] += 1
+                    return entry[1]
+                del self._memory[key]
+
+            row = self._db.execute(
+                "SELECT value, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                value, created_at = json.loads(row[0]), row[1]
+                if not self._expired(created_at, now):
+                    self._db.execute(
+                        "UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+                    self._db.commit()
+                    self._remember(key, created_at, value)
+                    self.counters["disk_hits"] += 1
+                    return value
+                self._db.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                self._db.commit()
+
+            self.counters["misses"] += 1
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            self._db.execute(
+                "INSERT OR REPLACE INTO summaries (key, value, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now),
+            )
+            # keep the disk tier bounded: drop least recently used rows
+            (count,) = self._db.execute("SELECT COUNT(*) FROM summaries").fetchone()
+            overflow = count - self.max_disk_entries
+            if overflow > 0:
+                self._db.execute(
+                    "DELETE FROM summaries WHERE key IN ("
+                    " SELECT key FROM summaries ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                )
+                self.counters["evictions"] += overflow
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._db.execute("DELETE FROM summaries")
+            self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.counters["memory_hits"] + self.counters["disk_hits"] + self.counters["misses"]
+            hits = self.counters["memory_hits"] + self.counters["disk_hits"]
+            (disk_entries,) = self._db.execute("SELECT COUNT(*) FROM summaries").fetchone()
+            return {
+                **self.counters,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": disk_entries,
+            }
+
+
+_default_cache: Optional[SummaryCache] = None
+_default_lock = threading.Lock()
+
+
+def default_summary_cache() -> SummaryCache:
+    """
+    Process-wide cache shared by every SalesAgent.
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = SummaryCache()
+        return _default_cache
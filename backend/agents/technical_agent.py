@@ -1,8 +1,19 @@
 import csv
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 
+from .columnar import ColumnarCatalogue
+from .match_cache import MatchCache, cache_version, default_match_cache, match_key
+from .retrieval import SKURetriever
+from .sku_index import ATTRIBUTE_WEIGHTS, SKUIndex
+from .spec_parser import SKU_FIELD_PARSERS, parse_spec, spec_value
+from .tracing import traced
+
+if TYPE_CHECKING:
+    from .catalogue import Catalogue
+    from .sharded import ShardedMatcher
+
 
 @dataclass
 class SKU:
@@ -14,16 +25,82 @@ class SKU:
     voltage: str
 
 
+def load_skus(sku_file: Path) -> List[SKU]:
+    """
+    Parse sku.csv into SKU rows. A missing file yields an empty catalogue.
+    """
+    if not sku_file.is_file():
+        return []
+
+    skus: List[SKU] = []
+    with open(sku_file, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            skus.append(
+                SKU(
+                    sku_id=row.get("sku_id", ""),
+                    cores=row.get("cores", ""),
+                    area_sqmm=row.get("area_sqmm", ""),
+                    insulation=row.get("insulation", ""),
+                    material=row.get("material", ""),
+                    voltage=row.get("voltage", ""),
+                )
+            )
+    return skus
+
+
 class TechnicalAgent:
     """
     Simple Technical Agent:
     - Reads SKU data from data/sku/sku.csv
     - Extracts 'Scope of Supply' lines from RFP text
     - Matches each line to SKUs using a basic score
+    - Builds an SKUIndex once so matching only scores candidate SKUs
+    - Optional batched path scores all SKUs at once over a ColumnarCatalogue
+    - Optional retrieval path (retrieval=True): TF-IDF/char-n-gram ANN
+      candidates re-ranked by the attribute score, for messy tender text
+    - Optional sharded path: catalogue shards scored on a process pool
     """
 
-    def __init__(self) -> None:
-        self.skus: List[SKU] = self._load_skus()
+    def __init__(
+        self,
+        catalogue: Optional["Catalogue"] = None,
+        retrieval: bool = False,
+        match_cache: Optional[MatchCache] = None,
+        use_cache: bool = True,
+        sharded: Optional["ShardedMatcher"] = None,
+    ) -> None:
+        self.retrieval = retrieval
+        # process-pool matcher over catalogue shards (see agents.sharded)
+        self.sharded = sharded
+        self.columns: Optional[ColumnarCatalogue] = None
+        self.retriever: Optional[SKURetriever] = None
+        # cross-RFP match cache; needs a catalogue version to key on
+        self.catalogue_version: Optional[str] = catalogue.version if catalogue is not None else None
+        self.match_cache: Optional[MatchCache] = None
+        if use_cache and self.catalogue_version is not None:
+            self.match_cache = match_cache or default_match_cache()
+        if catalogue is not None:
+            # Shared, already-indexed catalogue (see agents.catalogue)
+            self.skus: List[SKU] = catalogue.skus
+            self.index = catalogue.index
+            self.columns = catalogue.columns
+            self.retriever = catalogue.retriever
+        else:
+            self.skus = self._load_skus()
+            self.index = SKUIndex(self.skus)
+
+    def _columnar(self) -> ColumnarCatalogue:
+        # built on first batched call when the agent loaded its own CSV
+        if self.columns is None:
+            self.columns = ColumnarCatalogue(self.skus)
+        return self.columns
+
+    def _retriever(self) -> SKURetriever:
+        # built on first retrieval call when the agent loaded its own CSV
+        if self.retriever is None:
+            self.retriever = SKURetriever(self.skus)
+        return self.retriever
 
     def _project_root(self) -> Path:
         # backend/agents/technical_agent.py -> backend/agents -> backend -> project root
@@ -31,25 +108,13 @@ class TechnicalAgent:
         return backend_dir.parent  # /hackathon-rfp
 
     def _load_skus(self) -> List[SKU]:
-        sku_file = self._project_root() / "data" / "sku" / "sku.csv"
-        if not sku_file.is_file():
-            return []
-
-        skus: List[SKU] = []
-        with open(sku_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                skus.append(
-                    SKU(
-                        sku_id=row.get("sku_id", ""),
-                        cores=row.get("cores", ""),
-                        area_sqmm=row.get("area_sqmm", ""),
-                        insulation=row.get("insulation", ""),
-                        material=row.get("material", ""),
-                        voltage=row.get("voltage", ""),
-                    )
-                )
-        return skus
+        # Prefer the binary snapshot (faster decode); fall back to parsing the CSV
+        from .snapshot import open_fresh_snapshot
+
+        snapshot = open_fresh_snapshot()
+        if snapshot is not None:
+            return snapshot.skus()
+        return load_skus(self._project_root() / "data" / "sku" / "sku.csv")
 
     def _extract_scope_items(self, rfp_text: str) -> List[str]:
         """
@@ -58,22 +123,49 @@ class TechnicalAgent:
         2) If not found, fallback to any line that looks like a cable spec
            (contains 'core' and 'sqmm' or 'cable').
         """
-        lines = rfp_text.splitlines()
+        return self._extract_scope_items_from_lines(rfp_text.splitlines())
+
+    def _extract_scope_items_from_lines(self, lines: Iterable[str]) -> List[str]:
+        """
+        Single-pass version of _extract_scope_items over any line iterator
+        (e.g. an open file). Stops reading as soon as a non-empty scope
+        block ends; spec-like fallback lines are collected on the way in
+        case no scope block is found.
+        """
         items: List[str] = []
+        fallback: List[str] = []
         in_scope = False
+        scope_done = False
 
-        # First pass: try to find a scope block
         for line in lines:
             stripped = line.strip()
             lower = stripped.lower()
 
+            # Fallback candidates: any line that looks like a cable spec
+            if (
+                "core" in lower
+                and ("sqmm" in lower or "sq mm" in lower)
+            ) or "cable" in lower:
+                candidate = stripped
+                if candidate.startswith(("-", "•")):
+                    candidate = candidate.lstrip("-• ").strip()
+                if candidate:
+                    fallback.append(candidate)
+
+            if scope_done:
+                continue
+
             if not in_scope:
                 if "scope of supply" in lower or "scope of work" in lower:
                     in_scope = True
                 continue
 
             if stripped == "" or lower.startswith("testing") or lower.startswith("general"):
-                break
+                if items:
+                    # scope block found and finished: no need to read further
+                    return items
+                scope_done = True
+                continue
 
             if stripped.startswith(("-", "•")):
                 stripped = stripped.lstrip("-• ").strip()
@@ -81,62 +173,98 @@ class TechnicalAgent:
             if stripped:
                 items.append(stripped)
 
-        # Fallback: if nothing found, try to pick 'spec-like' lines
-        if not items:
-            for line in lines:
-                stripped = line.strip()
-                lower = stripped.lower()
-                if (
-                    "core" in lower
-                    and ("sqmm" in lower or "sq mm" in lower)
-                ) or "cable" in lower:
-                    if stripped.startswith(("-", "•")):
-                        stripped = stripped.lstrip("-• ").strip()
-                    if stripped:
-                        items.append(stripped)
-
-        return items
+        return items or fallback
 
     def _score_match(self, spec_line: str, sku: SKU) -> int:
         """
-        Naive matching: check cores, area, insulation, material.
+        Field-by-field match: the line is parsed once into a ParsedSpec
+        (memoized) and compared with the SKU's cores, area, voltage,
+        insulation and material.
         """
-        spec = spec_line.lower()
+        spec = parse_spec(spec_line)
         score = 0
 
-        if sku.cores and sku.cores in spec:
-            score += 30
-        if sku.area_sqmm and sku.area_sqmm in spec:
-            score += 30
-        if sku.insulation and sku.insulation.lower() in spec:
-            score += 20
-        if sku.material and sku.material.lower() in spec:
-            score += 20
+        for attr, weight in ATTRIBUTE_WEIGHTS.items():
+            wanted = spec_value(spec, attr)
+            if wanted is not None and SKU_FIELD_PARSERS[attr](getattr(sku, attr)) == wanted:
+                score += weight
 
         return score
 
-    def match_specs(self, rfp_text: str) -> Dict[str, Any]:
-        items = self._extract_scope_items(rfp_text)
+    def match_specs(self, rfp_text: str, batched: bool = False) -> Dict[str, Any]:
+        """
+        Match every scope line to its top-3 SKUs.
+        batched=True scores the whole catalogue per line in one vectorized
+        pass (ColumnarCatalogue.score_all); results are the same.
+        """
+        return self.match_items(self._extract_scope_items(rfp_text), batched=batched)
+
+    def match_specs_file(self, file_path: str, batched: bool = False) -> Dict[str, Any]:
+        """
+        Same as match_specs, but streams the RFP file line by line instead
+        of reading the whole document into memory.
+        """
+        return self.match_items(self.scope_items_file(file_path), batched=batched)
+
+    @traced("file_io.scope_items")
+    def scope_items_file(self, file_path: str) -> List[str]:
+        """
+        Scope lines of an RFP file, streamed (see _extract_scope_items_from_lines).
+        """
+        with open(file_path, "r", encoding="utf-8") as f:
+            return self._extract_scope_items_from_lines(f)
+
+    def _ranked(self, items: List[str], ranker: Any) -> List[List[Tuple[int, int]]]:
+        """
+        Top-3 (position, score) per item: index lookup (or columnar pass),
+        same result as scoring every SKU with _score_match. Lines whose
+        normalized spec is in the match cache are not scored again.
+        """
+        if self.match_cache is None:
+            return self._rank_many(ranker, items)
+
+        version = cache_version(self.catalogue_version)
+        keys = [match_key(item, version, self.retrieval) for item in items]
+        cached = self.match_cache.get_many(keys)
+        # first line of each uncached key, ranked in one call
+        missing = {key: item for key, item in zip(keys, items) if key not in cached}
+        computed = dict(zip(missing, self._rank_many(ranker, list(missing.values()))))
+        self.match_cache.put_many(computed, version)
+        return [cached[key] if key in cached else computed[key] for key in keys]
+
+    @staticmethod
+    def _rank_many(ranker: Any, items: List[str]) -> List[List[Tuple[int, int]]]:
+        # the sharded matcher takes all lines per round trip
+        many = getattr(ranker, "top_matches_many", None)
+        if many is not None:
+            return many(items, n=3)
+        return [ranker.top_matches(item, n=3) for item in items]
+
+    @traced("technical.match_specs")
+    def match_items(self, items: List[str], batched: bool = False) -> Dict[str, Any]:
         results: List[Dict[str, Any]] = []
+        if self.retrieval:
+            ranker = self._retriever()
+        elif self.sharded is not None:
+            ranker = self.sharded
+        else:
+            ranker = self._columnar() if batched else self.index
 
-        for item in items:
+        for item, ranked in zip(items, self._ranked(items, ranker)):
             scored: List[Dict[str, Any]] = []
-            for sku in self.skus:
-                score = self._score_match(item, sku)
-                if score > 0:
-                    scored.append(
-                        {
-                            "sku_id": sku.sku_id,
-                            "score": score,
-                            "cores": sku.cores,
-                            "area_sqmm": sku.area_sqmm,
-                            "insulation": sku.insulation,
-                            "material": sku.material,
-                            "voltage": sku.voltage,
-                        }
-                    )
-
-            scored = sorted(scored, key=lambda x: x["score"], reverse=True)[:3]
+            for position, score in ranked:
+                sku = self.skus[position]
+                scored.append(
+                    {
+                        "sku_id": sku.sku_id,
+                        "score": score,
+                        "cores": sku.cores,
+                        "area_sqmm": sku.area_sqmm,
+                        "insulation": sku.insulation,
+                        "material": sku.material,
+                        "voltage": sku.voltage,
+                    }
+                )
 
             results.append(
                 {
@@ -0,0 +1,76 @@
+import asyncio
+
+from agents.batch import BatchRunner
+from agents.catalogue import CatalogueStore
+
+
+def _write_catalogue(root, sku_id):
+    (root / "sku.csv").write_text(
+        "sku_id,cores,area_sqmm,insulation,material,voltage\n"
+        f"{sku_id},3,1.5,XLPE,Copper,1kV\n",
+        encoding="utf-8",
+    )
+    (root / "pricing.csv").write_text(
+        f"sku_id,base_material_cost,testing_cost,currency\n{sku_id},100,10,INR\n", encoding="utf-8"
+    )
+
+
+def test_workers_follow_catalogue_reloads(tmp_path):
+    rfp = tmp_path / "rfp.txt"
+    rfp.write_text("RFP ID: A\n\nScope of Supply:\n- 3 core 1.5 sqmm copper XLPE 1kV cable\n", encoding="utf-8")
+    store = CatalogueStore(
+        tmp_path / "sku.csv", tmp_path / "pricing.csv", tmp_path / "catalogue.snap", tmp_path / "tiers.csv"
+    )
+    runner = BatchRunner(max_workers=1)
+    try:
+        _write_catalogue(tmp_path, "OLD-1")
+        version = store.reload().version
+        result = asyncio.run(runner._match(str(rfp), version, store.paths()))
+        assert result["items"][0]["top_matches"][0]["sku_id"] == "OLD-1"
+
+        _write_catalogue(tmp_path, "NEW-1")
+        new_version = store.reload(force=True).version
+        assert new_version != version
+        result = asyncio.run(runner._match(str(rfp), new_version, store.paths()))
+        assert result["items"][0]["top_matches"][0]["sku_id"] == "NEW-1"
+    finally:
+        runner.shutdown()
+
+
+def test_one_failing_rfp_does_not_abort_the_batch(tmp_path, monkeypatch):
+    import agents.batch as batch
+    from agents.oumi_judge_agent import JudgeMemo, OumiJudgeAgent
+    from agents.pricing_agent import PricingAgent
+    from agents.sales_agent import RFPInfo
+
+    class _Sales:
+        async def asummarize_rfp(self, file_path):
+            return RFPInfo("A", "T", "31-Dec-2025", "s", file_path)
+
+    async def match(rfp_file, catalogue_version="", catalogue_paths=None):
+        return {"items": []}
+
+    def header_due_date(rfp_file):
+        if rfp_file.endswith("gone.txt"):
+            raise FileNotFoundError(rfp_file)
+        return "15-Jan-2026"
+
+    runner = BatchRunner(max_workers=1)
+    monkeypatch.setattr(runner, "_match", match)
+    monkeypatch.setattr(batch, "_header_due_date", header_due_date)
+
+    async def collect():
+        return [
+            event async for event in runner.run(
+                [str(tmp_path / "ok.txt"), str(tmp_path / "gone.txt")],
+                sales_agent=_Sales(),
+                pricing_agent=PricingAgent(),
+                judge_agent=OumiJudgeAgent(memo=JudgeMemo(), use_oumi=False),
+            )
+        ]
+
+    events = asyncio.run(collect())
+    by_kind = {e["event"]: e for e in events}
+    assert by_kind["error"]["rfp_file"].endswith("gone.txt")
+    assert by_kind["result"]["due_date_parsed"] == "2026-01-15"
+    assert events[-1]["event"] == "ranking" and events[-1]["errors"] == 1
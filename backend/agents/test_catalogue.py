@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from agents.catalogue import CatalogueStore
+
+
+SKU_HEADER = "sku_id,cores,area_sqmm,insulation,material,voltage\n"
+PRICING_HEADER = "sku_id,base_material_cost,testing_cost,currency\n"
+
+
+def _write(path, text, mtime_ns=None):
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_store_reloads_only_when_content_changes(tmp_path):
+    sku_csv = tmp_path / "sku.csv"
+    pricing_csv = tmp_path / "pricing.csv"
+    _write(sku_csv, SKU_HEADER + "CAB-001,3,1.5,XLPE,Copper,1kV\n")
+    _write(pricing_csv, PRICING_HEADER + "CAB-001,1200,150,INR\n")
+
+    store = CatalogueStore(sku_path=sku_csv, pricing_path=pricing_csv)
+    first = store.get()
+    assert first.stats()["sku_rows"] == 1
+    assert store.get() is first
+
+    # touched, same content: no re-parse
+    _write(sku_csv, SKU_HEADER + "CAB-001,3,1.5,XLPE,Copper,1kV\n", mtime_ns=1_000_000_000)
+    assert store.get() is first
+
+    _write(sku_csv, SKU_HEADER + "CAB-001,3,1.5,XLPE,Copper,1kV\nCAB-002,4,2.5,PVC,Copper,1.1kV\n")
+    second = store.get()
+    assert second is not first
+    assert second.version != first.version
+    assert len(second.skus) == 2
+    # the old snapshot is untouched for requests still holding it
+    assert len(first.skus) == 1
+
+
+def test_snapshot_roundtrip_and_staleness(tmp_path):
+    from agents.pricing_agent import load_pricing
+    from agents.snapshot import build_snapshot, open_fresh_snapshot
+    from agents.technical_agent import load_skus
+
+    sku_csv = tmp_path / "sku.csv"
+    pricing_csv = tmp_path / "pricing.csv"
+    snap = tmp_path / "catalogue.snap"
+    _write(sku_csv, SKU_HEADER + "CAB-001,3,1.5,XLPE,Copper,1kV\nCAB-002,4,2.5,PVC,Copper,1.1kV\n")
+    _write(pricing_csv, PRICING_HEADER + "CAB-001,1200,150,INR\nCAB-002,bad,200,INR\n")
+
+    assert open_fresh_snapshot(sku_csv, pricing_csv, snap) is None
+
+    build_snapshot(sku_csv, pricing_csv, snap)
+    snapshot = open_fresh_snapshot(sku_csv, pricing_csv, snap)
+    assert snapshot is not None
+    assert snapshot.skus() == load_skus(sku_csv)
+    assert snapshot.pricing() == load_pricing(pricing_csv)
+
+    # touched only: still fresh (content hash matches)
+    _write(sku_csv, sku_csv.read_text(encoding="utf-8"), mtime_ns=1_000_000_000)
+    assert open_fresh_snapshot(sku_csv, pricing_csv, snap) is not None
+
+    _write(pricing_csv, PRICING_HEADER + "CAB-001,1300,150,INR\n")
+    assert open_fresh_snapshot(sku_csv, pricing_csv, snap) is None
+
+    store = CatalogueStore(sku_path=sku_csv, pricing_path=pricing_csv, snapshot_path=snap)
+    assert store.get().pricing["CAB-001"].base_material_cost == 1300
+    assert store.stats()["source"] == "csv"
+
+
+def test_snapshot_build_names_missing_inputs(tmp_path):
+    from agents.snapshot import build_snapshot
+
+    sku_csv = tmp_path / "sku.csv"
+    _write(sku_csv, SKU_HEADER + "CAB-001,3,1.5,XLPE,Copper,1kV\n")
+    with pytest.raises(FileNotFoundError, match="pricing.csv"):
+        build_snapshot(sku_csv, tmp_path / "pricing.csv", tmp_path / "catalogue.snap")
+    assert not (tmp_path / "catalogue.snap").exists()
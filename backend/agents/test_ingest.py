@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+from agents import sales_agent as sales_module
+from agents.ingest import chunk_lines, estimate_tokens
+from agents.llm import ReplayProvider
+from agents.summary_cache import SummaryCache
+
+
+def test_chunk_lines_respects_budget():
+    lines = [f"line {i} " * 5 + "\n" for i in range(200)] + ["x" * 500 + "\n"]
+    chunks = list(chunk_lines(iter(lines), max_tokens=50))
+    assert "".join(chunks) == "".join(lines)
+    assert all(estimate_tokens(chunk) <= 51 for chunk in chunks)
+
+
+class _FakeLLM:
+    def __init__(self):
+        self.prompts = []
+
+    def __call__(self, model, messages):
+        self.prompts.append(messages[-1]["content"])
+        if "SECTION SUMMARIES" in messages[-1]["content"]:
+            return json.dumps({"rfp_id": "2025-009", "title": "Big tender",
+                               "due_date": "31-Dec-2025", "scope_summary": "cables"})
+        return "partial summary"
+
+
+def test_map_reduce_summary_keeps_prompts_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(sales_module, "CHUNK_TOKEN_BUDGET", 200)
+    monkeypatch.setattr(sales_module, "SINGLE_PROMPT_TOKEN_BUDGET", 400)
+
+    rfp_file = tmp_path / "big.txt"
+    body = "".join(f"- clause {i}: 3 core 1.5 sqmm copper XLPE cable, 500 m\n" for i in range(2000))
+    rfp_file.write_text("RFP ID: 2025-009\nDue Date: 31-Dec-2025\n\n" + body, encoding="utf-8")
+
+    completions = _FakeLLM()
+    agent = sales_module.SalesAgent(
+        cache=SummaryCache(path=tmp_path / "cache.sqlite"),
+        provider=ReplayProvider(fallback=completions),
+    )
+
+    info = asyncio.run(agent.asummarize_rfp(str(rfp_file)))
+    assert info.rfp_id == "2025-009"
+    assert len(completions.prompts) > 10
+    assert max(estimate_tokens(p) for p in completions.prompts) < 1000
+
+    # second run is a cache hit: no new LLM calls
+    calls = len(completions.prompts)
+    asyncio.run(agent.asummarize_rfp(str(rfp_file)))
+    assert len(completions.prompts) == calls
+
+
+def test_failed_chunk_cancels_the_other_chunk_calls(tmp_path):
+    started, cancelled = [], []
+
+    class FailingProvider:
+        async def acomplete(self, model, messages, max_tokens=None):
+            position = len(started)
+            started.append(position)
+            if position == 0:
+                await asyncio.sleep(0.01)
+                raise RuntimeError("rate limited")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(position)
+                raise
+
+    agent = sales_module.SalesAgent(cache=SummaryCache(path=tmp_path / "cache.sqlite"), provider=FailingProvider())
+    chunks = iter(f"chunk {i}" for i in range(sales_module.MAP_CONCURRENCY))
+
+    async def run():
+        try:
+            await agent._amap_chunks(chunks)
+        except RuntimeError:
+            # already stopped when the failure surfaces, not at loop shutdown
+            return sorted(cancelled)
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=5)) == list(range(1, sales_module.MAP_CONCURRENCY))
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from agents.jobs import CANCELLED, FAILED, SUCCEEDED, JobQueue, JobQueueFull
+
+
+def test_job_runs_in_background_and_keeps_result():
+    async def scenario():
+        queue = JobQueue(workers=1)
+        await queue.start()
+        release = asyncio.Event()
+
+        async def run():
+            await release.wait()
+            return {"grand_total": 42}
+
+        job = queue.submit(run, "rfp.txt")
+        await asyncio.sleep(0)
+        assert job.status in ("queued", "running")
+        release.set()
+        await queue.wait(job, 1.0)
+        await queue.stop()
+        return job
+
+    job = asyncio.run(scenario())
+    assert job.status == SUCCEEDED
+    assert job.result == {"grand_total": 42}
+
+
+def test_full_queue_rejects_and_failures_are_reported():
+    async def scenario():
+        queue = JobQueue(workers=1, max_queued=1)
+        await queue.start()
+        block = asyncio.Event()
+
+        async def slow():
+            await block.wait()
+            return {}
+
+        async def broken():
+            raise ValueError("bad scope line")
+
+        first = queue.submit(slow, "a.txt")
+        await asyncio.sleep(0)  # worker takes the first job
+        second = queue.submit(broken, "b.txt")
+        with pytest.raises(JobQueueFull):
+            queue.submit(slow, "c.txt")
+
+        block.set()
+        await queue.wait(second, 1.0)
+        await queue.stop()
+        return first, second, queue.stats()
+
+    first, second, stats = asyncio.run(scenario())
+    assert first.status == SUCCEEDED
+    assert second.status == FAILED and "bad scope line" in second.error
+    assert stats["rejected"] == 1
+
+
+def test_cancel_queued_and_running_jobs():
+    async def scenario():
+        queue = JobQueue(workers=1)
+        await queue.start()
+        started = asyncio.Event()
+
+        async def forever():
+            started.set()
+            await asyncio.Event().wait()
+
+        running = queue.submit(forever, "a.txt")
+        queued = queue.submit(forever, "b.txt")
+        await started.wait()
+        queue.cancel(queued.id)
+        queue.cancel(running.id)
+        await queue.wait(running, 1.0)
+        await queue.stop()
+        return running, queued
+
+    running, queued = asyncio.run(scenario())
+    assert running.status == CANCELLED
+    assert queued.status == CANCELLED
+
+
+def test_cancelled_queued_jobs_free_their_slot():
+    async def scenario():
+        queue = JobQueue(workers=1, max_queued=1)
+        await queue.start()
+        started = asyncio.Event()
+
+        async def forever():
+            started.set()
+            await asyncio.Event().wait()
+
+        running = queue.submit(forever, "a.txt")
+        await started.wait()
+        waiting = queue.submit(forever, "b.txt")
+        queue.cancel(waiting.id)
+        # the cancelled job is still in the asyncio.Queue but not counted
+        replacement = queue.submit(forever, "c.txt")
+        stats = queue.stats()
+        queue.cancel(running.id)
+        await queue.stop()
+        return replacement, stats
+
+    replacement, stats = asyncio.run(scenario())
+    assert replacement.status != CANCELLED
+    assert stats["queued"] == 1 and stats["rejected"] == 0
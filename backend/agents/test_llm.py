@@ -0,0 +1,123 @@
+import asyncio
+import types
+
+import groq
+import httpx
+import pytest
+
+from agents.llm import GroqProvider, LLMError, RecordingProvider, ReplayProvider
+
+
+MESSAGES = [{"role": "user", "content": "Summarize RFP 2025-001"}]
+
+
+def test_identical_inflight_requests_are_coalesced():
+    calls = []
+
+    def answer(model, messages):
+        calls.append(messages)
+        return "summary"
+
+    provider = ReplayProvider(fallback=answer, latency_s=0.05)
+
+    async def burst():
+        return await asyncio.gather(
+            *(provider.acomplete("m", MESSAGES) for _ in range(5)),
+            provider.acomplete("m", [{"role": "user", "content": "other"}]),
+        )
+
+    responses = asyncio.run(burst())
+    assert [r.content for r in responses] == ["summary"] * 6
+    assert len(calls) == 2
+    assert provider.stats()["coalesced"] == 4
+    assert provider.stats()["in_flight"] == 0
+
+
+def test_cancelled_leader_does_not_cancel_coalesced_followers():
+    provider = ReplayProvider(fallback=lambda model, messages: "summary", latency_s=0.05)
+
+    async def scenario():
+        leader = asyncio.ensure_future(provider.acomplete("m", MESSAGES))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(provider.acomplete("m", MESSAGES))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()).content == "summary"
+    assert provider.stats()["calls"] == 1 and provider.stats()["coalesced"] == 1
+    assert provider.stats()["in_flight"] == 0
+
+
+def test_call_is_cancelled_when_every_caller_gives_up():
+    started, finished = [], []
+
+    class Slow(ReplayProvider):
+        async def _acall(self, model, messages, max_tokens, temperature):
+            started.append(1)
+            await asyncio.sleep(1)
+            finished.append(1)
+
+    provider = Slow()
+
+    async def scenario():
+        callers = [asyncio.ensure_future(provider.acomplete("m", MESSAGES)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    assert started == [1] and finished == []
+    assert provider.stats()["in_flight"] == 0
+
+
+def _rate_limited():
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    response = httpx.Response(429, request=request, headers={"retry-after": "0"})
+    return groq.RateLimitError("rate limited", response=response, body=None)
+
+
+def test_groq_provider_retries_rate_limits(monkeypatch):
+    provider = GroqProvider(api_key="test", backoff_base_s=0.001)
+    attempts = []
+
+    async def create(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise _rate_limited()
+        message = types.SimpleNamespace(content="ok")
+        usage = types.SimpleNamespace(prompt_tokens=10, completion_tokens=2)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)], usage=usage)
+
+    provider.async_client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+    response = asyncio.run(provider.acomplete("m", MESSAGES))
+    assert response.content == "ok" and response.prompt_tokens == 10
+    assert provider.stats()["retries"] == 2
+
+    provider.max_retries = 0
+    attempts.clear()
+    with pytest.raises(groq.RateLimitError):
+        asyncio.run(provider.acomplete("m", MESSAGES))
+
+
+def test_recorded_responses_replay_offline(tmp_path):
+    recording = tmp_path / "llm.jsonl"
+    live = RecordingProvider(ReplayProvider(fallback=lambda model, messages: "live answer"), recording)
+    assert live.complete("m", MESSAGES).content == "live answer"
+
+    offline = ReplayProvider(recording)
+    assert asyncio.run(offline.acomplete("m", MESSAGES)).content == "live answer"
+    with pytest.raises(LLMError):
+        offline.complete("m", [{"role": "user", "content": "never recorded"}])
+
+
+def test_groq_provider_needs_key_only_when_called(monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    provider = GroqProvider()
+    assert provider.stats()["calls"] == 0
+    with pytest.raises(LLMError):
+        provider.complete("m", MESSAGES)
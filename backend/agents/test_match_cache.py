@@ -0,0 +1,60 @@
+from agents.catalogue import CatalogueStore
+from agents import sku_index
+from agents.match_cache import MatchCache, cache_version, match_key
+from agents.technical_agent import TechnicalAgent
+
+
+LINES = [
+    "3 core 1.5 sqmm copper XLPE insulated cable rated for 1kV - 500 m",
+    "Three-core 1.5 mm² Cu XLPE cable, 1 kV - 2 km",
+    "4 core 2.5 sqmm copper PVC cable",
+    "no attributes here",
+]
+
+
+def test_key_normalizes_phrasing_and_carries_catalogue_version():
+    assert match_key(LINES[0], "v1") == match_key(LINES[1], "v1")
+    assert match_key(LINES[0], "v1") != match_key(LINES[0], "v2")
+    assert match_key(LINES[0], "v1") != match_key(LINES[2], "v1")
+    # retrieval sees the words, so phrasing matters there
+    assert match_key(LINES[0], "v1", retrieval=True) != match_key(LINES[1], "v1", retrieval=True)
+
+
+def test_cached_agent_matches_uncached_and_counts_hits(tmp_path):
+    catalogue = CatalogueStore().reload()
+    cache = MatchCache(path=tmp_path / "matches.sqlite")
+    cached = TechnicalAgent(catalogue, match_cache=cache)
+    plain = TechnicalAgent(catalogue, use_cache=False)
+
+    first = cached.match_items(LINES)
+    assert first == plain.match_items(LINES)
+    # lines 0 and 1 share a key: 3 distinct specs computed, 1 repeat in-call
+    assert cache.stats()["misses"] == 3
+
+    assert cached.match_items(LINES) == first
+    stats = cache.stats()
+    assert stats["memory_hits"] == 3 and stats["misses"] == 3
+
+
+def test_persisted_entries_survive_restart_until_catalogue_changes(tmp_path):
+    path = tmp_path / "matches.sqlite"
+    cache = MatchCache(path=path, persist=True)
+    cache.put_many({match_key(LINES[0], "v1"): [(4, 5), (7, 3)]}, "v1")
+
+    restarted = MatchCache(path=path, persist=True)
+    assert restarted.get_many([match_key(LINES[1], "v1")]) == {match_key(LINES[1], "v1"): [(4, 5), (7, 3)]}
+    assert restarted.stats()["disk_hits"] == 1
+
+    # writing for a new catalogue version drops the old rows
+    restarted.put_many({match_key(LINES[2], "v2"): []}, "v2")
+    fresh = MatchCache(path=path, persist=True)
+    assert fresh.get_many([match_key(LINES[0], "v1")]) == {}
+    assert fresh.get_many([match_key(LINES[2], "v2")]) == {match_key(LINES[2], "v2"): []}
+
+
+def test_version_changes_with_the_scorer(monkeypatch):
+    before = cache_version("v1")
+    assert cache_version("v1") == before
+    assert cache_version("v1", top_n=5) != before
+    monkeypatch.setitem(sku_index.ATTRIBUTE_WEIGHTS, "voltage", 30)
+    assert cache_version("v1") != before
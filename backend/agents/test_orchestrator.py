@@ -0,0 +1,120 @@
+import asyncio
+import gc
+import time
+
+import pytest
+
+from agents.oumi_judge_agent import JudgeMemo, OumiJudgeAgent
+from agents.orchestrator import StageError, run_full_pipeline, stream_full_pipeline
+from agents.pricing_agent import PricingAgent
+from agents.sales_agent import RFPInfo
+from agents.technical_agent import TechnicalAgent
+
+
+RFP = """RFP ID: RFP-200
+Scope of Supply:
+- 3 core 1.5 sqmm copper XLPE cable, 1kV - 500 m
+- 4 core 2.5 sqmm copper PVC cable - 2 km
+- 2 core 1.0 sqmm copper XLPE cable - 100 m
+"""
+
+
+class _SlowSales:
+    def __init__(self, release):
+        self.release = release
+
+    async def asummarize_rfp(self, file_path):
+        await self.release.wait()
+        return RFPInfo("RFP-200", "T", "31-Dec-2025", "s", file_path)
+
+
+def test_stream_emits_matches_before_slow_summary_and_matches_full_run(tmp_path):
+    rfp_file = tmp_path / "rfp.txt"
+    rfp_file.write_text(RFP, encoding="utf-8")
+
+    async def scenario():
+        release = asyncio.Event()
+        agents = dict(
+            sales_agent=_SlowSales(release),
+            technical_agent=TechnicalAgent(),
+            pricing_agent=PricingAgent(),
+            judge_agent=OumiJudgeAgent(memo=JudgeMemo(), use_oumi=False),
+        )
+        events = []
+        async for event in stream_full_pipeline(str(rfp_file), chunk_size=2, **agents):
+            events.append(event)
+            if event["event"] == "pricing" and not release.is_set():
+                # the summary is still pending while results already flow
+                assert not any(e["event"] == "sales_summary" for e in events)
+                release.set()
+        full = await run_full_pipeline(str(rfp_file), **agents)
+        return events, full
+
+    events, full = asyncio.run(scenario())
+    kinds = [e["event"] for e in events]
+    assert kinds[0] == "start" and kinds[-1] == "done"
+    assert kinds.count("technical") == 2
+
+    def merged(kind, key):
+        chunks = sorted((e for e in events if e["event"] == kind), key=lambda e: e["offset"])
+        return [item for chunk in chunks for item in chunk[key]]
+
+    assert merged("technical", "items") == full["technical"]["items"]
+    assert merged("oumi_judge", "judged_items") == full["oumi_judgement"]["judged_items"]
+    assert merged("pricing", "priced_items") == full["pricing"]["priced_items"]
+    assert events[-1]["grand_total"] == full["pricing"]["grand_total"]
+
+
+def test_stream_reports_stage_error(tmp_path):
+    class _BrokenPricing(PricingAgent):
+        def price_from_technical_result(self, technical_result):
+            raise ValueError("no price list")
+
+    rfp_file = tmp_path / "rfp.txt"
+    rfp_file.write_text(RFP, encoding="utf-8")
+
+    async def scenario():
+        return [
+            event async for event in stream_full_pipeline(
+                str(rfp_file),
+                sales_agent=_SlowSales(asyncio.Event()),
+                technical_agent=TechnicalAgent(),
+                pricing_agent=_BrokenPricing(),
+                judge_agent=OumiJudgeAgent(memo=JudgeMemo(), use_oumi=False),
+            )
+        ]
+
+    events = asyncio.run(scenario())
+    assert events[-1]["event"] == "error"
+    assert events[-1]["stage"] == "PricingAgent"
+
+
+def test_sales_failure_is_retrieved_when_technical_also_fails(tmp_path):
+    class _BrokenSales:
+        async def asummarize_rfp(self, file_path):
+            raise ValueError("no summary")
+
+    class _BrokenTechnical(TechnicalAgent):
+        def match_specs_file(self, file_path):
+            time.sleep(0.05)  # the sales stage has failed by now
+            raise ValueError("no catalogue")
+
+    rfp_file = tmp_path / "rfp.txt"
+    rfp_file.write_text(RFP, encoding="utf-8")
+    unretrieved = []
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unretrieved.append(context))
+        with pytest.raises(StageError) as failure:
+            await run_full_pipeline(
+                str(rfp_file),
+                sales_agent=_BrokenSales(),
+                technical_agent=_BrokenTechnical(),
+                pricing_agent=PricingAgent(),
+                judge_agent=OumiJudgeAgent(memo=JudgeMemo(), use_oumi=False),
+            )
+        assert failure.value.stage == "TechnicalAgent"
+        gc.collect()  # unretrieved task exceptions are reported on collection
+
+    asyncio.run(scenario())
+    assert unretrieved == []
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import agents.oumi_judge_agent as oumi_judge_agent
+from agents.oumi_judge_agent import JudgeMemo, OumiJudgeAgent
+
+
+def _technical(n, repeat=1):
+    items = [
+        {"rfp_item": f"{i % 4 + 1} core cable line {i}", "top_matches": [{"sku_id": f"CAB-{i:03d}", "score": i}]}
+        for i in range(n)
+    ]
+    return {"items": items * repeat + [{"rfp_item": "nothing", "top_matches": []}]}
+
+
+class _FakeJudge:
+    def __init__(self, packed=True):
+        self.packed = packed
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def score(self, prompt):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        lines = [l for l in prompt.splitlines() if "RFP ITEM:" in l]
+        if len(lines) == 1 or not self.packed:
+            return 70
+        return "\n".join(f"{n}: {60 + n}" for n in range(1, len(lines) + 1))
+
+
+def test_fallback_batched_matches_sequential_and_memoizes():
+    technical = _technical(20, repeat=2)
+    memo = JudgeMemo()
+    agent = OumiJudgeAgent(batch_size=3, max_concurrency=4, memo=memo, use_oumi=False)
+
+    result = agent.evaluate_technical_output(technical)["judged_items"]
+    assert [r.get("judge_score") for r in result] == [i for i in range(20)] * 2 + [0]
+    assert result[-1]["reason"] == "No SKU matches"
+
+    agent.evaluate_technical_output(technical)
+    assert memo.stats()["entries"] == 20
+    assert memo.stats()["hits"] == 20
+
+
+def test_oumi_packs_items_and_bounds_concurrency(monkeypatch):
+    fake = _FakeJudge()
+    monkeypatch.setattr(oumi_judge_agent, "judge", fake, raising=False)
+    agent = OumiJudgeAgent(batch_size=5, max_concurrency=2, memo=JudgeMemo(), use_oumi=True)
+
+    result = agent.evaluate_technical_output(_technical(20))["judged_items"]
+    assert agent.judge_calls == 4
+    assert fake.peak <= 2
+    assert [r["judge_score"] for r in result[:5]] == [61.0, 62.0, 63.0, 64.0, 65.0]
+    assert all(r["oumi_used"] for r in result[:-1])
+
+
+def test_oumi_unparseable_batch_falls_back_per_item(monkeypatch):
+    monkeypatch.setattr(oumi_judge_agent, "judge", _FakeJudge(packed=False), raising=False)
+    agent = OumiJudgeAgent(batch_size=4, max_concurrency=1, memo=JudgeMemo(), use_oumi=True)
+
+    result = agent.evaluate_technical_output(_technical(4))["judged_items"]
+    assert [r["judge_score"] for r in result[:4]] == [70] * 4
+    assert agent.judge_calls == 1 + 4
+
+
+def test_memo_key_follows_the_match():
+    memo = JudgeMemo()
+    agent = OumiJudgeAgent(memo=memo, use_oumi=False)
+    line = "3 core 1.5 sqmm copper XLPE cable"
+
+    before = {"sku_id": "CAB-001", "score": 80, "cores": 3, "insulation": "XLPE"}
+    assert agent.score_pairs([(line, before)]) == [80]
+    # catalogue reload: same SKU id, new attributes and match score
+    after = {"sku_id": "CAB-001", "score": 40, "cores": 4, "insulation": "PVC"}
+    assert agent.score_pairs([(line, after)]) == [40]
+    assert agent.score_pairs([(line, dict(before))]) == [80]
+    assert memo.stats()["hits"] == 1
+
+
+def test_memo_stats_do_not_import_oumi(monkeypatch):
+    monkeypatch.setattr(oumi_judge_agent, "_default_memos", {})
+
+    def fail():
+        raise AssertionError("stats must not probe for Oumi")
+
+    monkeypatch.setattr(oumi_judge_agent, "oumi_available", fail)
+    assert oumi_judge_agent.judge_memo_stats()["entries"] == 0
+
+    oumi_judge_agent.default_judge_memo(False).put(("line", "CAB-001", "[]"), 50)
+    assert oumi_judge_agent.judge_memo_stats()["entries"] == 1
@@ -0,0 +1,50 @@
+import gzip
+import json
+
+from agents.payload import compact_result, dumps, encode_body, project_fields
+
+
+RESULT = {
+    "rfp_file": "rfp1.txt",
+    "technical": {"items": [
+        {"rfp_item": "a", "top_matches": [
+            {"sku_id": "CAB-1", "score": 5, "cores": "3", "area_sqmm": "1.5", "insulation": "XLPE", "material": "Copper", "voltage": "1kV"},
+            {"sku_id": "CAB-2", "score": 3, "cores": "3", "area_sqmm": "2.5", "insulation": "PVC", "material": "Copper", "voltage": "1kV"},
+        ]},
+        {"rfp_item": "b", "top_matches": [
+            {"sku_id": "CAB-1", "score": 4, "cores": "3", "area_sqmm": "1.5", "insulation": "XLPE", "material": "Copper", "voltage": "1kV"},
+        ]},
+    ]},
+    "pricing": {"priced_items": [{"rfp_item": "a", "pricing": {"total_cost": 10.0}}, {"rfp_item": "b", "pricing": None}],
+                "grand_total": 10.0, "currency": "INR"},
+}
+
+
+def test_compact_moves_sku_attributes_to_one_table():
+    compact = compact_result(RESULT)
+    assert compact["technical"]["items"][1]["top_matches"] == [{"sku_id": "CAB-1", "score": 4}]
+    assert sorted(compact["skus"]) == ["CAB-1", "CAB-2"]
+    assert compact["skus"]["CAB-2"]["insulation"] == "PVC"
+    assert compact["pricing"] is RESULT["pricing"]
+    # the input is left alone
+    assert "cores" in RESULT["technical"]["items"][0]["top_matches"][0]
+
+
+def test_fields_projection_walks_lists():
+    projected = project_fields(RESULT, "pricing.grand_total, pricing.priced_items.pricing,rfp_file")
+    assert projected == {
+        "rfp_file": "rfp1.txt",
+        "pricing": {"grand_total": 10.0, "priced_items": [{"pricing": {"total_cost": 10.0}}, {"pricing": None}]},
+    }
+    # a parent path keeps the whole subtree; compact's sku table is kept
+    assert project_fields(RESULT, "pricing,pricing.grand_total")["pricing"] == RESULT["pricing"]
+    assert "skus" in project_fields(compact_result(RESULT), "pricing.grand_total")
+
+
+def test_encode_body_negotiates_and_skips_small_bodies():
+    body = dumps({"items": ["x" * 50] * 100})
+    assert json.loads(body)["items"][0] == "x" * 50
+    encoded, encoding = encode_body(body, "deflate, gzip;q=0.8")
+    assert encoding == "gzip" and gzip.decompress(encoded) == body
+    assert encode_body(body, "gzip;q=0") == (body, None)
+    assert encode_body(b"{}", "gzip") == (b"{}", None)
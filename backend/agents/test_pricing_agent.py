@@ -0,0 +1,83 @@
+import math
+
+from agents.pricing_agent import PriceTable, PricingAgent, PricingRow
+
+
+def _agent(tiers=None):
+    agent = PricingAgent()
+    agent.pricing = {
+        "CAB-001": PricingRow("CAB-001", 100.0, 10.0, "INR"),
+        "CAB-002": PricingRow("CAB-002", 200.0, 20.0, "INR"),
+    }
+    agent.prices = PriceTable(agent.pricing, tiers or [(1000.0, 5.0), (5000.0, 10.0)])
+    return agent
+
+
+def _technical(*items):
+    return {
+        "items": [
+            {"rfp_item": line, "top_matches": [{"sku_id": s, "score": 50} for s in skus]}
+            for line, skus in items
+        ]
+    }
+
+
+def test_quantities_tiers_and_alternates():
+    agent = _agent()
+    result = agent.price_from_technical_result(_technical(
+        ("3 core 1.5 sqmm cable - 500 m", ["CAB-001", "CAB-002"]),
+        ("4 core 2.5 sqmm cable - 2 km", ["CAB-002", "CAB-404"]),
+        ("2 core cable, 3 drums", ["CAB-001"]),
+        ("no quantity stated", []),
+    ))
+    first, second, third, empty = result["priced_items"]
+
+    # 500 m, below the first tier
+    assert first["pricing"]["quantity"] == 500.0
+    assert first["pricing"]["total_cost"] == 500 * 100 + 500 * 10
+    assert first["alternates"][0]["sku_id"] == "CAB-002"
+    assert first["alternates"][0]["total_cost"] == 500 * 200 + 500 * 20
+
+    # 2 km = 2000 m, 5% off material
+    assert second["pricing"]["volume_discount_pct"] == 5.0
+    assert math.isclose(second["pricing"]["total_cost"], 2000 * 200 * 0.95 + 2000 * 20)
+    assert second["alternates"][0]["found"] is False
+
+    # 3 drums of 500 m
+    assert third["pricing"]["quantity"] == 1500.0
+    assert empty["pricing"] is None
+
+    expected = sum(p["pricing"]["total_cost"] for p in (first, second, third))
+    assert math.isclose(result["grand_total"], expected)
+
+
+def test_batched_pricing_matches_price_item(monkeypatch):
+    import agents.pricing_agent as pricing_agent
+
+    for numpy_available in (pricing_agent.NUMPY_AVAILABLE, False):
+        monkeypatch.setattr(pricing_agent, "NUMPY_AVAILABLE", numpy_available)
+        agent = _agent()
+        lines = [(f"cable {q} m", ["CAB-001", "CAB-002"]) for q in (1, 999, 1000, 4999, 5000, 12000)]
+        lines.append(("cable glands 5000 nos", ["CAB-001"]))
+        result = agent.price_from_technical_result(_technical(*lines))
+        for priced in result["priced_items"]:
+            quantity, unit = priced["pricing"]["quantity"], priced["pricing"]["quantity_unit"]
+            expected = agent.price_item(priced["best_match_sku"], quantity, unit)
+            assert math.isclose(priced["pricing"]["total_cost"], expected["total_cost"])
+            assert priced["pricing"]["volume_discount_pct"] == expected["volume_discount_pct"]
+
+
+def test_volume_tiers_apply_to_metres_only(monkeypatch):
+    import agents.pricing_agent as pricing_agent
+
+    for numpy_available in (pricing_agent.NUMPY_AVAILABLE, False):
+        monkeypatch.setattr(pricing_agent, "NUMPY_AVAILABLE", numpy_available)
+        result = _agent().price_from_technical_result(_technical(
+            ("cable glands - 5000 nos", ["CAB-001"]),
+            ("3 core cable - 5000 m", ["CAB-001"]),
+        ))
+        glands, cable = (p["pricing"] for p in result["priced_items"])
+        assert glands["quantity_unit"] == "unit"
+        assert glands["volume_discount_pct"] == 0.0
+        assert glands["total_cost"] == 5000 * 100 + 5000 * 10
+        assert cable["volume_discount_pct"] == 10.0
@@ -0,0 +1,21 @@
+from datetime import date
+
+from agents.rfp_header import parse_due_date, read_header_fields
+
+
+def test_parse_due_date_formats():
+    assert parse_due_date("31-Dec-2025") == date(2025, 12, 31)
+    assert parse_due_date("2026-01-15") == date(2026, 1, 15)
+    assert parse_due_date("05/02/2026") == date(2026, 2, 5)
+    assert parse_due_date("February 5, 2026") == date(2026, 2, 5)
+    assert parse_due_date("UNKNOWN") is None
+    assert parse_due_date(None) is None
+
+
+def test_read_header_fields():
+    text = "RFP ID: 2025-001\nTitle: Supply of Electrical Cables\nDue Date: 31-Dec-2025\n\nScope of Supply:\n"
+    assert read_header_fields(text.splitlines()) == {
+        "rfp_id": "2025-001",
+        "title": "Supply of Electrical Cables",
+        "due_date": "31-Dec-2025",
+    }
@@ -0,0 +1,60 @@
+import os
+from datetime import date
+
+from agents.rfp_index import RFPIndex
+
+
+def _write(path, rfp_id, due):
+    path.write_text(f"RFP ID: {rfp_id}\nTitle: Cables\nDue Date: {due}\n\nScope of Supply:\n- 3 core cable\n", encoding="utf-8")
+
+
+def test_orders_by_urgency_and_tracks_changes(tmp_path):
+    rfp_dir = tmp_path / "rfps"
+    rfp_dir.mkdir()
+    _write(rfp_dir / "a.txt", "A", "15-Jan-2026")
+    _write(rfp_dir / "b.txt", "B", "31-Dec-2025")
+    _write(rfp_dir / "c.txt", "C", "01-Mar-2025")  # already past
+    (rfp_dir / "d.txt").write_text("no header here\n", encoding="utf-8")
+    (rfp_dir / "notes.md").write_text("ignored\n", encoding="utf-8")
+
+    index = RFPIndex(rfp_dir, path=tmp_path / "index.sqlite", min_scan_interval_s=0)
+    today = date(2025, 6, 1)
+    assert [e.rfp_id for e in index.ordered(today)] == ["B", "A", "C", None]
+    assert index.most_urgent(today).name == "b.txt"
+    assert index.stats()["added"] == 4
+
+    # unchanged files are not re-read
+    assert index.refresh() == {"added": 0, "updated": 0, "removed": 0}
+
+    # amended due date, deleted file
+    before = {e.rfp_id: e.sha256 for e in index.ordered(today)}["A"]
+    _write(rfp_dir / "a.txt", "A", "01-Jul-2025")
+    os.utime(rfp_dir / "a.txt", ns=(0, 1))
+    (rfp_dir / "c.txt").unlink()
+    assert index.refresh() == {"added": 0, "updated": 1, "removed": 1}
+    urgent = index.most_urgent(today)
+    assert urgent.rfp_id == "A" and urgent.due_date == "2025-07-01"
+    assert urgent.sha256 != before
+
+    # the index persists across restarts
+    reopened = RFPIndex(rfp_dir, path=tmp_path / "index.sqlite", min_scan_interval_s=0)
+    assert reopened.refresh() == {"added": 0, "updated": 0, "removed": 0}
+    assert [e.rfp_id for e in reopened.ordered(today)] == ["A", "B", None]
+
+
+def test_file_removed_during_scan_is_dropped(tmp_path, monkeypatch):
+    rfp_dir = tmp_path / "rfps"
+    rfp_dir.mkdir()
+    _write(rfp_dir / "a.txt", "A", "15-Jan-2026")
+    _write(rfp_dir / "b.txt", "B", "31-Dec-2025")
+    index = RFPIndex(rfp_dir, path=tmp_path / "index.sqlite", min_scan_interval_s=0)
+    read_entry = index._read_entry
+
+    def vanishing(path, *args):
+        if path.endswith("b.txt"):
+            raise FileNotFoundError(path)
+        return read_entry(path, *args)
+
+    monkeypatch.setattr(index, "_read_entry", vanishing)
+    assert index.refresh() == {"added": 1, "updated": 0, "removed": 0}
+    assert [e.rfp_id for e in index.ordered(date(2025, 6, 1))] == ["A"]
@@ -0,0 +1,59 @@
+from agents.run_history import RunHistory
+
+
+def _result(rfp_id, due, total, skus):
+    return {
+        "rfp_file": f"{rfp_id}.txt",
+        "sales_summary": {"rfp_id": rfp_id, "title": "Cables", "due_date": due, "scope_summary": ""},
+        "technical": {"items": []},
+        "oumi_judgement": {"judged_items": [{"judge_score": 80}, {"judge_score": 60}]},
+        "pricing": {
+            "priced_items": [
+                {"rfp_item": f"line {i}", "pricing": {"sku_id": sku, "found": True, "quantity": 100, "total_cost": cost}}
+                for i, (sku, cost) in enumerate(skus)
+            ] + [{"rfp_item": "unmatched", "pricing": None}],
+            "grand_total": total,
+            "currency": "INR",
+        },
+    }
+
+
+def test_records_in_background_and_queries(tmp_path):
+    history = RunHistory(path=tmp_path / "history.sqlite", flush_interval_s=0.01)
+    first = history.record(_result("A", "15-Jan-2026", 2_000_000, [("CAB-1", 1_500_000), ("CAB-2", 500_000)]), "v1")
+    history.record(_result("B", "31-Dec-2025", 900_000, [("CAB-2", 900_000)]), "v1")
+    latest = history.record(_result("A", "15-Jan-2026", 1_200_000, [("CAB-1", 1_200_000)]), "v1")
+
+    runs = history.runs()
+    assert len(runs) == 3 and runs[0]["run_id"] == latest
+    assert runs[0]["due_date"] == "2026-01-15"
+    assert runs[0]["items"] == 2 and runs[0]["priced_items"] == 1
+    assert runs[0]["avg_judge_score"] == 70
+
+    assert {r["rfp_id"] for r in history.runs(sku_id="CAB-2")} == {"A", "B"}
+    assert [r["run_id"] for r in history.runs(rfp_id="A", min_total=1_500_000)] == [first]
+
+    # latest run per RFP, earliest due date first
+    decisions = history.decisions(threshold=1_500_000)
+    assert [(d["rfp_id"], d["decision"]) for d in decisions] == [("B", "GO"), ("A", "GO")]
+    assert history.decisions(threshold=1_000_000)[1]["decision"] == "NO-GO"
+
+    assert [s["sku_id"] for s in history.top_skus()] == ["CAB-1", "CAB-2"]
+    assert history.get(first)["result"].startswith(b"{")
+    assert history.stats()["written"] == 3
+    history.close()
+
+    # survives a restart
+    assert len(RunHistory(path=tmp_path / "history.sqlite").runs()) == 3
+
+
+def test_bad_result_is_counted_and_writer_keeps_draining(tmp_path):
+    history = RunHistory(path=tmp_path / "history.sqlite", flush_interval_s=0.01)
+    history.record({"pricing": "not a dict"}, "v1")
+    assert history.flush(timeout_s=1.0)
+    assert history.stats()["errors"] == 1
+
+    good = history.record(_result("A", "15-Jan-2026", 1_000, [("CAB-1", 1_000)]), "v1")
+    assert [r["run_id"] for r in history.runs()] == [good]
+    assert history._writer.is_alive()
+    history.close()
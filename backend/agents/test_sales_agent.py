@@ -1,16 +1,30 @@
-from sales_agent import SalesAgent
+from pathlib import Path
 
-def test_list_available_rfps():
-    sales_agent = SalesAgent()
+from agents.rfp_index import RFPIndex
+from agents.sales_agent import SalesAgent
+from agents.summary_cache import SummaryCache
+
+RFP_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "rfps"
+
+def _agent(tmp_path):
+    # index and summary cache under tmp_path, not data/cache
+    return SalesAgent(
+        cache=SummaryCache(path=tmp_path / "llm_cache.sqlite"),
+        index=RFPIndex(RFP_DIR, path=tmp_path / "rfp_index.sqlite"),
+    )
+
+def test_list_available_rfps(tmp_path):
+    sales_agent = _agent(tmp_path)
     available_rfps = sales_agent.list_available_rfps()
     print(available_rfps)
 
-def test_summarize_rfp():
-    sales_agent = SalesAgent()
-    file_path = 'data/rfps/rfp1.txt'
+def test_summarize_rfp(tmp_path):
+    sales_agent = _agent(tmp_path)
+    file_path = str(RFP_DIR / 'rfp1.txt')
     rfp_info = sales_agent.summarize_rfp(file_path)
     print(rfp_info)
 
 if __name__ == '__main__':
-    test_list_available_rfps()
-    test_summarize_rfp()
+    import tempfile
+    test_list_available_rfps(Path(tempfile.mkdtemp()))
+    test_summarize_rfp(Path(tempfile.mkdtemp()))
@@ -0,0 +1,27 @@
+from agents.spec_parser import ParsedSpec, parse_spec
+from agents.technical_agent import SKU, TechnicalAgent
+
+
+def test_parse_demo_line():
+    assert parse_spec("3 core 1.5 sqmm copper XLPE insulated cable rated for 1kV") == ParsedSpec(
+        cores=3, area_sqmm=1.5, voltage_kv=1.0, insulation="xlpe", material="copper"
+    )
+
+
+def test_parse_variants():
+    spec = parse_spec("4C x 2.5 mm2 Cu PVC 0.6/1.1kV, 1,500 m")
+    assert (spec.cores, spec.area_sqmm, spec.voltage_kv) == (4, 2.5, 1.1)
+    assert (spec.material, spec.insulation) == ("copper", "pvc")
+    assert (spec.quantity, spec.quantity_unit) == (1500.0, "m")
+
+    spec = parse_spec("three-core 1.5 sq.mm aluminium armoured, 1100 V, 2 drums")
+    assert (spec.cores, spec.area_sqmm, spec.voltage_kv) == (3, 1.5, 1.1)
+    assert (spec.quantity, spec.quantity_unit) == (2.0, "drum")
+
+
+def test_no_substring_false_matches():
+    # "3" inside "1.5"/"31-Dec" and "1" inside "1.1kV" must not count as cores
+    agent = TechnicalAgent()
+    sku = SKU("CAB-X", cores="3", area_sqmm="1.0", insulation="PVC", material="Copper", voltage="1kV")
+    assert agent._score_match("4 core 31.5 sqmm, due 31-Dec, 1.1kV", sku) == 0
+    assert agent._score_match("3 core 1.0 sqmm copper PVC 1kV", sku) == 100
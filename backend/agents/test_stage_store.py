@@ -0,0 +1,72 @@
+import asyncio
+
+from agents.oumi_judge_agent import JudgeMemo, OumiJudgeAgent
+from agents.orchestrator import run_full_pipeline
+from agents.pricing_agent import PricingAgent
+from agents.sales_agent import RFPInfo
+from agents.stage_store import StageStore
+from agents.technical_agent import TechnicalAgent
+
+
+RFP = """RFP ID: RFP-100
+Scope of Supply:
+- 3 core 1.5 sqmm copper XLPE cable, 1kV - 500 m
+- 4 core 2.5 sqmm copper PVC cable - 2 km
+"""
+
+
+class _FakeSales:
+    def __init__(self):
+        self.calls = 0
+
+    async def asummarize_rfp(self, file_path):
+        self.calls += 1
+        return RFPInfo("RFP-100", "T", "31-Dec-2025", "s", file_path)
+
+
+class _CountingTechnical(TechnicalAgent):
+    matched = []
+
+    def match_items(self, items, batched=False):
+        self.matched.extend(items)
+        return super().match_items(items, batched=batched)
+
+
+def _run(rfp_file, sales, technical, store):
+    return asyncio.run(run_full_pipeline(
+        str(rfp_file),
+        sales_agent=sales,
+        technical_agent=technical,
+        pricing_agent=PricingAgent(),
+        judge_agent=OumiJudgeAgent(memo=JudgeMemo(), use_oumi=False),
+        stage_store=store,
+        catalogue_version="v1",
+    ))
+
+
+def test_amended_rfp_only_recomputes_changed_lines(tmp_path):
+    rfp_file = tmp_path / "rfp.txt"
+    rfp_file.write_text(RFP, encoding="utf-8")
+    sales, technical, store = _FakeSales(), _CountingTechnical(), StageStore()
+
+    first = _run(rfp_file, sales, technical, store)
+    assert first["reuse"]["sales"] == "computed"
+    assert first["reuse"]["technical"] == {"reused": 0, "computed": 2}
+
+    again = _run(rfp_file, sales, technical, store)
+    assert sales.calls == 1
+    assert again["reuse"]["pricing"] == {"reused": 2, "computed": 0}
+    assert {k: again[k] for k in ("technical", "oumi_judgement", "pricing")} == \
+        {k: first[k] for k in ("technical", "oumi_judgement", "pricing")}
+
+    # corrigendum: quantity on line 2 changes
+    technical.matched.clear()
+    rfp_file.write_text(RFP.replace("2 km", "3 km"), encoding="utf-8")
+    amended = _run(rfp_file, sales, technical, store)
+    assert sales.calls == 2
+    assert amended["reuse"]["technical"] == {"reused": 1, "computed": 1}
+    assert technical.matched == ["4 core 2.5 sqmm copper PVC cable - 3 km"]
+
+    full = _run(rfp_file, _FakeSales(), TechnicalAgent(), None)
+    for stage in ("technical", "oumi_judgement", "pricing"):
+        assert amended[stage] == full[stage]
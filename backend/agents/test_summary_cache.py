@@ -0,0 +1,40 @@
+from agents.summary_cache import SummaryCache, cache_key
+
+
+def _messages(text):
+    return [{"role": "user", "content": f"summarize:\n{text}"}]
+
+
+def test_cache_key_covers_text_prompt_and_model():
+    base = cache_key("model-a", _messages("rfp"))
+    assert base == cache_key("model-a", _messages("rfp"))
+    assert base != cache_key("model-b", _messages("rfp"))
+    assert base != cache_key("model-a", _messages("rfp v2"))
+    assert base != cache_key("model-a", [{"role": "user", "content": "other template\nrfp"}])
+
+
+def test_memory_lru_disk_tier_and_ttl(tmp_path):
+    db = tmp_path / "cache.sqlite"
+    cache = SummaryCache(path=db, max_entries=1)
+    cache.put("a", {"rfp_id": "A"})
+    cache.put("b", {"rfp_id": "B"})  # evicts "a" from memory only
+
+    assert cache.get("b") == {"rfp_id": "B"}
+    assert cache.get("a") == {"rfp_id": "A"}
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 1)
+
+    # a fresh process sees the disk tier
+    assert SummaryCache(path=db).get("b") == {"rfp_id": "B"}
+
+    expired = SummaryCache(path=db, ttl_seconds=-1)
+    assert expired.get("b") is None
+    assert expired.stats()["disk_entries"] == 1
+
+
+def test_disk_tier_is_bounded(tmp_path):
+    cache = SummaryCache(path=tmp_path / "cache.sqlite", max_entries=10, max_disk_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"k": key})
+    assert cache.stats()["disk_entries"] == 2
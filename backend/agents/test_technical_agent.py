@@ -0,0 +1,220 @@
+import random
+from pathlib import Path
+
+from agents.technical_agent import SKU, TechnicalAgent
+from agents.sku_index import SKUIndex
+
+
+RFP_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "rfps"
+
+LINES = [
+    "3 core 1.5 sqmm copper XLPE insulated cable rated for 1kV",
+    "4 core 10 sqmm aluminium EPR cable",
+    "2 core 2.5 sqmm PVC, due 31-Dec",
+    "no attributes here",
+]
+
+
+def _random_agent(n=300, seed=7):
+    rng = random.Random(seed)
+    agent = TechnicalAgent()
+    agent.skus = [
+        SKU(
+            sku_id=f"CAB-{i:04d}",
+            cores=rng.choice(["1", "2", "3", "4", ""]),
+            area_sqmm=rng.choice(["1.0", "1.5", "2.5", "4.0", "10"]),
+            insulation=rng.choice(["XLPE", "PVC", "EPR", ""]),
+            material=rng.choice(["Copper", "Aluminium"]),
+            voltage=rng.choice(["1kV", "1.1kV"]),
+        )
+        for i in range(n)
+    ]
+    agent.index = SKUIndex(agent.skus)
+    agent.columns = None
+    return agent
+
+
+def _brute_force_top3(agent, line):
+    scored = []
+    for position, sku in enumerate(agent.skus):
+        score = agent._score_match(line, sku)
+        if score > 0:
+            scored.append((position, score))
+    return sorted(scored, key=lambda x: x[1], reverse=True)[:3]
+
+
+def test_index_matches_brute_force_on_demo_rfps():
+    agent = TechnicalAgent()
+    for rfp_file in sorted(RFP_DIR.glob("*.txt")):
+        text = rfp_file.read_text(encoding="utf-8")
+        for line in agent._extract_scope_items(text):
+            assert agent.index.top_matches(line, n=3) == _brute_force_top3(agent, line)
+
+
+def test_index_matches_brute_force_on_random_catalogue():
+    agent = _random_agent()
+    for line in LINES:
+        assert agent.index.top_matches(line, n=3) == _brute_force_top3(agent, line)
+
+
+def test_batched_path_matches_brute_force(monkeypatch):
+    import agents.columnar as columnar
+
+    for numpy_available in (columnar.NUMPY_AVAILABLE, False):
+        monkeypatch.setattr(columnar, "NUMPY_AVAILABLE", numpy_available)
+        agent = _random_agent()
+        for line in LINES:
+            assert agent._columnar().top_matches(line, n=3) == _brute_force_top3(agent, line)
+
+        text = "Scope of Supply:\n" + "\n".join(f"- {line}" for line in LINES)
+        assert agent.match_specs(text, batched=True) == agent.match_specs(text)
+
+
+def _reference_extract(rfp_text):
+    # the original two-pass extractor, kept here as the oracle
+    lines = rfp_text.splitlines()
+    items = []
+    in_scope = False
+    for line in lines:
+        stripped = line.strip()
+        lower = stripped.lower()
+        if not in_scope:
+            if "scope of supply" in lower or "scope of work" in lower:
+                in_scope = True
+            continue
+        if stripped == "" or lower.startswith("testing") or lower.startswith("general"):
+            break
+        if stripped.startswith(("-", "•")):
+            stripped = stripped.lstrip("-• ").strip()
+        if stripped:
+            items.append(stripped)
+    if not items:
+        for line in lines:
+            stripped = line.strip()
+            lower = stripped.lower()
+            if ("core" in lower and ("sqmm" in lower or "sq mm" in lower)) or "cable" in lower:
+                if stripped.startswith(("-", "•")):
+                    stripped = stripped.lstrip("-• ").strip()
+                if stripped:
+                    items.append(stripped)
+    return items
+
+
+def test_streaming_extractor_matches_reference(tmp_path):
+    agent = TechnicalAgent()
+    texts = [p.read_text(encoding="utf-8") for p in sorted(RFP_DIR.glob("*.txt"))]
+    texts += [
+        "Intro\n- 3 core 1.5 sqmm cable\nNo scope heading here\n• 2 core 1 sq mm",
+        "Scope of Supply:\n\n- 4 core 2.5 sqmm cable after a blank line",
+        "Scope of Work\n- item one\n- item two",
+        "Scope of supply:\n- 3 core 1.5 sqmm XLPE\nGeneral terms\n- cable drums extra",
+    ]
+    for i, text in enumerate(texts):
+        expected = _reference_extract(text)
+        assert agent._extract_scope_items(text) == expected
+
+        rfp_file = tmp_path / f"rfp{i}.txt"
+        rfp_file.write_text(text, encoding="utf-8")
+        assert agent.match_specs_file(str(rfp_file)) == agent.match_items(expected)
+
+
+def test_streaming_extractor_stops_after_scope_block():
+    agent = TechnicalAgent()
+    consumed = []
+
+    def lines():
+        for line in ["Scope of Supply:", "- 3 core 1.5 sqmm", "", "Annex", "- 4 core cable"]:
+            consumed.append(line)
+            yield line
+
+    assert agent._extract_scope_items_from_lines(lines()) == ["3 core 1.5 sqmm"]
+    assert consumed == ["Scope of Supply:", "- 3 core 1.5 sqmm", ""]
+
+
+def test_retrieval_recovers_messy_lines_and_agrees_on_clean_ones():
+    agent = TechnicalAgent()
+    retrieval = TechnicalAgent(retrieval=True)
+
+    clean = "4 core 2.5 sqmm copper PVC insulated cable rated for 1.1kV"
+    assert retrieval.match_items([clean])["items"][0]["top_matches"][0] == \
+        agent.match_items([clean])["items"][0]["top_matches"][0]
+
+    # typos / abbreviations the attribute parser cannot read
+    messy = retrieval.match_items(["3 cor 1.5 sqmm coper xple insulated", "alumnium 2C 1 sq mm xple"])["items"]
+    assert messy[0]["top_matches"][0]["sku_id"] == "CAB-001"
+    assert messy[1]["top_matches"][0]["sku_id"] == "CAB-003"
+
+    # non-cable lines stay unmatched
+    assert retrieval.match_items(["High voltage insulation test"])["items"][0]["top_matches"] == []
+
+
+def test_retrieval_finds_best_attribute_match_on_random_catalogue():
+    agent = _random_agent(n=2000)
+    retrieval = TechnicalAgent(retrieval=True)
+    retrieval.skus = agent.skus
+    for line in LINES[:3]:
+        best = _brute_force_top3(agent, line)[0][1]
+        assert retrieval._retriever().top_matches(line, n=1)[0][1] == best
+
+
+def test_sharded_matcher_matches_serial_ranking():
+    from agents.sharded import ShardedMatcher
+
+    agent = _random_agent(n=500, seed=11)
+    lines = [
+        "3 core 1.5 sqmm copper XLPE 1kV",
+        "2 core 2.5 sqmm PVC",
+        "4 core 10 sqmm aluminium",
+        "no attributes here",
+    ]
+    matcher = ShardedMatcher(agent.skus, shards=3)
+    try:
+        assert matcher.ranges == [(0, 166), (166, 333), (333, 500)]
+        sharded = TechnicalAgent()
+        sharded.skus, sharded.index, sharded.sharded = agent.skus, agent.index, matcher
+        assert sharded.match_items(lines) == agent.match_items(lines)
+    finally:
+        matcher.shutdown()
+
+
+def test_sharded_matcher_reads_rows_from_snapshot(tmp_path):
+    from agents.sharded import ShardedMatcher
+    from agents.snapshot import build_snapshot
+
+    agent = _random_agent(n=200, seed=3)
+    sku_csv, pricing_csv = tmp_path / "sku.csv", tmp_path / "pricing.csv"
+    sku_csv.write_text(
+        "sku_id,cores,area_sqmm,insulation,material,voltage\n"
+        + "".join(f"{s.sku_id},{s.cores},{s.area_sqmm},{s.insulation},{s.material},{s.voltage}\n" for s in agent.skus),
+        encoding="utf-8",
+    )
+    pricing_csv.write_text("sku_id,base_material_cost,testing_cost,currency\n", encoding="utf-8")
+    build_snapshot(sku_csv, pricing_csv, tmp_path / "catalogue.snap")
+
+    matcher = ShardedMatcher(agent.skus, shards=2, snapshot_path=tmp_path / "catalogue.snap")
+    try:
+        for line in LINES:
+            assert matcher.top_matches(line, n=3) == agent.index.top_matches(line, n=3)
+    finally:
+        matcher.shutdown()
+
+
+def test_replaced_sharded_matcher_serves_until_released():
+    import gc
+    import types
+
+    from agents.sharded import default_sharded_matcher, shutdown_default_sharded_matcher
+
+    agent = _random_agent(n=100, seed=5)
+    old = default_sharded_matcher(types.SimpleNamespace(version="v1", skus=agent.skus), shards=2)
+    try:
+        new = default_sharded_matcher(types.SimpleNamespace(version="v2", skus=agent.skus), shards=2)
+        assert new is not old
+        # a request still holding the old matcher is served, not cancelled
+        assert old.top_matches(LINES[0], n=3) == agent.index.top_matches(LINES[0], n=3)
+        pools = list(old._pools)
+        del old
+        gc.collect()
+        assert all(pool._shutdown_thread for pool in pools)
+    finally:
+        shutdown_default_sharded_matcher()
@@ -0,0 +1,68 @@
+import asyncio
+
+from agents.tracing import (
+    STAGE_CANCELLED,
+    STAGE_ERRORS,
+    MetricsRegistry,
+    record_llm_usage,
+    span,
+    start_trace,
+    traced,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    hist = registry.histogram("demo_seconds", "Demo.", ("stage",))
+    for value in (0.0004, 0.003, 0.003, 45.0):
+        hist.observe(value, "match")
+    registry.gauge_callback("demo_hit_rate", "Demo.", lambda: {("summaries",): 0.5}, ("cache",))
+
+    text = registry.render()
+    assert 'demo_seconds_bucket{stage="match",le="0.0005"} 1' in text
+    assert 'demo_seconds_bucket{stage="match",le="0.005"} 3' in text
+    assert 'demo_seconds_bucket{stage="match",le="+Inf"} 4' in text
+    assert 'demo_seconds_count{stage="match"} 4' in text
+    assert 'demo_hit_rate{cache="summaries"} 0.5' in text
+
+
+def test_trace_collects_spans_from_threads_and_tasks():
+    @traced("demo.sync")
+    def work():
+        return 1
+
+    @traced("demo.async")
+    async def awork():
+        await asyncio.to_thread(work)
+        record_llm_usage(7, 3)
+
+    async def request():
+        with start_trace() as trace:
+            with span("demo.outer"):
+                await asyncio.gather(awork(), asyncio.to_thread(work))
+            return trace.summary()
+
+    summary = asyncio.run(request())
+    assert summary["stages"]["demo.sync"]["calls"] == 2
+    assert summary["stages"]["demo.async"]["calls"] == 1
+    assert summary["stages"]["demo.outer"]["calls"] == 1
+    assert summary["llm_tokens"] == {"prompt": 7, "completion": 3}
+
+
+def test_cancelled_span_is_not_an_error():
+    async def stage():
+        with span("demo.cancelled"):
+            await asyncio.sleep(10)
+
+    async def request():
+        with start_trace() as trace:
+            task = asyncio.ensure_future(stage())
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return trace.spans
+
+    spans = asyncio.run(request())
+    assert spans[0].get("cancelled") and "error" not in spans[0]
+    assert STAGE_ERRORS.value("demo.cancelled") == 0
+    assert STAGE_CANCELLED.value("demo.cancelled") == 1
@@ -0,0 +1,285 @@
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Stage latency buckets (seconds): sub-ms index lookups up to multi-second LLM calls
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Monotonic counter with labels (Prometheus "counter").
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}"
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram with labels (Prometheus "histogram").
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> ([count per bucket + overflow], sum, count)
+        self._series: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._series.get(label_values, ([0] * (len(self.buckets) + 1), 0.0, 0))
+            counts[slot] += 1
+            self._series[label_values] = (counts, total + value, count + 1)
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return series[2] if series else 0
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            series = {k: (list(c), s, n) for k, (c, s, n) in self._series.items()}
+        for label_values, (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, label_values, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labels, label_values)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labels, label_values)} {count}"
+
+
+class MetricsRegistry:
+    """
+    Holds counters/histograms plus gauge callbacks (evaluated at scrape
+    time, e.g. cache hit rates) and renders the Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: List[Any] = []
+        self._gauges: List[Tuple[str, str, Callable[[], Dict[LabelValues, float]], Tuple[str, ...]]] = []
+
+    def counter(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help_text, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Histogram:
+        metric = Histogram(name, help_text, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge_callback(
+        self,
+        name: str,
+        help_text: str,
+        collect: Callable[[], Dict[LabelValues, float]],
+        labels: Tuple[str, ...] = (),
+    ) -> None:
+        self._gauges.append((name, help_text, collect, labels))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        for name, help_text, collect, labels in self._gauges:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for label_values, value in sorted(collect().items()):
+                lines.append(f"{name}{_format_labels(labels, label_values)} {_format_value(float(value))}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "rfp_stage_duration_seconds", "Time spent per pipeline stage.", ("stage",)
+)
+HTTP_SECONDS = REGISTRY.histogram(
+    "rfp_http_request_duration_seconds", "End-to-end request latency per route.", ("route",)
+)
+STAGE_ERRORS = REGISTRY.counter(
+    "rfp_stage_errors_total", "Pipeline stage failures.", ("stage",)
+)
+STAGE_CANCELLED = REGISTRY.counter(
+    "rfp_stage_cancelled_total", "Pipeline stages cancelled (client gone, sibling stage failed).", ("stage",)
+)
+LLM_TOKENS = REGISTRY.counter(
+    "rfp_llm_tokens_total", "Tokens reported by the LLM API.", ("kind",)
+)
+LLM_CALLS = REGISTRY.counter(
+    "rfp_llm_calls_total", "LLM completion requests sent.", ()
+)
+
+
+class Trace:
+    """
+    Per-request collector: every span finished while the trace is
+    current is appended here (to_thread workers inherit it) so the
+    response can carry a "timings" block.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self.llm_tokens = {"prompt": 0, "completion": 0}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float, error: bool = False, cancelled: bool = False) -> None:
+        span: Dict[str, Any] = {"stage": stage, "ms": round(seconds * 1000, 3)}
+        if error:
+            span["error"] = True
+        if cancelled:
+            span["cancelled"] = True
+        with self._lock:
+            self.spans.append(span)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            stages: Dict[str, Dict[str, float]] = {}
+            for span in self.spans:
+                entry = stages.setdefault(span["stage"], {"calls": 0, "total_ms": 0.0})
+                entry["calls"] += 1
+                entry["total_ms"] = round(entry["total_ms"] + span["ms"], 3)
+            return {
+                "total_ms": round((time.perf_counter() - self.started) * 1000, 3),
+                "stages": stages,
+                "llm_tokens": dict(self.llm_tokens),
+            }
+
+
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("rfp_trace", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace() -> Iterator[Trace]:
+    trace = Trace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """
+    Time a block into the stage histogram (and the current trace, if any).
+    Cancellation is counted apart from errors: the stream endpoint and
+    _gather_or_cancel cancel healthy stages routinely.
+    """
+    started = time.perf_counter()
+    failed = cancelled = False
+    try:
+        yield
+    except Exception:
+        failed = True
+        STAGE_ERRORS.inc(1.0, stage)
+        raise
+    except asyncio.CancelledError:
+        cancelled = True
+        STAGE_CANCELLED.inc(1.0, stage)
+        raise
+    finally:
+        seconds = time.perf_counter() - started
+        STAGE_SECONDS.observe(seconds, stage)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add(stage, seconds, error=failed, cancelled=cancelled)
+
+
+def traced(stage: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator form of span() for sync and async functions.
+    """
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(stage):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def record_llm_usage(prompt: int, completion: int) -> None:
+    """
+    Count one completion and its token usage (0 if the API did not report it).
+    """
+    LLM_CALLS.inc(1.0)
+    LLM_TOKENS.inc(float(prompt), "prompt")
+    LLM_TOKENS.inc(float(completion), "completion")
+
+    trace = _current_trace.get()
+    if trace is not None:
+        with trace._lock:
+            trace.llm_tokens["prompt"] += prompt
+            trace.llm_tokens["completion"] += completion
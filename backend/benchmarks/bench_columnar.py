@@ -0,0 +1,66 @@
+"""
+Columnar scoring benchmark.
+
+Compares the original per-SKU _score_match loop against
+ColumnarCatalogue.score_all on a synthetic catalogue, and reports
+memory per SKU for the dataclass rows vs the columnar buffers.
+
+Usage (from backend/):
+    python -m benchmarks.bench_columnar --skus 200000
+"""
+import argparse
+import sys
+import time
+
+from agents.columnar import NUMPY_AVAILABLE, ColumnarCatalogue
+from agents.technical_agent import TechnicalAgent
+from benchmarks.synthetic import synthetic_skus
+
+
+LINES = [
+    "3 core 1.5 sqmm copper XLPE insulated cable rated for 1kV",
+    "4 core 2.5 sqmm copper PVC insulated cable rated for 1.1kV",
+    "2 core 1.0 sqmm aluminium XLPE insulated cable rated for 1kV",
+]
+
+
+def dataclass_bytes(skus) -> int:
+    total = sys.getsizeof(skus)
+    for sku in skus:
+        total += sys.getsizeof(sku) + sys.getsizeof(sku.__dict__)
+        total += sum(sys.getsizeof(v) for v in sku.__dict__.values())
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skus", type=int, default=100_000)
+    args = parser.parse_args()
+
+    skus = synthetic_skus(args.skus)
+    agent = TechnicalAgent()
+    columns = ColumnarCatalogue(skus)
+
+    started = time.perf_counter()
+    for line in LINES:
+        loop_scores = [agent._score_match(line, sku) for sku in skus]
+    loop_seconds = (time.perf_counter() - started) / len(LINES)
+
+    started = time.perf_counter()
+    for line in LINES:
+        batch_scores = columns.score_all(line)
+    batch_seconds = (time.perf_counter() - started) / len(LINES)
+
+    assert list(batch_scores) == loop_scores
+
+    print(f"SKUs:                    {args.skus}")
+    print(f"numpy:                   {NUMPY_AVAILABLE}")
+    print(f"_score_match loop:       {loop_seconds * 1000:.1f} ms/line")
+    print(f"score_all (columnar):    {batch_seconds * 1000:.1f} ms/line")
+    print(f"speedup:                 {loop_seconds / batch_seconds:.1f}x")
+    print(f"dataclass bytes/SKU:     {dataclass_bytes(skus) / len(skus):.0f}")
+    print(f"columnar bytes/SKU:      {columns.bytes_per_sku():.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Bulk pricing benchmark.
+
+Prices a synthetic BOQ (every line with three costed alternates) through
+PricingAgent.price_from_technical_result and reports items/second.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pricing --items 50000
+"""
+import argparse
+import random
+import time
+
+from agents.pricing_agent import NUMPY_AVAILABLE, PriceTable, PricingAgent, PricingRow
+
+
+UNITS = ["m", "metres", "km", "drums", "nos"]
+
+
+def synthetic_boq(n: int, skus: int, seed: int = 42):
+    rng = random.Random(seed)
+    return {
+        "items": [
+            {
+                "rfp_item": f"{rng.choice([2, 3, 4])} core {rng.choice(['1.5', '2.5', '4'])} sqmm cable"
+                            f" - {rng.randint(1, 9000)} {rng.choice(UNITS)}",
+                "top_matches": [
+                    {"sku_id": f"CAB-{rng.randrange(skus):06d}", "score": 100 - 10 * k}
+                    for k in range(3)
+                ],
+            }
+            for _ in range(n)
+        ]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--skus", type=int, default=10_000)
+    args = parser.parse_args()
+
+    agent = PricingAgent()
+    agent.pricing = {
+        f"CAB-{i:06d}": PricingRow(f"CAB-{i:06d}", 100.0 + i % 900, 10.0 + i % 50, "INR")
+        for i in range(args.skus)
+    }
+    agent.prices = PriceTable(agent.pricing, [(1000.0, 2.0), (5000.0, 5.0), (20000.0, 8.0)])
+    boq = synthetic_boq(args.items, args.skus)
+
+    started = time.perf_counter()
+    result = agent.price_from_technical_result(boq)
+    seconds = time.perf_counter() - started
+
+    print(f"items:                   {args.items} (x3 alternates)")
+    print(f"numpy:                   {NUMPY_AVAILABLE}")
+    print(f"price_from_technical:    {seconds * 1000:.1f} ms")
+    print(f"items/second:            {args.items / seconds:,.0f}")
+    print(f"grand_total:             {result['grand_total']:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Catalogue load benchmark: csv.DictReader vs decoding the binary snapshot.
+
+Usage (from backend/):
+    python -m benchmarks.bench_snapshot --skus 200000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from agents.pricing_agent import load_pricing
+from agents.snapshot import CatalogueSnapshot, build_snapshot
+from agents.technical_agent import load_skus
+from benchmarks.synthetic import write_csvs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skus", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sku_csv, pricing_csv = write_csvs(Path(tmp), args.skus)
+        snap = build_snapshot(sku_csv, pricing_csv, Path(tmp) / "catalogue.snap")
+
+        started = time.perf_counter()
+        skus = load_skus(sku_csv)
+        pricing = load_pricing(pricing_csv)
+        csv_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        snapshot = CatalogueSnapshot(snap)
+        open_seconds = time.perf_counter() - started
+        snap_skus = snapshot.skus()
+        snap_pricing = snapshot.pricing()
+        snap_seconds = time.perf_counter() - started
+
+        assert snap_skus == skus and snap_pricing == pricing
+
+        print(f"SKUs:                  {args.skus}")
+        print(f"snapshot size:         {snap.stat().st_size / 1e6:.1f} MB")
+        print(f"CSV parse:             {csv_seconds * 1000:.0f} ms")
+        print(f"snapshot mmap open:    {open_seconds * 1000:.2f} ms")
+        print(f"snapshot full decode:  {snap_seconds * 1000:.0f} ms")
+        print(f"speedup:               {csv_seconds / snap_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Cold-start profile of the backend (no network, no Groq key).
+
+Starts a fresh interpreter the way a scale-to-zero / serverless platform
+would and reports:
+- import_main_s: `import main` (with the slowest top-level imports, from
+  python -X importtime)
+- startup_s: lifespan startup (what runs before the first request is served)
+- first_health_s: process spawn -> first /health response
+- first_technical_s: the first request that needs the catalogue
+
+Usage (from backend/):
+    python -m benchmarks.cold_start
+    python -m benchmarks.cold_start --skus 100000 --target-ms 1500 --json cold.json
+
+Exits non-zero when first_health_s is above --target-ms.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.synthetic import write_csvs
+
+
+# Runs in the child interpreter; argv[1] is a data dir with sku.csv /
+# pricing.csv, or "" for the repo's data
+CHILD = """
+import json, sys, time
+from pathlib import Path
+
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+from fastapi.testclient import TestClient
+
+if sys.argv[1]:
+    from agents.catalogue import CatalogueStore
+    root = Path(sys.argv[1])
+    main.catalogue_store = CatalogueStore(root / "sku.csv", root / "pricing.csv", root / "catalogue.snap")
+
+with TestClient(main.app) as client:
+    ready = time.perf_counter()
+    assert client.get("/health").status_code == 200
+    health_wall = time.time()
+    health = time.perf_counter()
+    status = client.get("/technical/run", params={"fields": "rfp_file"}).status_code
+    technical = time.perf_counter()
+
+print(json.dumps({
+    "import_main_s": imported - started,
+    "startup_s": ready - imported,
+    "health_wall": health_wall,
+    "health_after_import_s": health - started,
+    "first_technical_s": technical - health,
+    "technical_status": status,
+}))
+"""
+
+
+def _slowest_imports(stderr: str, top: int) -> List[Tuple[str, float]]:
+    # python -X importtime prints "self | cumulative | <indent>name" with
+    # children before their parent; keep the direct imports of main
+    children: List[Tuple[str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        if depth == 1:
+            children.append((name.strip(), int(cumulative) / 1e6))
+        elif depth == 0:
+            if name.strip() == "main":
+                return sorted(children, key=lambda kv: -kv[1])[:top]
+            children = []
+    return []
+
+
+def profile(data_dir: str = "", top: int = 10) -> Dict[str, Any]:
+    env = {key: value for key, value in os.environ.items() if key != "GROQ_API_KEY"}
+    env["LLM_PROVIDER"] = "groq"  # the default; constructing it must not need a key
+    spawned = time.time()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD, data_dir],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"cold start failed:\n{proc.stderr[-2000:]}")
+    child = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {
+        "first_health_s": child.pop("health_wall") - spawned,
+        **child,
+        "slowest_imports": _slowest_imports(proc.stderr, top),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skus", type=int, default=0, help="synthetic catalogue size (default: repo data)")
+    parser.add_argument("--runs", type=int, default=3, help="cold starts; the fastest is reported")
+    parser.add_argument("--target-ms", type=float, default=1000.0, help="first /health budget")
+    parser.add_argument("--json", type=Path, help="write the report here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = ""
+        if args.skus:
+            write_csvs(Path(tmp), args.skus)
+            data_dir = tmp
+        report = min((profile(data_dir) for _ in range(args.runs)), key=lambda r: r["first_health_s"])
+
+    for name, value in report.items():
+        if name.endswith("_s"):
+            print(f"  {name:24s} {value * 1000:10.2f} ms")
+    print("  slowest imports of main:")
+    for name, seconds in report["slowest_imports"]:
+        print(f"    {name:30s} {seconds * 1000:8.2f} ms")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if report["first_health_s"] * 1000 > args.target_ms:
+        print(f"first /health took {report['first_health_s'] * 1000:.0f} ms (target {args.target_ms:.0f} ms)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Offline benchmark suite (no network, no Groq key).
+
+For each catalogue size it generates sku.csv / pricing.csv and RFPs with
+N scope lines, then measures:
+- catalogue load (CSV parse and binary snapshot)
+- TechnicalAgent.match_specs (index, batched/columnar, retrieval, and
+  with a warm cross-RFP match cache)
+- sharded exact matching over 1, 2, 4, ... shard processes (--shards)
+- PricingAgent.price_from_technical_result
+- /rfp/full-run through the ASGI app: sequential latency (cold and warm
+  caches) and concurrent throughput, with the LLM replaced by a stub provider
+
+Usage (from backend/):
+    python -m benchmarks.run_suite --skus 1000,100000 --lines 10,1000
+    python -m benchmarks.run_suite --json results.json
+    python -m benchmarks.run_suite --skus 1000000 --lines 1000 --shards 1,2,4,8
+    python -m benchmarks.run_suite --baseline results.json --max-slowdown 1.5
+
+With --baseline, exits non-zero when any metric is slower than
+max-slowdown x its baseline value (a scaling regression).
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+from agents.catalogue import CatalogueStore
+from agents.match_cache import MatchCache
+from agents.oumi_judge_agent import default_judge_memo
+from agents.pricing_agent import PricingAgent
+from agents.run_history import RunHistory
+from agents.sharded import ShardedMatcher
+from agents.snapshot import build_snapshot
+from agents.stage_store import default_stage_store
+from agents.summary_cache import SummaryCache
+from agents.technical_agent import TechnicalAgent
+from benchmarks.stub_llm import stub_llm
+from benchmarks.synthetic import synthetic_rfp, write_csvs, write_rfps
+
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    """
+    Fastest of `repeat` runs, in seconds (least affected by noise).
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def bench_catalogue(root: Path, skus: int, repeat: int) -> Dict[str, float]:
+    sku_csv, pricing_csv = write_csvs(root, skus)
+    snapshot_path = root / "catalogue.snap"
+    tiers_path = root / "volume_tiers.csv"
+
+    def load_csv():
+        CatalogueStore(sku_csv, pricing_csv, root / "missing.snap", tiers_path).reload()
+
+    csv_seconds = best_of(repeat, load_csv)
+    build_snapshot(sku_csv, pricing_csv, snapshot_path)
+
+    def load_snapshot():
+        CatalogueStore(sku_csv, pricing_csv, snapshot_path, tiers_path).reload()
+
+    return {
+        "catalogue_load_csv_s": csv_seconds,
+        "catalogue_load_snapshot_s": best_of(repeat, load_snapshot),
+    }
+
+
+def bench_agents(root: Path, lines: int, repeat: int) -> Dict[str, float]:
+    catalogue = CatalogueStore(
+        root / "sku.csv", root / "pricing.csv", root / "catalogue.snap", root / "volume_tiers.csv"
+    ).reload()
+    # uncached agents measure the matchers; the cached one the warm path
+    technical_agent = TechnicalAgent(catalogue, use_cache=False)
+    retrieval_agent = TechnicalAgent(catalogue, retrieval=True, use_cache=False)
+    cached_agent = TechnicalAgent(catalogue, match_cache=MatchCache())
+    pricing_agent = PricingAgent(catalogue)
+    text = synthetic_rfp(lines, seed=lines)
+
+    technical_result = technical_agent.match_specs(text)
+    return {
+        "match_specs_s": best_of(repeat, lambda: technical_agent.match_specs(text)),
+        "match_specs_batched_s": best_of(repeat, lambda: technical_agent.match_specs(text, batched=True)),
+        "match_specs_retrieval_s": best_of(repeat, lambda: retrieval_agent.match_specs(text)),
+        "match_specs_cached_s": best_of(repeat, lambda: cached_agent.match_specs(text)),
+        "price_from_technical_s": best_of(
+            repeat, lambda: pricing_agent.price_from_technical_result(technical_result)
+        ),
+    }
+
+
+def bench_sharded(root: Path, lines: int, repeat: int, shards: List[int]) -> Dict[str, float]:
+    store = CatalogueStore(
+        root / "sku.csv", root / "pricing.csv", root / "catalogue.snap", root / "volume_tiers.csv"
+    )
+    catalogue = store.reload()
+    snapshot_path = store.snapshot_path if store.source == "snapshot" else None
+    text = synthetic_rfp(lines, seed=lines)
+    results = {}
+    for count in shards:
+        matcher = ShardedMatcher(catalogue.skus, count, snapshot_path)
+        try:
+            agent = TechnicalAgent(catalogue, use_cache=False, sharded=matcher)
+            agent.match_specs(text)  # workers build their shard on first use
+            results[f"match_specs_sharded_{count}_s"] = best_of(repeat, lambda: agent.match_specs(text))
+        finally:
+            matcher.shutdown()
+    return results
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def bench_full_run(root: Path, lines: int, requests: int, concurrency: int, llm_latency_s: float) -> Dict[str, float]:
+    """
+    /rfp/full-run against an isolated data dir, through the ASGI app.
+    """
+    import httpx
+    from fastapi.testclient import TestClient
+
+    import main
+
+    # fresh project dir per case: data/rfps holds one RFP of this size
+    data_root = root / f"project_{lines}"
+    write_rfps(data_root / "data" / "rfps", count=1, lines=lines)
+    summary_cache = SummaryCache(path=data_root / "cache" / "llm_cache.sqlite")
+    match_cache = MatchCache()
+    store = CatalogueStore(
+        root / "sku.csv", root / "pricing.csv", root / "catalogue.snap", root / "volume_tiers.csv"
+    )
+
+    # runs are recorded as in production, into a throwaway history
+    run_history = RunHistory(path=root / "run_history.sqlite")
+
+    # warm agents hold the summary cache they were built with
+    main.reset_agents()
+
+    def reset_caches():
+        summary_cache.clear()
+        match_cache.clear()
+        default_judge_memo().clear()
+        default_stage_store().clear()
+
+    results: Dict[str, float] = {}
+    with stub_llm(llm_latency_s), \
+            mock.patch("agents.sales_agent.SalesAgent._project_root", lambda self: data_root), \
+            mock.patch("agents.sales_agent.default_summary_cache", lambda: summary_cache), \
+            mock.patch("agents.technical_agent.default_match_cache", lambda: match_cache), \
+            mock.patch.object(main, "catalogue_store", store), \
+            mock.patch.object(main, "default_run_history", lambda: run_history):
+        with TestClient(main.app) as client:
+            for mode, params in (("cold", {"incremental": "false"}), ("warm", {"incremental": "true"})):
+                latencies = []
+                for _ in range(requests):
+                    if mode == "cold":
+                        reset_caches()
+                    started = time.perf_counter()
+                    response = client.get("/rfp/full-run", params=params)
+                    latencies.append(time.perf_counter() - started)
+                    assert response.status_code == 200, response.text
+                results[f"full_run_{mode}_p50_s"] = statistics.median(latencies)
+                results[f"full_run_{mode}_p95_s"] = _percentile(latencies, 95)
+
+        async def concurrent() -> float:
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                started = time.perf_counter()
+                responses = await asyncio.gather(*(
+                    client.get("/rfp/full-run", params={"incremental": "false"})
+                    for _ in range(concurrency)
+                ))
+                seconds = time.perf_counter() - started
+            assert all(r.status_code == 200 for r in responses)
+            return seconds
+
+        reset_caches()
+        seconds = asyncio.run(concurrent())
+        # throughput is reported as time per request so every metric is "lower is better"
+        results["full_run_concurrent_s_per_req"] = seconds / concurrency
+
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], max_slowdown: float) -> List[str]:
+    regressions = []
+    for case, metrics in results.items():
+        for name, value in metrics.items():
+            before = baseline.get(case, {}).get(name)
+            if before and value > before * max_slowdown:
+                regressions.append(f"{case} {name}: {before * 1000:.2f} ms -> {value * 1000:.2f} ms")
+    return regressions
+
+
+def _int_list(text: str) -> List[int]:
+    return [int(part) for part in text.split(",") if part]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skus", type=_int_list, default=[1_000, 100_000], help="catalogue sizes, e.g. 1000,1000000")
+    parser.add_argument("--lines", type=_int_list, default=[10, 1_000], help="scope lines per RFP")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=10, help="sequential /rfp/full-run calls")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent /rfp/full-run calls")
+    parser.add_argument("--shards", type=_int_list, default=[], help="shard process counts, e.g. 1,2,4,8")
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0, help="stub Groq latency")
+    parser.add_argument("--json", type=Path, help="write results here")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=1.5)
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    for skus in args.skus:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            results[f"skus={skus}"] = bench_catalogue(root, skus, args.repeat)
+            for lines in args.lines:
+                case = f"skus={skus},lines={lines}"
+                results[case] = bench_agents(root, lines, args.repeat)
+                if args.shards:
+                    results[case].update(bench_sharded(root, lines, args.repeat, args.shards))
+                results[case].update(bench_full_run(
+                    root, lines, args.requests, args.concurrency, args.llm_latency_ms / 1000
+                ))
+
+    for case, metrics in results.items():
+        print(case)
+        for name, value in metrics.items():
+            print(f"  {name:32s} {value * 1000:10.2f} ms")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.max_slowdown)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Deterministic, offline LLM for the benchmarks.
+
+Installs a ReplayProvider (agents.llm) as the process-wide provider. It
+answers with the JSON the Sales Agent prompt asks for, built from the RFP
+header in the prompt (no network, no API key). latency_s simulates the
+remote call. Pass a recording (LLM_RECORD_PATH output) to replay real
+Groq answers where available.
+"""
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from agents import llm
+from agents.llm import ReplayProvider
+from agents.rfp_header import read_header_fields
+
+
+def stub_answer(model: str, messages: List[Dict[str, str]]) -> str:
+    prompt = "\n".join(m.get("content", "") for m in messages)
+    header = read_header_fields(prompt.splitlines(), max_lines=200)
+    return json.dumps({
+        "rfp_id": header.get("rfp_id") or "UNKNOWN",
+        "title": header.get("title") or "UNKNOWN",
+        "due_date": header.get("due_date") or "UNKNOWN",
+        "scope_summary": f"Supply of cables ({prompt.count(' core ')} scope lines).",
+    })
+
+
+@contextmanager
+def stub_llm(latency_s: float = 0.0, recording: Optional[Path] = None) -> Iterator[ReplayProvider]:
+    """
+    Use the stub as the default provider for the duration of the block.
+    """
+    provider = ReplayProvider(recording, fallback=stub_answer, latency_s=latency_s)
+    previous = llm._default_provider
+    llm.set_default_provider(provider)
+    try:
+        yield provider
+    finally:
+        llm.set_default_provider(previous)
@@ -0,0 +1,94 @@
+"""
+Synthetic inputs for the benchmarks: SKU catalogues, pricing tables
+and RFP documents of any size, deterministic for a given seed.
+"""
+import csv
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Tuple
+
+from agents.technical_agent import SKU
+
+
+CORES = [1, 2, 3, 4, 5, 7, 12, 19, 24]
+AREAS = ["0.75", "1.0", "1.5", "2.5", "4.0", "6", "10", "16", "25", "35"]
+INSULATIONS = ["XLPE", "PVC", "EPR", "LSZH"]
+MATERIALS = ["Copper", "Aluminium"]
+VOLTAGES = ["1kV", "1.1kV", "3.3kV", "11kV"]
+QUANTITY_UNITS = ["m", "metres", "km", "drums", "nos"]
+
+
+def synthetic_skus(n: int, seed: int = 42) -> List[SKU]:
+    rng = random.Random(seed)
+    return [
+        SKU(
+            sku_id=f"CAB-{i:07d}",
+            cores=str(rng.choice(CORES)),
+            area_sqmm=rng.choice(AREAS),
+            insulation=rng.choice(INSULATIONS),
+            material=rng.choice(MATERIALS),
+            voltage=rng.choice(VOLTAGES),
+        )
+        for i in range(n)
+    ]
+
+
+def write_csvs(directory: Path, n: int, seed: int = 42) -> Tuple[Path, Path]:
+    """
+    Write sku.csv + pricing.csv with n SKUs into directory.
+    """
+    sku_csv = directory / "sku.csv"
+    pricing_csv = directory / "pricing.csv"
+    skus = synthetic_skus(n, seed)
+    with open(sku_csv, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["sku_id", "cores", "area_sqmm", "insulation", "material", "voltage"])
+        for s in skus:
+            writer.writerow([s.sku_id, s.cores, s.area_sqmm, s.insulation, s.material, s.voltage])
+    with open(pricing_csv, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["sku_id", "base_material_cost", "testing_cost", "currency"])
+        for i, s in enumerate(skus):
+            writer.writerow([s.sku_id, 500 + i % 2000, 50 + i % 300, "INR"])
+    return sku_csv, pricing_csv
+
+
+def synthetic_scope_line(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(CORES)} core {rng.choice(AREAS)} sqmm {rng.choice(MATERIALS).lower()} "
+        f"{rng.choice(INSULATIONS)} insulated cable rated for {rng.choice(VOLTAGES)}"
+        f" - {rng.randint(1, 5000)} {rng.choice(QUANTITY_UNITS)}"
+    )
+
+
+def synthetic_rfp(lines: int, seed: int = 0, rfp_id: str = "") -> str:
+    """
+    An RFP in the data/rfps layout (header, "Scope of Supply:", bullet
+    lines, testing section) with the given number of scope lines.
+    """
+    rng = random.Random(seed)
+    due = date(2026, 1, 1) + timedelta(days=rng.randint(0, 365))
+    scope = "\n".join(f"- {synthetic_scope_line(rng)}" for _ in range(lines))
+    return (
+        f"RFP ID: {rfp_id or f'SYN-{seed:04d}'}\n"
+        f"Title: Synthetic cable tender {seed}\n"
+        f"Due Date: {due.strftime('%d-%b-%Y')}\n"
+        "\n"
+        "Scope of Supply:\n"
+        f"{scope}\n"
+        "\n"
+        "Testing Requirements:\n"
+        "- High voltage insulation test\n"
+        "- Conductor resistance test\n"
+    )
+
+
+def write_rfps(directory: Path, count: int, lines: int) -> List[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = directory / f"rfp_syn_{i:04d}.txt"
+        path.write_text(synthetic_rfp(lines, seed=i), encoding="utf-8")
+        paths.append(path)
+    return paths
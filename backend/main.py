@@ -1,14 +1,152 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 
-from agents.sales_agent import SalesAgent
-from agents.technical_agent import TechnicalAgent
-from agents.pricing_agent import PricingAgent
-from agents.oumi_judge_agent import OumiJudgeAgent
+# Agent modules (NumPy, the catalogue code, the Groq SDK) are imported on
+# first use, not here: see the warm_*_agent helpers and CatalogueStore._load
+from agents.oumi_judge_agent import OumiJudgeAgent, judge_memo_stats
+from agents.llm import default_provider, load_env
+from agents.catalogue import Catalogue, CatalogueStore
+from agents.orchestrator import StageError, run_full_pipeline, stream_full_pipeline
+from agents.batch import BatchRunner
+from agents.jobs import JobQueue, JobQueueFull
+from agents.stage_store import default_stage_store
+from agents.run_history import DEFAULT_GO_THRESHOLD, default_run_history
+from agents.sharded import ShardedMatcher, default_sharded_matcher, shutdown_default_sharded_matcher
+from agents.payload import compact_result, dumps, encode_body, project_fields
+from agents.summary_cache import default_summary_cache
+from agents.tracing import HTTP_SECONDS, REGISTRY, current_trace, span, start_trace
 
 
+# .env before any os.getenv below
+load_env()
 
-app = FastAPI(title="Asian Paints RFP Agentic Backend")
+# One SKU/pricing catalogue per process, shared by every request
+catalogue_store = CatalogueStore()
+
+# Process pool + LLM semaphore for /rfp/batch-run (pool starts on first use)
+batch_runner = BatchRunner()
+
+# Background /rfp/jobs runs: bounded worker pool + bounded queue
+job_queue = JobQueue()
+
+
+def preload_catalogue() -> None:
+    try:
+        catalogue_store.reload()
+    except Exception as e:
+        # not fatal: get_catalogue() retries (and reports) on the next request
+        print(f"[startup] catalogue load failed: {e}", flush=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Parse the CSVs once, in the background: /health answers at once
+    # (scale-to-zero cold starts) and the first request that needs the
+    # catalogue waits for it. A no-op in serve.py workers: the parent
+    # loaded it before forking
+    loading = asyncio.ensure_future(asyncio.to_thread(preload_catalogue))
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    await loading
+    batch_runner.shutdown()
+    shutdown_default_sharded_matcher()
+    default_run_history().close()
+
+
+# Warm agents: built on first use and reused by every request in this
+# worker process; catalogue-bound agents are rebuilt when the version changes
+_agents: Dict[Tuple[str, str], Any] = {}
+_agents_lock = threading.Lock()
+
+
+def warm_agent(name: str, factory: Callable[[], Any], version: str = "") -> Any:
+    with _agents_lock:
+        agent = _agents.get((name, version))
+        if agent is None:
+            # drop the one built for an older catalogue
+            for stale in [key for key in _agents if key[0] == name]:
+                del _agents[stale]
+            agent = _agents[(name, version)] = factory()
+        return agent
+
+
+def reset_agents() -> None:
+    with _agents_lock:
+        _agents.clear()
+
+
+def warm_sales_agent() -> Any:
+    from agents.sales_agent import SalesAgent
+
+    return warm_agent("sales", SalesAgent)
+
+
+def warm_technical_agent(catalogue: Catalogue, retrieval: bool = False) -> Any:
+    from agents.technical_agent import TechnicalAgent
+
+    return warm_agent(
+        f"technical:retrieval={retrieval}",
+        lambda: TechnicalAgent(
+            catalogue, retrieval=retrieval, sharded=None if retrieval else sharded_matcher(catalogue)
+        ),
+        catalogue.version,
+    )
+
+
+def warm_pricing_agent(catalogue: Catalogue) -> Any:
+    from agents.pricing_agent import PricingAgent
+
+    return warm_agent("pricing", lambda: PricingAgent(catalogue), catalogue.version)
+
+
+def warm_judge_agent() -> Any:
+    return warm_agent("oumi_judge", OumiJudgeAgent)
+
+
+# MATCH_SHARDS=N (> 1) splits exact matching over N shard processes
+MATCH_SHARDS = int(os.getenv("MATCH_SHARDS", "1"))
+
+
+def sharded_matcher(catalogue: Catalogue) -> Optional[ShardedMatcher]:
+    if MATCH_SHARDS <= 1:
+        return None
+    # shard workers map the snapshot file when the catalogue came from it
+    snapshot_path = catalogue_store.snapshot_path if catalogue_store.source == "snapshot" else None
+    return default_sharded_matcher(catalogue, MATCH_SHARDS, snapshot_path)
+
+
+def get_catalogue() -> Catalogue:
+    """
+    Current catalogue snapshot; reloaded if sku.csv / pricing.csv changed.
+    """
+    return catalogue_store.get()
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when installed (agents.payload.dumps).
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+app = FastAPI(
+    title="Asian Paints RFP Agentic Backend",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 origins = [
     "http://localhost:3000",
@@ -25,49 +163,187 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def trace_requests(request, call_next):
+    """
+    One Trace per request: agent spans (see agents/tracing.py) are collected
+    into it, and the total lands in the Server-Timing header.
+    """
+    with start_trace() as trace:
+        response = await call_next(request)
+        # label by route template, not raw path (keeps /metrics cardinality bounded)
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        response.headers["Server-Timing"] = f"total;dur={trace.summary()['total_ms']}"
+
+    # observed once the body is sent: streaming routes (/rfp/full-run/stream,
+    # /rfp/batch-run) return their headers long before they finish
+    body = response.body_iterator
+
+    async def observed_body():
+        try:
+            async for chunk in body:
+                yield chunk
+        finally:
+            HTTP_SECONDS.observe(time.perf_counter() - trace.started, route)
+
+    response.body_iterator = observed_body()
+    return response
+
+
+def with_timings(result, timings: bool):
+    """
+    Attach the current request's per-stage timings when asked for.
+    """
+    trace = current_trace()
+    if timings and trace is not None:
+        result["timings"] = trace.summary()
+    return result
+
+
+def shaped_response(request: Request, result, fields: Optional[str], compact: bool) -> Response:
+    """
+    Large results: optional compact SKU table and field projection, fast
+    serializer, brotli/gzip when the client accepts it.
+    """
+    if compact:
+        result = compact_result(result)
+    result = project_fields(result, fields)
+    with span("serialize"):
+        body, encoding = encode_body(dumps(result), request.headers.get("accept-encoding", ""))
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
+
+
+FIELDS_QUERY = Query(
+    None, description="Comma-separated dotted paths to keep, e.g. pricing.grand_total,sales_summary"
+)
+COMPACT_QUERY = Query(False, description="Refer to SKUs by id with one deduplicated 'skus' table")
+
+
+def _cache_hit_rates():
+    from agents.match_cache import default_match_cache
+
+    return {
+        ("summaries",): default_summary_cache().stats()["hit_rate"],
+        ("judge_scores",): judge_memo_stats()["hit_rate"],
+        ("stages",): default_stage_store().stats()["hit_rate"],
+        ("matches",): default_match_cache().stats()["hit_rate"],
+    }
+
+
+REGISTRY.gauge_callback("rfp_cache_hit_rate", "Hit rate per result cache.", _cache_hit_rates, ("cache",))
+
+
 
 @app.get("/health")
 def health_check():
-    return {"status": "ok"}
+    # never waits for the catalogue; "ready" turns true once it is loaded
+    return {"status": "ok", "ready": catalogue_store.loaded}
+
+
+@app.get("/catalogue/status")
+def catalogue_status():
+    """
+    Catalogue version, row counts and load time.
+    """
+    return catalogue_store.stats()
+
+
+@app.get("/rfps")
+def list_rfps(limit: int = Query(50, ge=1, le=10_000, description="Max entries")):
+    """
+    Indexed RFPs, most urgent first: path, size, content hash, RFP ID,
+    title and due date (read from the header, no LLM).
+    """
+    try:
+        with span("agent_init"):
+            sales_agent = warm_sales_agent()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to initialize SalesAgent: {e}")
+
+    index = sales_agent.rfp_index()
+    return {
+        "rfps": [entry.__dict__ for entry in index.ordered(limit=limit)],
+        "index": index.stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Prometheus text exposition: stage latency histograms, stage errors,
+    LLM calls/tokens and cache hit rates.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    """
+    Hit/miss counters for the LLM summary cache, the judge memo, the
+    incremental stage store and the cross-RFP match cache, plus LLM provider call/retry/coalesce counts.
+    """
+    from agents.match_cache import default_match_cache
+
+    return {
+        "summaries": default_summary_cache().stats(),
+        "judge_scores": judge_memo_stats(),
+        "stages": default_stage_store().stats(),
+        "matches": default_match_cache().stats(),
+        "llm": default_provider().stats(),
+        "run_history": default_run_history().stats(),
+    }
 
 
 @app.get("/sales/run")
-def sales_run():
+async def sales_run(timings: bool = Query(False, description="Include a per-stage timings block")):
     """
     Run the Sales Agent on the first available RFP file.
     """
     try:
-        sales_agent = SalesAgent()
+        with span("agent_init"):
+            sales_agent = warm_sales_agent()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to initialize SalesAgent: {e}")
 
-    rfps = sales_agent.list_available_rfps()
+    # the RFP index refresh scans and hashes data/rfps: keep it off the loop
+    rfps = await asyncio.to_thread(sales_agent.list_available_rfps)
     if not rfps:
         raise HTTPException(status_code=404, detail="No RFP files found in data/rfps")
 
     rfp_file = rfps[0]
 
     try:
-        info = sales_agent.summarize_rfp(rfp_file)
+        info = await sales_agent.asummarize_rfp(rfp_file)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error summarizing RFP: {e}")
 
-    return {
+    return with_timings({
         "rfp_id": info.rfp_id,
         "title": info.title,
         "due_date": info.due_date,
         "scope_summary": info.scope_summary,
         "file_path": info.file_path,
-    }
+    }, timings)
 
 @app.get("/technical/run")
-def technical_run():
+def technical_run(
+    request: Request,
+    retrieval: bool = Query(False, description="Match via TF-IDF/char-n-gram retrieval + attribute re-rank"),
+    timings: bool = Query(False, description="Include a per-stage timings block"),
+    fields: Optional[str] = FIELDS_QUERY,
+    compact: bool = COMPACT_QUERY,
+    catalogue: Catalogue = Depends(get_catalogue),
+):
     """
     Run the Technical Agent on the first available RFP file.
     """
     try:
-        sales_agent = SalesAgent()
-        technical_agent = TechnicalAgent()
+        with span("agent_init"):
+            sales_agent = warm_sales_agent()
+            technical_agent = warm_technical_agent(catalogue, retrieval)
     except Exception as e:
         # This catches issues like missing sku.csv etc. during init
         raise HTTPException(status_code=500, detail=f"Failed to initialize agents: {e}")
@@ -79,16 +355,11 @@ def technical_run():
 
     rfp_file = rfps[0]
 
-    # Read RFP text
+    # Run TechnicalAgent (streams the RFP file line by line)
     try:
-        with open(rfp_file, "r", encoding="utf-8") as f:
-            rfp_text = f.read()
-    except Exception as e:
+        result = technical_agent.match_specs_file(rfp_file)
+    except OSError as e:
         raise HTTPException(status_code=500, detail=f"Error reading RFP file: {e}")
-
-    # Run TechnicalAgent
-    try:
-        result = technical_agent.match_specs(rfp_text)
     except Exception as e:
         # Also print stack trace to console for you
         import traceback
@@ -96,18 +367,26 @@ def technical_run():
         raise HTTPException(status_code=500, detail=f"Error in TechnicalAgent.match_specs: {e}")
 
     # Return JSON-serializable result
-    return result
+    return shaped_response(request, with_timings(result, timings), fields, compact)
 
 @app.get("/pricing/run")
-def pricing_run():
+def pricing_run(
+    request: Request,
+    retrieval: bool = Query(False, description="Match via TF-IDF/char-n-gram retrieval + attribute re-rank"),
+    timings: bool = Query(False, description="Include a per-stage timings block"),
+    fields: Optional[str] = FIELDS_QUERY,
+    compact: bool = COMPACT_QUERY,
+    catalogue: Catalogue = Depends(get_catalogue),
+):
     """
     Run Technical Agent + Pricing Agent in sequence on the first RFP.
     """
     # 1) Init agents
     try:
-        sales_agent = SalesAgent()
-        technical_agent = TechnicalAgent()
-        pricing_agent = PricingAgent()
+        with span("agent_init"):
+            sales_agent = warm_sales_agent()
+            technical_agent = warm_technical_agent(catalogue, retrieval)
+            pricing_agent = warm_pricing_agent(catalogue)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to initialize agents: {e}")
 
@@ -117,96 +396,323 @@ def pricing_run():
         raise HTTPException(status_code=404, detail="No RFP files found in data/rfps")
     rfp_file = rfps[0]
 
-    # 3) Read RFP text
+    # 3) Technical matching (streams the RFP file line by line)
     try:
-        with open(rfp_file, "r", encoding="utf-8") as f:
-            rfp_text = f.read()
-    except Exception as e:
+        technical_result = technical_agent.match_specs_file(rfp_file)
+    except OSError as e:
         raise HTTPException(status_code=500, detail=f"Error reading RFP file: {e}")
-
-    # 4) Technical matching
-    try:
-        technical_result = technical_agent.match_specs(rfp_text)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error in TechnicalAgent: {e}")
 
-    # 5) Pricing based on technical result
+    # 4) Pricing based on technical result
     try:
         pricing_result = pricing_agent.price_from_technical_result(technical_result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error in PricingAgent: {e}")
 
-    # 6) Return combined result
-    return {
+    # 5) Return combined result
+    return shaped_response(request, with_timings({
         "rfp_file": rfp_file,
         "technical": technical_result,
         "pricing": pricing_result,
-    }
-@app.get("/rfp/full-run")
-def full_rfp_run():
+    }, timings), fields, compact)
+
+
+def full_run_agents(catalogue: Catalogue, retrieval: bool):
     """
-    Orchestrator endpoint:
-    Runs Sales, Technical, Oumi Judge, and Pricing agents.
+    Init the four agents and pick the RFP (HTTP errors surface here,
+    before any work starts).
     """
     # 1) Init agents
     try:
-        sales_agent = SalesAgent()
-        technical_agent = TechnicalAgent()
-        pricing_agent = PricingAgent()
-        oumi_judge_agent = OumiJudgeAgent()
+        with span("agent_init"):
+            sales_agent = warm_sales_agent()
+            technical_agent = warm_technical_agent(catalogue, retrieval)
+            pricing_agent = warm_pricing_agent(catalogue)
+            oumi_judge_agent = warm_judge_agent()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to initialize agents: {e}")
 
-    # 2) Find RFP file (earliest due handled inside SalesAgent if implemented)
+    # 2) Find RFP file (most urgent first, from the RFP index)
     rfps = sales_agent.list_available_rfps()
     if not rfps:
         raise HTTPException(status_code=404, detail="No RFP files found in data/rfps")
 
     rfp_file = rfps[0]
+    return rfp_file, sales_agent, technical_agent, pricing_agent, oumi_judge_agent
 
-    # 3) Read RFP text
-    try:
-        with open(rfp_file, "r", encoding="utf-8") as f:
-            rfp_text = f.read()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error reading RFP file: {e}")
 
-    # 4) Sales Agent (summary)
-    try:
-        sales_info = sales_agent.summarize_rfp(rfp_file)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error in SalesAgent: {e}")
+def prepare_full_run(catalogue: Catalogue, incremental: bool, retrieval: bool):
+    """
+    Returns the RFP file and a coroutine factory for its full run.
+    Blocking (agent init, RFP index refresh): async callers run it via
+    asyncio.to_thread.
+    """
+    rfp_file, sales_agent, technical_agent, pricing_agent, oumi_judge_agent = full_run_agents(
+        catalogue, retrieval
+    )
+
+    # 3) Async pipeline (stage graph in agents/orchestrator.py)
+    async def run():
+        result = await run_full_pipeline(
+            rfp_file,
+            sales_agent=sales_agent,
+            technical_agent=technical_agent,
+            pricing_agent=pricing_agent,
+            judge_agent=oumi_judge_agent,
+            stage_store=default_stage_store() if incremental else None,
+            # retrieval matches differ from exact ones: keep their stored results apart
+            catalogue_version=f"{catalogue.version}+retrieval" if retrieval else catalogue.version,
+        )
+        # 4) Queue it for the run history (written in the background)
+        result["run_id"] = default_run_history().record(result, catalogue.version)
+        return result
+
+    return rfp_file, run
 
-    # 5) Technical Agent (spec matching)
-    try:
-        technical_result = technical_agent.match_specs(rfp_text)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error in TechnicalAgent: {e}")
 
-    # 6) 🧠 OUMI JUDGE AGENT (Evaluation / Reward Signal)
+@app.get("/rfp/full-run")
+async def full_rfp_run(
+    request: Request,
+    incremental: bool = Query(True, description="Reuse stored stage results for unchanged content"),
+    retrieval: bool = Query(False, description="Match via TF-IDF/char-n-gram retrieval + attribute re-rank"),
+    timings: bool = Query(False, description="Include a per-stage timings block"),
+    fields: Optional[str] = FIELDS_QUERY,
+    compact: bool = COMPACT_QUERY,
+    catalogue: Catalogue = Depends(get_catalogue),
+):
+    """
+    Orchestrator endpoint:
+    Runs Sales, Technical, Oumi Judge, and Pricing agents.
+    Sales summary runs concurrently with technical matching; judge and
+    pricing run concurrently once technical results exist.
+    With incremental=true (default), an amended RFP only recomputes the
+    summary and the scope lines that changed; "reuse" reports per stage.
+    """
+    _, run = await asyncio.to_thread(prepare_full_run, catalogue, incremental, retrieval)
     try:
-        oumi_judgement = oumi_judge_agent.evaluate_technical_output(technical_result)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error in OumiJudgeAgent: {e}")
+        result = await run()
+    except StageError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return shaped_response(request, with_timings(result, timings), fields, compact)
 
-    # 7) Pricing Agent
+
+@app.get("/rfp/full-run/stream")
+async def full_rfp_run_stream(
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="ndjson, or sse for EventSource clients"),
+    retrieval: bool = Query(False, description="Match via TF-IDF/char-n-gram retrieval + attribute re-rank"),
+    catalogue: Catalogue = Depends(get_catalogue),
+):
+    """
+    Same agents as /rfp/full-run, streamed: sales summary, technical
+    matches, judge scores and pricing are sent as events as soon as each
+    piece finishes (see agents.orchestrator.stream_full_pipeline).
+    """
+    rfp_file, sales_agent, technical_agent, pricing_agent, oumi_judge_agent = await asyncio.to_thread(
+        full_run_agents, catalogue, retrieval
+    )
+
+    async def events():
+        async for event in stream_full_pipeline(
+            rfp_file,
+            sales_agent=sales_agent,
+            technical_agent=technical_agent,
+            pricing_agent=pricing_agent,
+            judge_agent=oumi_judge_agent,
+        ):
+            if format == "sse":
+                yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+            else:
+                yield json.dumps(event) + "\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    # no-cache / no proxy buffering, or events arrive all at once at the end
+    return StreamingResponse(
+        events(), media_type=media_type, headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# The /rfp/jobs endpoints are async: the job queue (asyncio.Queue, tasks,
+# events) must only be touched from the event loop, never from the threadpool
+
+@app.post("/rfp/jobs", status_code=202)
+async def submit_rfp_job(
+    incremental: bool = Query(True, description="Reuse stored stage results for unchanged content"),
+    retrieval: bool = Query(False, description="Match via TF-IDF/char-n-gram retrieval + attribute re-rank"),
+    catalogue: Catalogue = Depends(get_catalogue),
+):
+    """
+    Queue a full run (same pipeline as /rfp/full-run) and return its job
+    id at once; poll GET /rfp/jobs/{job_id} for status and result.
+    429 when the queue is full.
+    """
+    rfp_file, run = await asyncio.to_thread(prepare_full_run, catalogue, incremental, retrieval)
     try:
-        pricing_result = pricing_agent.price_from_technical_result(technical_result)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error in PricingAgent: {e}")
+        job = job_queue.submit(run, rfp_file, {"incremental": incremental, "retrieval": retrieval})
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+    return {**job.to_dict(include_result=False), "status_url": f"/rfp/jobs/{job.id}"}
+
 
-    # 8) Final orchestrated response
+@app.get("/rfp/jobs")
+async def list_rfp_jobs():
+    """
+    Known jobs (newest first, without results) and queue counters.
+    """
     return {
-        "rfp_file": rfp_file,
-        "sales_summary": {
-            "rfp_id": sales_info.rfp_id,
-            "title": sales_info.title,
-            "due_date": sales_info.due_date,
-            "scope_summary": sales_info.scope_summary,
-        },
-        "technical": technical_result,
-        "oumi_judgement": oumi_judgement,
-        "pricing": pricing_result,
+        "jobs": [job.to_dict(include_result=False) for job in job_queue.jobs()],
+        "queue": job_queue.stats(),
     }
 
 
+@app.get("/rfp/jobs/{job_id}")
+async def get_rfp_job(
+    request: Request,
+    job_id: str,
+    wait: float = Query(0, ge=0, le=300, description="Long-poll: seconds to wait for the job to finish"),
+    fields: Optional[str] = FIELDS_QUERY,
+    compact: bool = COMPACT_QUERY,
+):
+    """
+    Job status; "result" holds the /rfp/full-run response once succeeded.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    job = await job_queue.wait(job, wait)
+    data = job.to_dict()
+    if data["result"] is not None:
+        # fields/compact apply to the run result, not the job envelope
+        data["result"] = project_fields(compact_result(data["result"]) if compact else data["result"], fields)
+    return shaped_response(request, data, None, False)
+
+
+@app.delete("/rfp/jobs/{job_id}")
+async def cancel_rfp_job(job_id: str):
+    """
+    Cancel a queued or running job (finished jobs are left as they are).
+    """
+    job = job_queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    return job.to_dict(include_result=False)
+
+
+def batch_run_agents(catalogue: Catalogue):
+    """
+    Init the agents of a batch run (matching runs in the batch workers).
+    """
+    try:
+        with span("agent_init"):
+            return warm_sales_agent(), warm_pricing_agent(catalogue), warm_judge_agent()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to initialize agents: {e}")
+
+
+@app.get("/rfp/batch-run")
+async def batch_rfp_run(
+    files: Optional[List[str]] = Query(None, description="RFP file names to include (default: all)"),
+    catalogue: Catalogue = Depends(get_catalogue),
+):
+    """
+    Run the full pipeline on every RFP in data/rfps (or the named subset).
+    Streams NDJSON: one "result"/"error" event per RFP as it finishes,
+    then a "ranking" event ordered by due date.
+    """
+    # a cold build loads the catalogue, the LLM SDK and Oumi: off the loop
+    sales_agent, pricing_agent, oumi_judge_agent = await asyncio.to_thread(batch_run_agents, catalogue)
+
+    rfps = await asyncio.to_thread(sales_agent.list_available_rfps)
+    if files:
+        wanted = set(files)
+        rfps = [p for p in rfps if Path(p).name in wanted]
+    if not rfps:
+        raise HTTPException(status_code=404, detail="No matching RFP files found in data/rfps")
+
+    async def events():
+        async for event in batch_runner.run(
+            rfps,
+            sales_agent=sales_agent,
+            pricing_agent=pricing_agent,
+            judge_agent=oumi_judge_agent,
+            catalogue_version=catalogue.version,
+            catalogue_paths=catalogue_store.paths(),
+        ):
+            if event["event"] == "result":
+                run = {key: value for key, value in event.items() if key != "event"}
+                event["run_id"] = default_run_history().record(run, catalogue.version)
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+THRESHOLD_QUERY = Query(DEFAULT_GO_THRESHOLD, description="GO when grand_total is below this")
+
+
+@app.get("/history/runs")
+def history_runs(
+    rfp_id: Optional[str] = Query(None),
+    sku_id: Optional[str] = Query(None, description="Runs that quoted this SKU as a best match"),
+    min_total: Optional[float] = Query(None),
+    max_total: Optional[float] = Query(None),
+    due_from: Optional[str] = Query(None, description="ISO date"),
+    due_to: Optional[str] = Query(None, description="ISO date"),
+    threshold: float = THRESHOLD_QUERY,
+    limit: int = Query(50, ge=1, le=1000),
+):
+    """
+    Past full runs (newest first) with grand total and GO / NO-GO
+    decision, from the run history; no agents are run.
+    """
+    runs = default_run_history().runs(
+        rfp_id=rfp_id,
+        sku_id=sku_id,
+        min_total=min_total,
+        max_total=max_total,
+        due_from=due_from,
+        due_to=due_to,
+        threshold=threshold,
+        limit=limit,
+    )
+    return {"runs": runs}
+
+
+@app.get("/history/runs/{run_id}")
+def history_run(
+    request: Request,
+    run_id: str,
+    result: bool = Query(True, description="Include the stored /rfp/full-run response"),
+    threshold: float = THRESHOLD_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    compact: bool = COMPACT_QUERY,
+):
+    """
+    One recorded run: summary and decision, plus its full result.
+    """
+    run = default_run_history().get(run_id, threshold)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Unknown run: {run_id}")
+    stored = run.pop("result")
+    if not result:
+        return run
+    stored = json.loads(stored)
+    if compact:
+        stored = compact_result(stored)
+    return shaped_response(request, {**run, "result": project_fields(stored, fields)}, None, False)
+
+
+@app.get("/history/decisions")
+def history_decisions(threshold: float = THRESHOLD_QUERY, limit: int = Query(100, ge=1, le=1000)):
+    """
+    Latest run per RFP with its GO / NO-GO decision, most urgent first.
+    """
+    return {"threshold": threshold, "decisions": default_run_history().decisions(threshold, limit)}
+
+
+@app.get("/history/skus")
+def history_skus(limit: int = Query(20, ge=1, le=1000)):
+    """
+    Most quoted SKUs across all recorded runs, by total value.
+    """
+    return {"skus": default_run_history().top_skus(limit)}
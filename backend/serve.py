@@ -0,0 +1,138 @@
+"""
+Production serve mode: pre-forked uvicorn workers sharing one catalogue.
+
+    python serve.py --workers 4 --host 0.0.0.0 --port 8000
+
+- the parent imports the app and loads the SKU/pricing catalogue once
+  (CSV, or decoded from the snapshot), then forks the workers: they share the
+  catalogue pages copy-on-write instead of each holding a copy
+- gc.freeze() before forking keeps the garbage collector from touching
+  (and so copying) those objects in the workers
+- every worker runs uvicorn on the inherited listening socket; agents are
+  warm per-worker singletons (main.warm_agent)
+- the parent restarts workers that die and forwards SIGTERM/SIGINT
+
+Oumi and the Groq SDK are not imported at startup (only by the first
+call that uses them). On platforms without fork() this falls back to a single process.
+Use `uvicorn main:app --reload` for development.
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
+
+def _listen(host: str, port: int, backlog: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(sock: socket.socket, log_level: str) -> None:
+    import uvicorn
+
+    import main
+
+    # uvicorn installs its own handlers (graceful shutdown on SIGTERM/SIGINT)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    config = uvicorn.Config(main.app, log_level=log_level, lifespan="on")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _spawn(sock: socket.socket, log_level: str) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _run_worker(sock, log_level)
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def serve(host: str, port: int, workers: int, log_level: str, backlog: int = 2048) -> None:
+    import main
+
+    # 1) Load shared state in the parent, before forking
+    started = time.perf_counter()
+    catalogue = main.catalogue_store.reload()
+    # main imports the agents lazily; import them here so workers inherit them
+    import agents.sales_agent  # noqa: F401
+    print(
+        f"[serve] catalogue {catalogue.version} ({len(catalogue.skus)} SKUs) "
+        f"loaded in {time.perf_counter() - started:.2f}s",
+        flush=True,
+    )
+
+    if not hasattr(os, "fork") or workers <= 1:
+        import uvicorn
+        uvicorn.run(main.app, host=host, port=port, log_level=log_level)
+        return
+
+    sock = _listen(host, port, backlog)
+    gc.collect()
+    gc.freeze()
+
+    # 2) Fork the workers and keep them running
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        children[_spawn(sock, log_level)] = time.monotonic()
+    print(f"[serve] {workers} workers on http://{host}:{port}", flush=True)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        started_at = children.pop(pid, None)
+        if started_at is None or stopping:
+            continue
+        print(f"[serve] worker {pid} exited ({os.waitstatus_to_exitcode(status)}), restarting", flush=True)
+        # a worker that dies right after starting would otherwise respawn in a tight loop
+        if time.monotonic() - started_at < 1.0:
+            time.sleep(1.0)
+        children[_spawn(sock, log_level)] = time.monotonic()
+
+    sock.close()
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description="Pre-fork production server")
+    parser.add_argument("--host", default=os.getenv("HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))))
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+    serve(args.host, args.port, args.workers, args.log_level)
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -1,21 +1,12 @@
-import os
-from dotenv import load_dotenv
-from groq import Groq
+from agents.llm import default_provider
 
-# 1) Load variables from .env
-load_dotenv()
+# 1) Shared provider (reads GROQ_API_KEY from .env; LLM_PROVIDER=replay works offline)
+provider = default_provider()
 
-api_key = os.getenv("GROQ_API_KEY")
-if not api_key:
-    raise RuntimeError("GROQ_API_KEY is missing in .env")
-
-# 2) Create Groq client
-client = Groq(api_key=api_key)
-
-# 3) Send a simple test request
-chat_completion = client.chat.completions.create(
-    model="llama-3.3-70b-versatile",  # one of Groq's models
-    messages=[
+# 2) Send a simple test request
+response = provider.complete(
+    "llama-3.3-70b-versatile",  # one of Groq's models
+    [
         {
             "role": "system",
             "content": "You are a helpful assistant."
@@ -27,5 +18,5 @@ chat_completion = client.chat.completions.create(
     ],
 )
 
-# 4) Print the reply
-print(chat_completion.choices[0].message.content)
+# 3) Print the reply
+print(response.content)
@@ -7,20 +7,74 @@ export default function Home() {
   const [data, setData] = useState<any>(null);
   const [error, setError] = useState<string | null>(null);
 
+  // place a chunk of results at its line offset (chunks can arrive out of order)
+  const placeAt = (list: any[] = [], offset: number, chunk: any[]) => {
+    const next = list.slice(); // keeps holes, which map() skips
+    chunk.forEach((item, i) => {
+      next[offset + i] = item;
+    });
+    return next;
+  };
+
+  const applyEvent = (prev: any, ev: any) => {
+    const d = prev ?? {
+      technical: { items: [] },
+      oumi_judgement: { judged_items: [] },
+      pricing: { priced_items: [] },
+    };
+    switch (ev.event) {
+      case "start":
+        return { ...d, rfp_file: ev.rfp_file };
+      case "sales_summary":
+        return { ...d, sales_summary: ev };
+      case "technical":
+        return { ...d, technical: { items: placeAt(d.technical.items, ev.offset, ev.items) } };
+      case "oumi_judge":
+        return {
+          ...d,
+          oumi_judgement: { judged_items: placeAt(d.oumi_judgement.judged_items, ev.offset, ev.judged_items) },
+        };
+      case "pricing":
+        return {
+          ...d,
+          pricing: { ...d.pricing, priced_items: placeAt(d.pricing.priced_items, ev.offset, ev.priced_items) },
+        };
+      case "done":
+        return { ...d, pricing: { ...d.pricing, grand_total: ev.grand_total, currency: ev.currency } };
+      default:
+        return d;
+    }
+  };
+
   const runFullFlow = async () => {
     try {
       setLoading(true);
       setError(null);
+      setData(null);
 
-      const res = await fetch("http://127.0.0.1:8000/rfp/full-run");
-      const json = await res.json();
-
-      if (!res.ok) {
+      // NDJSON stream: each stage renders as soon as it finishes
+      const res = await fetch("http://127.0.0.1:8000/rfp/full-run/stream");
+      if (!res.ok || !res.body) {
+        const json = await res.json().catch(() => null);
         throw new Error(json?.detail || "Request failed");
       }
 
-      console.log("FULL BACKEND RESPONSE:", json); // DEBUG (can remove later)
-      setData(json);
+      const reader = res.body.getReader();
+      const decoder = new TextDecoder();
+      let buffered = "";
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split("\n");
+        buffered = lines.pop() ?? "";
+        for (const line of lines) {
+          if (!line.trim()) continue;
+          const ev = JSON.parse(line);
+          if (ev.event === "error") throw new Error(ev.detail);
+          setData((prev: any) => applyEvent(prev, ev));
+        }
+      }
     } catch (e: any) {
       setError(e.message);
     } finally {
@@ -96,7 +150,7 @@ export default function Home() {
                       RFP Item: <span className="font-normal">{item.rfp_item}</span>
                     </p>
 
-                    {item.top_matches.length === 0 ? (
+                    {(item?.top_matches ?? []).length === 0 ? (
                       <p>No SKU matches found.</p>
                     ) : (
                       <table className="w-full text-sm border">
@@ -172,7 +226,7 @@ export default function Home() {
           
           <section>
             <h2>Oumi Judge Evaluation</h2>
-            {data.oumi_judgement.judged_items.map((j:any, i:number) => (
+            {(data?.oumi_judgement?.judged_items ?? []).map((j:any, i:number) => (
               <p key={i}>
                 {j.rfp_item} → Score: {j.judge_score}
               </p>